@@ -0,0 +1,122 @@
+"""
+Gerador de dados sintéticos realistas para os benchmarks.
+
+- generate_categories: hierarquia de categorias em três níveis (Category), com categorias de
+  nível 3 extras para atingir o tamanho pedido
+- generate_transactions: transações no formato de Transaction.to_dict, com descrições de
+  estabelecimentos, contas e cartões, compras parceladas na fatura (data de efetivação posterior),
+  receitas positivas e despesas negativas e transações futuras não pagas
+
+Os dados dependem apenas da semente, para que execuções diferentes sejam comparáveis.
+"""
+import random
+import uuid
+from datetime import date, timedelta
+from finance_app.core.models.category import Category
+
+# Nível 1 -> nível 2 -> nível 3 -> estabelecimentos usados nas descrições
+TREE = {
+    "Moradia": {
+        "Contas": {"Energia": ("Enel", "Light"), "Água": ("Sabesp",), "Internet": ("Vivo Fibra", "Claro Net")},
+        "Casa": {"Aluguel": ("Aluguel",), "Condomínio": ("Condomínio Ed. Central",)},
+    },
+    "Estilo de Vida": {
+        "Alimentação": {"Mercado": ("Supermercado Pão de Açúcar", "Carrefour", "Assaí Atacadista"),
+                        "Restaurante": ("Outback", "Coco Bambu", "Restaurante Sabor Caseiro"),
+                        "Delivery": ("iFood", "Rappi")},
+        "Lazer": {"Streaming": ("Netflix", "Spotify", "Disney Plus"), "Cinema": ("Cinemark", "UCI")},
+    },
+    "Transporte": {
+        "Carro": {"Combustível": ("Posto Ipiranga", "Posto Shell"), "Manutenção": ("Oficina Auto Center",)},
+        "Aplicativo": {"Corrida": ("Uber *Trip", "99 Pop")},
+    },
+    "Saúde": {
+        "Farmácia": {"Remédios": ("Drogasil", "Droga Raia")},
+        "Plano": {"Mensalidade": ("Unimed",)},
+    },
+    "Renda": {
+        "Fixa": {"Salário": ("Salário",)},
+        "Variável": {"Freelance": ("Pix recebido",)},
+    },
+}
+ACCOUNTS = ("Itaú", "Nubank", "Inter")
+CARDS = ("Nubank Roxinho", "Itaú Platinum")
+# Data de referência: transações efetivadas depois dela ainda não foram pagas
+TODAY = date(2025, 6, 30)
+
+
+def generate_categories(rows: int = 0, seed: int = 42) -> list[Category]:
+    """
+    Gera a hierarquia de categorias de TREE e, se 'rows' for maior, categorias de nível 3 extras
+    distribuídas entre as categorias de nível 2.
+
+    Args:
+        rows (int): Número mínimo de categorias.
+        seed (int): Semente do gerador.
+
+    Returns:
+        list[Category]: Categorias, com os pais antes dos filhos.
+    """
+    rng = random.Random(seed)
+    categories = []
+    parents = []  # Categorias de nível 2
+    for n1, children in TREE.items():
+        root = Category(id=uuid.UUID(int=rng.getrandbits(128), version=4), nome=n1, nivel=1)
+        categories.append(root)
+        for n2, leaves in children.items():
+            parent = Category(id=uuid.UUID(int=rng.getrandbits(128), version=4), nome=n2, nivel=2,
+                              categoria_pai=root.id)
+            categories.append(parent)
+            parents.append(parent)
+            for n3 in leaves:
+                categories.append(Category(id=uuid.UUID(int=rng.getrandbits(128), version=4), nome=n3, nivel=3,
+                                           categoria_pai=parent.id))
+    for i in range(len(categories), rows):
+        parent = parents[rng.randrange(len(parents))]
+        categories.append(Category(id=uuid.UUID(int=rng.getrandbits(128), version=4), nome=f"Subcategoria {i}",
+                                   nivel=3, categoria_pai=parent.id))
+    return categories
+
+
+def generate_transactions(rows: int, seed: int = 42, start: date = date(2021, 1, 1), years: int = 5) -> list[dict]:
+    """
+    Gera transações sintéticas no formato de dicionário (Transaction.to_dict).
+
+    Args:
+        rows (int): Número de transações.
+        seed (int): Semente do gerador.
+        start (date): Primeira data de transação.
+        years (int): Período coberto, em anos.
+
+    Returns:
+        list[dict]: Transações, em ordem aleatória de data (como um ledger com lançamentos retroativos).
+    """
+    rng = random.Random(seed)
+    paths = [(n1, n2, n3, merchants) for n1, children in TREE.items()
+             for n2, leaves in children.items() for n3, merchants in leaves.items()]
+    # Despesas do dia a dia são muito mais frequentes que salários e contas mensais
+    weights = [1 if n1 in ("Renda", "Moradia", "Saúde") else 6 for n1, _, _, _ in paths]
+    days = years * 365
+    records = []
+    for path in rng.choices(paths, weights, k=rows):
+        n1, n2, n3, merchants = path
+        data_transacao = start + timedelta(days=rng.randrange(days))
+        income = n1 == "Renda"
+        cartao = "" if income or rng.random() < 0.6 else CARDS[rng.randrange(len(CARDS))]
+        # Compras no cartão são efetivadas na fatura seguinte
+        data_efetivacao = data_transacao + timedelta(days=rng.randint(5, 35)) if cartao else data_transacao
+        valor = round(rng.lognormvariate(4.5, 1.0), 2)
+        records.append({
+            "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            "descricao": f"{merchants[rng.randrange(len(merchants))]} {rng.randrange(10000):04d}",
+            "data_transacao": data_transacao.isoformat(),
+            "data_efetivacao": data_efetivacao.isoformat(),
+            "valor": valor if income else -valor,
+            "conta": ACCOUNTS[rng.randrange(len(ACCOUNTS))],
+            "cartao": cartao,
+            "categoria_n1": n1,
+            "categoria_n2": n2,
+            "categoria_n3": n3,
+            "pago": data_efetivacao <= TODAY,
+        })
+    return records
@@ -0,0 +1,45 @@
+"""
+Benchmark do ParallelReportExecutor.
+
+Para N transações sintéticas (já convertidas para TransactionFrame), mede o tempo de
+category_report em um único processo e com vários processos, e o tempo gasto no processo
+principal para dividir o frame em fatias. O ganho depende do número de núcleos disponíveis
+(os.cpu_count()); em uma máquina com um único núcleo, não há aceleração a medir.
+
+Uso:
+    python -m benchmarks.parallel_reports --rows 1000000 --workers 2 4 8
+"""
+import argparse
+import os
+from benchmarks.serializer_throughput import best_of
+from benchmarks.transaction_memory import generate
+from finance_app.core.services.parallel_reports import ParallelReportExecutor
+from finance_app.core.services.transaction_frame import TransactionFrame
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Número de transações sintéticas.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, 8], help="Números de processos medidos.")
+    parser.add_argument("--repeat", type=int, default=3, help="Execuções por medida (vale a menor).")
+    args = parser.parse_args()
+
+    frame = TransactionFrame.from_records(generate(args.rows))
+    frame.months()  # Coluna de meses calculada uma única vez, fora das medidas
+    serial = ParallelReportExecutor(max_workers=1)
+    expected = serial.category_report(frame)
+    baseline = best_of(args.repeat, lambda: serial.category_report(frame))
+
+    print(f"{args.rows} transações, {os.cpu_count()} núcleos")
+    print(f"{'processos':>9} {'relatório':>10} {'fatias':>8} {'aceleração':>11}")
+    print(f"{1:>9} {baseline:9.3f}s {'-':>8} {1:10.2f}x")
+    for workers in args.workers:
+        executor = ParallelReportExecutor(max_workers=workers)
+        assert executor.category_report(frame) == expected
+        elapsed = best_of(args.repeat, lambda: executor.category_report(frame))
+        partition = best_of(args.repeat, lambda: executor.partition(frame))
+        print(f"{workers:>9} {elapsed:9.3f}s {partition:7.3f}s {baseline / elapsed:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""
+Benchmark dos caminhos críticos dos repositórios, em todos os backends de armazenamento.
+
+Para cada tamanho de dataset sintético (benchmarks.datasets) e cada backend, mede:
+- bulk_add: add_many de todo o dataset em um repositório vazio
+- add, get_by_id, update, delete: --ops operações individuais sobre registros aleatórios
+- list_by_month (transações) / list_by_parent (categorias): --ops consultas aleatórias
+O throughput é reportado em operações (ou registros, no bulk_add) por segundo.
+
+Cada backend roda em um processo separado: a memória de pico (ru_maxrss) reportada é o quanto o
+processo cresceu desde a abertura do repositório até o fim de cada operação.
+
+Os resultados são gravados em JSON (--output) e podem ser comparados com uma execução anterior
+(--compare), mostrando a razão entre os throughputs.
+
+Uso:
+    python -m benchmarks.repository_suite --rows 1000 100000 1000000
+    python -m benchmarks.repository_suite --rows 100000 --backends json-cache sqlite --compare antes.json
+"""
+import argparse
+import json
+import multiprocessing
+import platform
+import random
+import sys
+import tempfile
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from datetime import datetime
+from benchmarks.datasets import generate_categories, generate_transactions
+from finance_app.core.models.transaction import Transaction
+from finance_app.core.repositories.category_repository import CategoryRepository
+from finance_app.core.repositories.mmap_transaction_repository import MmapTransactionRepository
+from finance_app.core.repositories.partitioned_transaction_repository import PartitionedTransactionRepository
+from finance_app.core.repositories.sqlite_transaction_repository import SQLiteTransactionRepository
+from finance_app.core.repositories.transaction_repository import TransactionRepository
+
+try:
+    import resource
+except ImportError:  # Windows: sem ru_maxrss, a memória de pico não é reportada
+    resource = None
+
+# Nome do backend -> função que abre o repositório dentro de um diretório
+TRANSACTION_BACKENDS = {
+    "json": lambda directory: TransactionRepository(f"{directory}/transaction.json"),
+    "json-cache": lambda directory: TransactionRepository(f"{directory}/transaction.json", cache=True),
+    "json-journal": lambda directory: TransactionRepository(f"{directory}/transaction.json", cache=True,
+                                                            journal=True),
+    "json-journal-nocache": lambda directory: TransactionRepository(f"{directory}/transaction.json", journal=True),
+    "binary-cache": lambda directory: TransactionRepository(f"{directory}/transaction.bin", cache=True,
+                                                            file_format="binary"),
+    "sqlite": lambda directory: SQLiteTransactionRepository(f"{directory}/transaction.db"),
+    "mmap": lambda directory: MmapTransactionRepository(f"{directory}/transaction.bin"),
+    "partitioned": lambda directory: PartitionedTransactionRepository(f"{directory}/transactions"),
+}
+CATEGORY_BACKENDS = {
+    "category-json": lambda directory: CategoryRepository(f"{directory}/category.json"),
+    "category-binary": lambda directory: CategoryRepository(f"{directory}/category.bin", file_format="binary"),
+}
+
+# Dataset do tamanho em execução: gerado uma vez no processo principal e herdado pelos processos filhos
+_DATASET = {}
+
+
+def peak_rss() -> int:
+    """
+    Retorna a memória residente de pico do processo, em bytes (0 se não disponível).
+    """
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reporta em KB; macOS, em bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class Recorder:
+    """
+    Acumula as medidas de um backend.
+    """
+
+    def __init__(self, backend: str, rows: int):
+        self.backend = backend
+        self.rows = rows
+        self.baseline = peak_rss()
+        self.results = []
+
+    def measure(self, operation: str, count: int, function):
+        """
+        Executa e cronometra uma operação ('count' é o número de operações ou registros processados).
+        """
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        self.results.append({
+            "backend": self.backend,
+            "rows": self.rows,
+            "operation": operation,
+            "count": count,
+            "seconds": elapsed,
+            "per_second": count / elapsed if elapsed else None,
+            "peak_rss_mb": (peak_rss() - self.baseline) / 1024 / 1024,
+        })
+
+
+def run_transactions(backend: str, ops: int, seed: int) -> list:
+    """
+    Mede as operações de transações em um backend (executado em um processo próprio).
+    """
+    records = _DATASET["transactions"]
+    rng = random.Random(seed)
+    transactions = Transaction.from_dicts(records)
+    extra = Transaction.from_dicts(generate_transactions(ops, seed=seed + 1))
+    months = sorted({(int(record["data_transacao"][:4]), int(record["data_transacao"][5:7])) for record in records})
+    targets = rng.sample(transactions, min(ops, len(transactions)))
+
+    with tempfile.TemporaryDirectory() as directory:
+        repository = TRANSACTION_BACKENDS[backend](directory)
+        recorder = Recorder(backend, len(records))
+        try:
+            recorder.measure("bulk_add", len(transactions), lambda: repository.add_many(transactions))
+            recorder.measure("add", len(extra), lambda: [repository.add(t) for t in extra])
+            recorder.measure("get_by_id", len(targets), lambda: [repository.get_by_id(t.id) for t in targets])
+            recorder.measure("list_by_month", ops,
+                             lambda: [repository.list_by_month(*rng.choice(months)) for _ in range(ops)])
+            recorder.measure("update", len(targets),
+                             lambda: [repository.update(replace(t, valor=t.valor + 1)) for t in targets])
+            recorder.measure("delete", len(targets), lambda: [repository.delete(t) for t in targets])
+        finally:
+            close = getattr(repository, "close", None)
+            if close is not None:
+                close()
+    return recorder.results
+
+
+def run_categories(backend: str, ops: int, seed: int) -> list:
+    """
+    Mede as operações de categorias em um backend (executado em um processo próprio).
+    """
+    categories = _DATASET["categories"]
+    rng = random.Random(seed)
+    extra = [replace(category, id=uuid.UUID(int=rng.getrandbits(128), version=4)) for category in categories[-ops:]]
+    parents = [category.id for category in categories if category.nivel < 3]
+    # Apenas categorias de nível 3 são removidas (sem filhos)
+    leaves = [category for category in categories if category.nivel == 3]
+    leaves = rng.sample(leaves, min(ops, len(leaves)))
+
+    with tempfile.TemporaryDirectory() as directory:
+        repository = CATEGORY_BACKENDS[backend](directory)
+        recorder = Recorder(backend, len(categories))
+        recorder.measure("bulk_add", len(categories), lambda: repository.add_many(categories))
+        recorder.measure("add", len(extra), lambda: [repository.add(category) for category in extra])
+        recorder.measure("get_by_id", len(leaves), lambda: [repository.get_by_id(c.id) for c in leaves])
+        recorder.measure("list_by_parent", ops,
+                         lambda: [repository.list_by_parent(rng.choice(parents)) for _ in range(ops)])
+        recorder.measure("update", len(leaves),
+                         lambda: [repository.update(replace(c, nome=c.nome + "*")) for c in leaves])
+        recorder.measure("delete", len(leaves), lambda: [repository.delete(c) for c in leaves])
+    return recorder.results
+
+
+def run_isolated(function, *args) -> list:
+    """
+    Executa a função em um processo filho (fork), para isolar a memória de pico de cada backend.
+    Sem fork disponível, executa no próprio processo.
+    """
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return function(*args)
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("fork")) as pool:
+        return pool.submit(function, *args).result()
+
+
+def compare(results: list, previous_path: str):
+    """
+    Mostra a razão entre o throughput atual e o de uma execução anterior (> 1: mais rápido agora).
+    """
+    with open(previous_path, "r", encoding="utf-8") as f:
+        previous = {(r["backend"], r["rows"], r["operation"]): r for r in json.load(f)["results"]}
+    print(f"\nComparação com {previous_path}")
+    for result in results:
+        before = previous.get((result["backend"], result["rows"], result["operation"]))
+        if before and before["per_second"] and result["per_second"]:
+            print(f"{result['backend']:<16} {result['rows']:>9} {result['operation']:<15} "
+                  f"{result['per_second'] / before['per_second']:6.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 100_000, 1_000_000],
+                        help="Tamanhos dos datasets sintéticos.")
+    parser.add_argument("--ops", type=int, default=20, help="Operações individuais por medida.")
+    parser.add_argument("--backends", nargs="+", choices=[*TRANSACTION_BACKENDS, *CATEGORY_BACKENDS],
+                        default=[*TRANSACTION_BACKENDS, *CATEGORY_BACKENDS], help="Backends medidos.")
+    parser.add_argument("--seed", type=int, default=42, help="Semente do gerador de dados.")
+    parser.add_argument("--output", default="benchmark_results.json", help="Arquivo JSON de resultados.")
+    parser.add_argument("--compare", help="Arquivo JSON de uma execução anterior para comparação.")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'backend':<16} {'linhas':>9} {'operação':<15} {'ops/s':>12} {'pico MB':>9}")
+    for rows in args.rows:
+        _DATASET["transactions"] = generate_transactions(rows, seed=args.seed)
+        _DATASET["categories"] = generate_categories(rows, seed=args.seed)
+        for backend in args.backends:
+            function = run_transactions if backend in TRANSACTION_BACKENDS else run_categories
+            for result in run_isolated(function, backend, args.ops, args.seed):
+                results.append(result)
+                print(f"{result['backend']:<16} {result['rows']:>9} {result['operation']:<15} "
+                      f"{result['per_second'] or 0:12.0f} {result['peak_rss_mb']:9.1f}")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "meta": {
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "rows": args.rows,
+                "ops": args.ops,
+                "seed": args.seed,
+            },
+            "results": results,
+        }, f, indent=4)
+    print(f"\nResultados gravados em {args.output}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark de gravação e leitura dos formatos de arquivo dos repositórios.
+
+Para N transações sintéticas, mede em cada formato o tamanho do arquivo e o tempo de
+gravação (dump) e de leitura (load), em registros por segundo e MB por segundo.
+
+Uso:
+    python -m benchmarks.serializer_throughput --rows 100000
+"""
+import argparse
+import io
+import time
+from benchmarks.transaction_memory import generate
+from finance_app.core.repositories.serializers import SERIALIZERS, iter_records, load_records
+
+
+def best_of(repeat: int, function) -> float:
+    """
+    Retorna o menor tempo (em segundos) entre 'repeat' execuções.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000, help="Número de transações sintéticas.")
+    parser.add_argument("--repeat", type=int, default=3, help="Execuções por medida (vale a menor).")
+    args = parser.parse_args()
+
+    records = generate(args.rows)
+    print(f"{args.rows} transações")
+    print(f"{'formato':<12} {'tamanho':>10} {'dump':>16} {'load':>16} {'load em blocos':>16}")
+    for name, serializer in SERIALIZERS.items():
+        buffer = io.BytesIO()
+        serializer.dump(records, buffer)
+        content = buffer.getvalue()
+        assert load_records(content) == records
+
+        dump = best_of(args.repeat, lambda: serializer.dump(records, io.BytesIO()))
+        load = best_of(args.repeat, lambda: load_records(content))
+        stream = best_of(args.repeat, lambda: sum(1 for _ in iter_records(io.BytesIO(content))))
+        size = len(content) / 1024 / 1024
+        print(f"{name:<12} {size:8.1f}MB "
+              + " ".join(f"{args.rows / elapsed / 1000:7.0f}k/s {size / elapsed:5.0f}MB/s"
+                         for elapsed in (dump, load, stream)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark de memória das representações de transação em cargas grandes.
+
+Compara a memória mantida após carregar N transações sintéticas de um texto JSON
+(o arquivo do repositório) e convertê-las para cada representação:
+- dicionários crus (formato de Transaction.to_dict, como vêm do JSON)
+- dataclass com __dict__ por instância, uma cópia de cada texto e data (representação antiga)
+- Transaction (slots) criado com from_dicts (textos internados e datas compartilhadas)
+- TransactionView (tupla com valores crus e conversão sob demanda)
+
+Uso:
+    python -m benchmarks.transaction_memory --rows 100000
+"""
+import argparse
+import gc
+import json
+import random
+import time
+import tracemalloc
+import uuid
+from dataclasses import make_dataclass
+from datetime import date, timedelta
+from finance_app.core.models.transaction import Transaction
+from finance_app.core.models.transaction_view import TransactionView
+
+# Representação antiga: dataclass comum, com __dict__ por instância
+LegacyTransaction = make_dataclass("LegacyTransaction", Transaction.__dataclass_fields__.keys())
+
+ACCOUNTS = ("Itaú", "Nubank", "Inter")
+CATEGORIES = (("Estilo de Vida", "Alimentação", "Mercado"), ("Moradia", "Contas", "Energia"),
+              ("Transporte", "Carro", "Combustível"), ("Renda", "Fixa", "Salário"))
+
+
+def generate(rows: int, seed: int = 42) -> list:
+    """
+    Gera transações sintéticas no formato de dicionário.
+    """
+    rng = random.Random(seed)
+    start = date(2020, 1, 1)
+    records = []
+    for _ in range(rows):
+        day = start + timedelta(days=rng.randrange(5 * 365))
+        n1, n2, n3 = CATEGORIES[rng.randrange(len(CATEGORIES))]
+        records.append({
+            "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            "descricao": f"Compra {rng.randrange(1000)}",
+            "data_transacao": day.isoformat(),
+            "data_efetivacao": day.isoformat(),
+            "valor": round(rng.uniform(-500, 500), 2),
+            "conta": ACCOUNTS[rng.randrange(len(ACCOUNTS))],
+            "cartao": "",
+            "categoria_n1": n1,
+            "categoria_n2": n2,
+            "categoria_n3": n3,
+            "pago": rng.random() < 0.5,
+        })
+    return records
+
+
+def legacy(records: list) -> list:
+    """
+    Representação antiga: um objeto UUID, dois date e uma cópia de cada texto por linha.
+    """
+    return [LegacyTransaction(
+        uuid.UUID(data["id"]), data["descricao"], data["valor"],
+        date.fromisoformat(data["data_transacao"]), date.fromisoformat(data["data_efetivacao"]),
+        data["conta"], data["cartao"], data["categoria_n1"], data["categoria_n2"], data["categoria_n3"],
+        data["pago"]) for data in records]
+
+
+def measure(build, text: str) -> tuple:
+    """
+    Retorna os bytes mantidos após decodificar o JSON e construir a representação
+    (os dicionários intermediários são descartados, exceto quando são a própria representação)
+    e o tempo da construção, medido em uma execução separada, sem o tracemalloc.
+    """
+    gc.collect()
+    tracemalloc.start()
+    result = build(json.loads(text))
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    records = json.loads(text)
+    start = time.perf_counter()
+    result = build(records)
+    elapsed = time.perf_counter() - start
+    del result, records
+    return size, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000, help="Número de transações sintéticas.")
+    args = parser.parse_args()
+
+    text = json.dumps(generate(args.rows))
+
+    results = [
+        ("dicionários (JSON)", measure(list, text)),
+        ("dataclass com __dict__", measure(legacy, text)),
+        ("Transaction.from_dicts", measure(Transaction.from_dicts, text)),
+        ("TransactionView.from_dicts", measure(TransactionView.from_dicts, text)),
+    ]
+    baseline = results[1][1][0]
+    print(f"{args.rows} transações")
+    for name, (size, elapsed) in results:
+        print(f"{name:<28} {size / 1024 / 1024:8.1f} MB  {size / args.rows:6.0f} B/linha  "
+              f"{size / baseline:6.0%} do dataclass  {elapsed * 1000:8.1f} ms para construir")
+
+
+if __name__ == "__main__":
+    main()
@@ -55,6 +55,27 @@ class Category():
             nivel=data["nivel"],
             categoria_pai=uuid.UUID(data["categoria_pai"]) if data["categoria_pai"] else None
         )
+
+
+    @staticmethod
+    def from_trusted_dict(data: dict) -> "Category":
+        """
+        Cria uma instância de Category sem executar a validação de nível e categoria pai.
+        Use apenas para dados já validados (ex: arquivo com carimbo de validação);
+        para dados de origem não confiável, use from_dict.
+
+        Args:
+            data (dict): Dicionário com os campos esperados
+
+        Returns:
+            Category: nova instância populada.
+        """
+        category = object.__new__(Category)
+        category.id = uuid.UUID(data["id"])
+        category.nome = data["nome"]
+        category.nivel = data["nivel"]
+        category.categoria_pai = uuid.UUID(data["categoria_pai"]) if data["categoria_pai"] else None
+        return category
     
 
     def to_dict(self) -> dict:
@@ -1,11 +1,22 @@
 from dataclasses import dataclass
 from datetime import date
+from typing import Callable, Iterable
+import sys
 import uuid
 
-@dataclass
+
+def _intern(value):
+    """
+    Interna textos repetidos entre transações; outros valores (ex: None) são mantidos como estão.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class Transaction:
     """
     Representa uma transação financeira com valor, data, categorias e status de pagamento.
+    Usa __slots__ (sem __dict__ por instância) para reduzir a memória em cargas grandes.
     """
 
     id: uuid.UUID  # Identificador único da transação
@@ -81,12 +92,13 @@ class Transaction:
         }
     
     @staticmethod # Wrapper que basicamente passa o 'self' automaticamente, já que não colocamos o 'self' na função
-    def from_dict(data: dict) -> "Transaction":
+    def from_dict(data: dict, parse_date: Callable[[str], date] = date.fromisoformat) -> "Transaction":
         """
         Cria uma instância de Transaction a partir de um dicionário.
         
         Args:
             data (dict): Dicionário com os campos esperados.
+            parse_date (Callable[[str], date]): Conversão das datas ISO (padrão: date.fromisoformat).
 
         Returns:
             Transaction: nova instância populada.
@@ -94,14 +106,38 @@ class Transaction:
         return Transaction(
             id=uuid.UUID(data["id"]),
             descricao=data["descricao"],
-            data_transacao=date.fromisoformat(data["data_transacao"]),
-            data_efetivacao=date.fromisoformat(data["data_efetivacao"]),
+            data_transacao=parse_date(data["data_transacao"]),
+            data_efetivacao=parse_date(data["data_efetivacao"]),
             valor=data["valor"],
-            conta=data["conta"],
-            cartao=data["cartao"],
-            categoria_n1=data["categoria_n1"],
-            categoria_n2=data["categoria_n2"],
-            categoria_n3=data["categoria_n3"],
+            # Contas, cartões e categorias se repetem muito: internar compartilha uma única cópia
+            conta=_intern(data["conta"]),
+            cartao=_intern(data["cartao"]),
+            categoria_n1=_intern(data["categoria_n1"]),
+            categoria_n2=_intern(data["categoria_n2"]),
+            categoria_n3=_intern(data["categoria_n3"]),
             pago=data["pago"]
         )
 
+    @staticmethod
+    def from_dicts(records: Iterable[dict]) -> list["Transaction"]:
+        """
+        Cria várias transações a partir de dicionários, para cargas em massa.
+        Além de internar os textos repetidos, reaproveita o mesmo objeto date para datas iguais
+        (date é imutável), já que há poucas datas distintas em relação ao número de transações.
+
+        Args:
+            records (Iterable[dict]): Dicionários com os campos esperados.
+
+        Returns:
+            list[Transaction]: Novas instâncias populadas.
+        """
+        dates = {}  # Data ISO -> objeto date compartilhado
+
+        def parse_date(text: str) -> date:
+            parsed = dates.get(text)
+            if parsed is None:
+                parsed = dates[text] = date.fromisoformat(text)
+            return parsed
+
+        return [Transaction.from_dict(data, parse_date) for data in records]
+
@@ -0,0 +1,170 @@
+from datetime import date
+from typing import Iterable
+import uuid
+from finance_app.core.models.transaction import Transaction, _intern
+
+# Ordem dos campos na tupla (a mesma de Transaction.to_dict)
+FIELDS = ("id", "descricao", "data_transacao", "data_efetivacao", "valor", "conta", "cartao",
+          "categoria_n1", "categoria_n2", "categoria_n3", "pago")
+
+
+class TransactionView:
+    """
+    Visão compacta e somente leitura (exceto pelo status de pagamento) de uma transação.
+    Guarda os valores crus do registro (formato de Transaction.to_dict) em uma única tupla, com os
+    textos repetidos internados, e só converte id e datas para UUID/date quando são acessados
+    (uma única vez: o resultado fica guardado na própria visão).
+    Ocupa uma fração da memória de um Transaction ou de um dicionário, útil para cargas com
+    milhões de linhas. A validação de datas só acontece em to_transaction().
+    """
+
+    __slots__ = ("_row", "_id", "_data_transacao", "_data_efetivacao")
+
+    # A visão é mutável (marcar_como_pago): compara por valor, mas não pode ser usada como chave
+    __hash__ = None
+
+    def __init__(self, row: tuple):
+        """
+        Args:
+            row (tuple): Valores crus da transação, na ordem de FIELDS.
+        """
+        self._row = row
+        self._id = None
+        self._data_transacao = None
+        self._data_efetivacao = None
+
+    @staticmethod
+    def from_dict(data: dict) -> "TransactionView":
+        """
+        Cria uma visão a partir de um dicionário no formato de Transaction.to_dict.
+
+        Args:
+            data (dict): Dicionário com os campos esperados.
+
+        Returns:
+            TransactionView: nova visão sobre os valores do dicionário.
+        """
+        return TransactionView((
+            data["id"],
+            data["descricao"],
+            _intern(data["data_transacao"]),
+            _intern(data["data_efetivacao"]),
+            data["valor"],
+            _intern(data["conta"]),
+            _intern(data["cartao"]),
+            _intern(data["categoria_n1"]),
+            _intern(data["categoria_n2"]),
+            _intern(data["categoria_n3"]),
+            data["pago"],
+        ))
+
+    @staticmethod
+    def from_dicts(records: Iterable[dict]) -> list["TransactionView"]:
+        """
+        Cria várias visões a partir de dicionários, para cargas em massa.
+
+        Args:
+            records (Iterable[dict]): Dicionários com os campos esperados.
+
+        Returns:
+            list[TransactionView]: Novas visões, na ordem dos registros.
+        """
+        return list(map(TransactionView.from_dict, records))
+
+    @property
+    def id(self) -> uuid.UUID:
+        if self._id is None:
+            self._id = uuid.UUID(self._row[0])
+        return self._id
+
+    @property
+    def descricao(self) -> str:
+        return self._row[1]
+
+    @property
+    def data_transacao(self) -> date:
+        if self._data_transacao is None:
+            self._data_transacao = date.fromisoformat(self._row[2])
+        return self._data_transacao
+
+    @property
+    def data_efetivacao(self) -> date:
+        if self._data_efetivacao is None:
+            self._data_efetivacao = date.fromisoformat(self._row[3])
+        return self._data_efetivacao
+
+    @property
+    def valor(self) -> float:
+        return self._row[4]
+
+    @property
+    def conta(self) -> str:
+        return self._row[5]
+
+    @property
+    def cartao(self) -> str:
+        return self._row[6]
+
+    @property
+    def categoria_n1(self) -> str:
+        return self._row[7]
+
+    @property
+    def categoria_n2(self) -> str:
+        return self._row[8]
+
+    @property
+    def categoria_n3(self) -> str:
+        return self._row[9]
+
+    @property
+    def pago(self) -> bool:
+        return self._row[10]
+
+    @property
+    def tipo(self) -> str:
+        """
+        Retorna o tipo da transação com base no valor (receita, despesa ou neutro).
+        """
+        valor = self._row[4]
+        if valor > 0:
+            return "receita"
+        elif valor < 0:
+            return "despesa"
+        return "neutro"
+
+    def marcar_como_pago(self):
+        """
+        Marca a transação como paga.
+        """
+        self._row = self._row[:10] + (True,)
+
+    def to_dict(self) -> dict:
+        """
+        Converte a visão para o mesmo dicionário serializável de Transaction.to_dict.
+        """
+        return dict(zip(FIELDS, self._row))
+
+    def to_transaction(self) -> Transaction:
+        """
+        Materializa a visão em um Transaction completo (com validação das datas).
+        """
+        return Transaction.from_dict(self.to_dict())
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, TransactionView):
+            return NotImplemented
+        return self._row == other._row
+
+    def __str__(self) -> str:
+        """
+        Retorna uma representação amigável da transação, no mesmo formato de Transaction.
+        """
+        return f"[{self.descricao}] - R$ {self.valor:.2f} em {self.data_transacao.strftime('%d/%m/%Y')} (pago: {self.pago})"
+
+    def __repr__(self) -> str:
+        """
+        Retorna uma representação técnica da visão, útil para debugging.
+        """
+        return (f"TransactionView(id={self._row[0]}, valor={self.valor}, "
+                f"descricao='{self.descricao}', pago={self.pago})")
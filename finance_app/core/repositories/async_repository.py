@@ -0,0 +1,299 @@
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import date
+from functools import partial
+from uuid import UUID
+from finance_app.core.models.category import Category
+from finance_app.core.models.transaction import Transaction
+from finance_app.core.repositories.category_tree import CategoryTree
+
+
+class _AsyncRepository:
+    """
+    Base dos repositórios assíncronos: executa os métodos de um repositório síncrono em um pool de
+    threads limitado, fora do event loop (leitura de arquivo e decodificação não bloqueiam o loop).
+
+    - Leituras: chamadas concorrentes iguais (mesmo método e argumentos), feitas enquanto nenhuma escrita
+      foi iniciada, compartilham uma única execução em andamento. Listas são copiadas para cada chamador,
+      mas os objetos dentro delas são compartilhados.
+    - Escritas: add/update/delete feitos no mesmo ciclo do event loop (ou dentro de 'batch_delay')
+      são agrupados e gravados com add_many/update_many/delete_many, na ordem de chegada
+      (uma gravação de arquivo por grupo em vez de uma por chamada).
+    """
+
+    _model = None  # Classe das entidades (Transaction ou Category)
+
+    def __init__(self, repository, max_workers: int = 4, batch_delay: float = 0.0,
+                 executor: Executor | None = None):
+        """
+        Args:
+            repository: Repositório síncrono (ex: TransactionRepository).
+            max_workers (int): Número máximo de threads do pool próprio.
+            batch_delay (float): Tempo (em segundos) que uma escrita espera por outras antes da gravação.
+                Com 0, agrupa as escritas feitas no mesmo ciclo do event loop.
+            executor (Executor | None): Pool a ser usado no lugar do pool próprio (não é encerrado em close).
+        """
+        self.repository = repository
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=max_workers,
+                                                        thread_name_prefix=type(self).__name__)
+        self._batch_delay = batch_delay
+        self._inflight = {}  # (geração, método, argumentos) -> Future da leitura em andamento
+        self._generation = 0  # Incrementada a cada gravação: leituras de gerações diferentes não são unidas
+        self._pending = []  # Escritas aguardando gravação: (tipo, item, Future)
+        self._flush_task = None
+        self._write_lock = None  # asyncio.Lock criado no loop em uso (gravações em ordem, uma por vez)
+
+    def close(self):
+        """
+        Encerra o pool de threads próprio, aguardando as tarefas em andamento.
+        """
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    async def _run(self, function, *args):
+        """
+        Executa uma função síncrona no pool de threads.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._executor, partial(function, *args))
+
+    async def _read(self, method: str, *args):
+        """
+        Executa um método de leitura, unindo chamadas concorrentes iguais em uma única execução.
+        """
+        key = (self._generation, method, args)
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._run(getattr(self.repository, method), *args))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # shield: o cancelamento de um chamador não cancela a leitura dos demais
+        result = await asyncio.shield(future)
+        return list(result) if isinstance(result, list) else result
+
+    async def _write(self, kind: str, item):
+        """
+        Enfileira uma escrita e aguarda a gravação do grupo em que ela entrou.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((kind, item, future))
+        if self._flush_task is None:
+            self._flush_task = asyncio.ensure_future(self._flush())
+            self._flush_task.add_done_callback(self._flush_done)
+        return await future
+
+    def _flush_done(self, task: asyncio.Task):
+        """
+        Se a gravação terminou sem retirar as escritas pendentes (cancelada antes disso, inclusive antes
+        de começar), elas recebem CancelledError e a próxima escrita agenda uma nova gravação.
+        """
+        if self._flush_task is task:
+            ops, self._pending, self._flush_task = self._pending, [], None
+            _cancel_waiting(ops)
+
+    async def _flush(self):
+        """
+        Grava as escritas pendentes: aguarda 'batch_delay' para que outras escritas entrem no grupo
+        e grava uma sequência de operações do mesmo tipo por vez, com o método em lote correspondente.
+        Se a gravação for cancelada, as escritas do grupo que ainda aguardam recebem CancelledError.
+        """
+        ops = []  # Escritas retiradas da fila por esta gravação
+        try:
+            await asyncio.sleep(self._batch_delay)
+            if self._write_lock is None:
+                self._write_lock = asyncio.Lock()
+            async with self._write_lock:
+                ops, self._pending, self._flush_task = self._pending, [], None
+                self._generation += 1
+                try:
+                    outcomes = await self._run(self._commit, [(kind, item) for kind, item, _ in ops])
+                except Exception as e:
+                    # Falha da gravação (ex: arquivo corrompido): todas as escritas do grupo falham
+                    outcomes = [e] * len(ops)
+                finally:
+                    self._generation += 1
+                for (_, _, future), outcome in zip(ops, outcomes):
+                    if future.done():
+                        continue
+                    if isinstance(outcome, Exception):
+                        future.set_exception(outcome)
+                    else:
+                        future.set_result(None)
+        finally:
+            _cancel_waiting(ops)
+
+    def _commit(self, ops: list) -> list:
+        """
+        Aplica as escritas no repositório síncrono (executado no pool de threads), agrupando
+        sequências consecutivas do mesmo tipo em uma única chamada em lote.
+
+        Returns:
+            list: Para cada escrita, None (aplicada) ou a exceção que a chamada individual geraria.
+        """
+        outcomes = []
+        start = 0
+        while start < len(ops):
+            kind = ops[start][0]
+            end = start
+            while end < len(ops) and ops[end][0] == kind:
+                end += 1
+            items = [item for _, item in ops[start:end]]
+            try:
+                if kind == "add":
+                    # Um ID repetido no grupo é aplicado na primeira ocorrência e ignorado nas demais
+                    added = set(self.repository.add_many(items).applied)
+                    for item in items:
+                        if item.id in added:
+                            added.discard(item.id)
+                            outcomes.append(None)
+                        else:
+                            outcomes.append(self._add_error(item))
+                elif kind == "update":
+                    skipped = set(self.repository.update_many(items).skipped)
+                    outcomes.extend(self._update_error(item) if item.id in skipped else None for item in items)
+                else:
+                    # Um ID repetido no grupo é ignorado no lote, mas já foi removido pela primeira ocorrência
+                    removed = set(self.repository.delete_many(items).applied)
+                    outcomes.extend(None if item.id in removed else self._delete_error(item) for item in items)
+            except Exception as e:
+                outcomes.extend([e] * len(items))
+            start = end
+        return outcomes
+
+    def _add_error(self, item) -> Exception:
+        """
+        Erro de uma adição ignorada pelo add_many por ID já existente.
+        """
+        return ValueError(f"{self._model.__name__} with ID {item.id} already exists.")
+
+    def _update_error(self, item) -> Exception:
+        """
+        Erro gerado pelo update síncrono quando o ID não existe.
+        """
+        return ValueError(f"{self._model.__name__} with ID {item.id} not found.")
+
+    def _delete_error(self, item) -> Exception | None:
+        """
+        Erro gerado pelo delete síncrono quando o ID não existe (None se não há erro).
+        """
+        return None
+
+    async def add(self, item):
+        """
+        Adiciona uma entidade (gravada em grupo com as escritas concorrentes, com add_many).
+
+        Raises:
+            ValueError: Caso o ID já exista (ignorado pelo add_many), como no add dos repositórios
+                com ID único (ex: SQLiteTransactionRepository).
+        """
+        await self._write("add", item)
+
+    async def update(self, item):
+        """
+        Atualiza uma entidade existente (gravada em grupo com as escritas concorrentes).
+
+        Raises:
+            ValueError: Caso o ID não seja encontrado.
+        """
+        await self._write("update", item)
+
+    async def delete(self, item):
+        """
+        Remove uma entidade (gravada em grupo com as escritas concorrentes).
+        """
+        await self._write("delete", item)
+
+    async def get_by_id(self, id: UUID):
+        """
+        Recupera uma entidade pelo ID (None se não encontrada).
+        """
+        return await self._read("get_by_id", id)
+
+    async def list_all(self, *args) -> list:
+        """
+        Lista todas as entidades (ver list_all do repositório síncrono).
+        """
+        return await self._read("list_all", *args)
+
+
+def _cancel_waiting(ops: list):
+    """
+    Conclui com CancelledError as escritas de um grupo que ainda aguardam resultado.
+    """
+    for _, _, future in ops:
+        if not future.done():
+            future.set_exception(asyncio.CancelledError())
+
+
+class AsyncTransactionRepository(_AsyncRepository):
+    """
+    Versão assíncrona de um repositório de transações (ex: TransactionRepository, SQLiteTransactionRepository).
+    """
+
+    _model = Transaction
+
+    async def add_many(self, transactions: list[Transaction]):
+        """
+        Adiciona várias transações em uma única chamada (sem agrupamento adicional).
+        """
+        self._generation += 1
+        try:
+            return await self._run(self.repository.add_many, list(transactions))
+        finally:
+            self._generation += 1
+
+    async def list_transactions(self, trusted: bool = False) -> list:
+        """
+        Lista todas as transações como objetos (ver TransactionRepository.list_transactions).
+        """
+        return await self._read("list_transactions", trusted)
+
+    async def list_by_month(self, year: int, month: int) -> list:
+        """
+        Lista as transações de um mês (ver TransactionRepository.list_by_month).
+        """
+        return await self._read("list_by_month", year, month)
+
+    async def list_by_period(self, start: date, end: date, field: str = "data_transacao") -> list:
+        """
+        Lista as transações de um período (ver TransactionRepository.list_by_period).
+        """
+        return await self._read("list_by_period", start, end, field)
+
+
+class AsyncCategoryRepository(_AsyncRepository):
+    """
+    Versão assíncrona do CategoryRepository.
+    """
+
+    _model = Category
+
+    def _delete_error(self, item) -> Exception:
+        """
+        O delete síncrono de categorias gera erro quando o ID não existe.
+        """
+        return ValueError("Category not found!")
+
+    async def get_tree(self) -> CategoryTree:
+        """
+        Retorna o índice da hierarquia de categorias.
+        """
+        return await self._read("get_tree")
+
+    async def list_by_parent(self, id: UUID) -> list:
+        """
+        Lista as categorias filhas de uma categoria.
+        """
+        return await self._read("list_by_parent", id)
+
+    async def path(self, id: UUID) -> list[Category]:
+        """
+        Retorna o caminho de uma categoria a partir da raiz.
+        """
+        return await self._read("path", id)
+
+    async def descendants(self, id: UUID) -> list[Category]:
+        """
+        Lista todos os descendentes de uma categoria.
+        """
+        return await self._read("descendants", id)
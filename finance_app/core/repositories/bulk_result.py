@@ -0,0 +1,10 @@
+from dataclasses import dataclass, field
+
+@dataclass
+class BulkResult:
+    """
+    Resultado de uma operação em lote (add_many, update_many, delete_many).
+    Os itens são processados na ordem recebida, como se fossem aplicados um a um.
+    """
+    applied: list = field(default_factory=list)  # IDs aplicados, na ordem de entrada
+    skipped: list = field(default_factory=list)  # IDs ignorados (já existentes no add, inexistentes no update/delete)
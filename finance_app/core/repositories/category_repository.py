@@ -1,6 +1,12 @@
-import json
+from typing import Iterable
 from uuid import UUID
 from finance_app.core.models.category import Category
+from finance_app.core.repositories.bulk_result import BulkResult
+from finance_app.core.repositories.category_tree import CategoryTree
+from finance_app.core.repositories.file_storage import FileLock, atomic_open, exclusive, file_signature
+from finance_app.core.repositories.instrumentation import MetricsSink, instrument
+from finance_app.core.repositories.serializers import file_serializer, get_serializer, load_records
+from finance_app.core.repositories.validation_stamp import ValidationStamp
 
 # ---------- Category Repository ----------
 class CategoryRepository:
@@ -9,45 +15,92 @@ class CategoryRepository:
     Responsável por adicionar, remover, buscar e listar objetos Category.
     """
 
-    def __init__(self, filepath="finance_app/data/category.json"):
+    def __init__(self, filepath="finance_app/data/category.json", file_format: str | None = None,
+                 metrics: MetricsSink | None = None):
         """
         Inicializa o repositório com o caminho do arquivo de dados
 
         Args:
             filepath (str): Caminho do arquivo JSON que armazena as categorias
+            file_format (str | None): Formato usado nas gravações: "json" (compacto), "json-indent" ou "binary".
+                Se None (padrão), mantém o formato do arquivo existente ("json" para arquivos novos).
+                Na leitura o formato é detectado automaticamente.
+            metrics (MetricsSink | None): Se informado, mede cada chamada aos métodos públicos
+                (latência, bytes lidos/gravados, registros varridos/retornados). Ver instrumentation.instrument.
         """
         self._filepath = filepath
+        self._serializer = get_serializer(file_format) if file_format is not None else None
+        self._tree = None  # Índice da hierarquia (construído sob demanda)
+        self._tree_signature = None  # Assinatura do arquivo quando o índice foi construído
+        self._lock = FileLock(filepath)  # Serializa leitura-alteração-gravação entre processos
+        self._stamp = ValidationStamp(filepath, (filepath,))
+        self._validated_signature = None  # Assinatura do arquivo quando sua validação foi confirmada
+        self._instrumentation = None  # Instrumentação instalada (ver instrumentation.instrument)
+        if metrics is not None:
+            instrument(self, metrics)
+
+
+    def _count(self, **counters):
+        """
+        Soma contadores (bytes_read, bytes_written, rows_scanned) à chamada instrumentada em andamento.
+        Sem instrumentação, custa apenas a comparação com None.
+        """
+        if self._instrumentation is not None:
+            self._instrumentation.add(**counters)
 
 
     def _load(self) -> list:
         """
-        Carrega e retorna a lista de categorias do arquivo JSON.
+        Carrega e retorna a lista de categorias do arquivo (o formato é detectado automaticamente).
 
         Returns:
             list: Lista de categorias no formato de dicionários.
+
+        Raises:
+            ValueError: Caso o arquivo esteja corrompido.
         """
         try:
-            with open(self._filepath, "r") as f:
-                return json.load(f)
+            with self._lock.shared(), open(self._filepath, "rb") as f:
+                content = f.read()
         except FileNotFoundError:
             # Arquivo ainda não existe: retorna lista vazia.
             return []
-        except json.JSONDecodeError:
-            # Arquivo corrompido ou vazio: trata como lista vazia
+        self._count(bytes_read=len(content))
+        if not content.strip():
+            # Arquivo vazio: trata como lista vazia
             return []
-        
+        try:
+            data = load_records(content)
+        except ValueError as e:
+            raise ValueError(f"Corrupted data file: {self._filepath}") from e
+        self._count(rows_scanned=len(data))
+        return data
+
 
     def _save(self, data: list):
         """
-        Salva a lista de categorias no arquivo JSON.
+        Salva a lista de categorias no arquivo, no formato configurado.
 
         Args:
             data (list): Lista de transações no formato de dicionários.
         """
-        with open(self._filepath, "w") as f:
-            json.dump(data, f, indent=4)
+        # Os registros gravados vêm de objetos Category: se o arquivo era válido, continua válido
+        signature = file_signature(self._filepath)
+        valid = self._validated_signature is not None and self._validated_signature == signature
+        self._validated_signature = None
+        # Grava em arquivo temporário + fsync + rename: uma queda não trunca os dados
+        serializer = self._serializer or file_serializer(self._filepath)
+        with atomic_open(self._filepath, "wb") as f:
+            serializer.dump(data, f)
+            self._count(bytes_written=f.tell())
+        if valid:
+            self._stamp.write(self._stamp.digest())
+            self._validated_signature = file_signature(self._filepath)
+        # Toda alteração passa por aqui: descarta o índice da hierarquia
+        self._tree = None
 
     
+    @exclusive
     def add(self, category: Category):
         """
         Adiciona uma nova categoria ao repositório.
@@ -60,6 +113,37 @@ class CategoryRepository:
         self._save(data)
 
 
+    @exclusive
+    def add_many(self, categories: Iterable[Category]) -> BulkResult:
+        """
+        Adiciona várias categorias com uma única leitura e uma única gravação.
+        Categorias cujo ID já existe no repositório (ou que se repetem no lote) são ignoradas.
+
+        Args:
+            categories (Iterable[Category]): As categorias a serem adicionadas.
+
+        Returns:
+            BulkResult: IDs adicionados (applied) e IDs ignorados por duplicidade (skipped).
+        """
+        data = self._load()
+        known = {item["id"] for item in data}
+        result = BulkResult()
+
+        for category in categories:
+            record_id = str(category.id)
+            if record_id in known:
+                result.skipped.append(category.id)
+                continue
+            known.add(record_id)
+            data.append(category.to_dict())
+            result.applied.append(category.id)
+
+        if result.applied:
+            self._save(data)
+        return result
+
+
+    @exclusive
     def delete(self, category:Category):
         """
         Deleta uma categoria do repositório com base no seu ID.
@@ -77,6 +161,50 @@ class CategoryRepository:
         self._save(new_data)
 
 
+    @exclusive
+    def delete_many(self, items: Iterable[Category | UUID]) -> BulkResult:
+        """
+        Deleta várias categorias com uma única leitura e uma única gravação.
+        Diferente de delete, IDs não encontrados não geram erro: são reportados no resultado.
+
+        Args:
+            items (Iterable[Category | UUID]): As categorias (ou seus IDs) a serem deletadas.
+
+        Returns:
+            BulkResult: IDs deletados (applied) e IDs não encontrados ou repetidos no lote (skipped).
+        """
+        data = self._load()
+        known = {item["id"] for item in data}
+        result = BulkResult()
+        to_delete = set()
+
+        for item in items:
+            item_id = item.id if isinstance(item, Category) else item
+            record_id = str(item_id)
+            if record_id not in known or record_id in to_delete:
+                result.skipped.append(item_id)
+                continue
+            to_delete.add(record_id)
+            result.applied.append(item_id)
+
+        if to_delete:
+            self._save([item for item in data if item["id"] not in to_delete])
+        return result
+
+
+    def descendants(self, id: UUID) -> list[Category]:
+        """
+        Lista todos os descendentes de uma categoria (filhos, netos...), em pré-ordem.
+
+        Args:
+            id (UUID): ID da categoria.
+
+        Returns:
+            list[Category]: Descendentes da categoria (sem incluí-la).
+        """
+        return self.get_tree().descendants(id)
+
+
     def get_by_id(self, id: UUID) -> Category | None:
         """
         Retorna uma categoria com base no ID.
@@ -94,14 +222,59 @@ class CategoryRepository:
         return None
     
 
-    def list_all(self) -> list[Category]:
+    def get_tree(self) -> CategoryTree:
+        """
+        Retorna o índice da hierarquia de categorias, reconstruindo-o apenas se houve alteração.
+
+        Returns:
+            CategoryTree: Índice com filhos, pais e caminhos de cada categoria.
+        """
+        with self._lock.shared():
+            signature = file_signature(self._filepath)
+            if self._tree is None or signature != self._tree_signature:
+                # Consulta somente leitura: valida como o caminho confiável, mas sem gravar o carimbo
+                self._tree = CategoryTree(self._trusted_categories(persist=False))
+                self._tree_signature = signature
+            return self._tree
+
+
+    def list_all(self, trusted: bool = False) -> list[Category]:
         """
         Lista todas as categorias armazenadas no repositório;
 
+        Args:
+            trusted (bool): Se True, o arquivo é validado uma única vez (carimbo com checksum e versão
+                do esquema) e as categorias são criadas sem revalidar cada linha.
+                O padrão (False) valida cada categoria, para dados de origem não confiável.
+
         Returns:
             list: Lista de categorias (formato de dicionários).
         """
-        return [Category.from_dict(item) for item in self._load()]
+        if not trusted:
+            return [Category.from_dict(item) for item in self._load()]
+        return self._trusted_categories()
+
+
+    def _trusted_categories(self, persist: bool = True) -> list[Category]:
+        """
+        Carrega as categorias validando o arquivo uma única vez (ver ValidationStamp.ensure).
+
+        Args:
+            persist (bool): Se False, o arquivo ainda não carimbado é validado sem gravar o carimbo.
+
+        Returns:
+            list[Category]: Categorias criadas sem revalidar cada linha.
+
+        Raises:
+            ValueError: Caso alguma categoria do arquivo seja inválida.
+        """
+        with self._lock.shared():
+            data = self._load()
+            signature = file_signature(self._filepath)
+            if signature != self._validated_signature:
+                self._stamp.ensure(data, Category.from_dict, persist=persist)
+                self._validated_signature = signature
+            return [Category.from_trusted_dict(item) for item in data]
     
 
     def list_by_parent(self, id: UUID) -> list:
@@ -114,10 +287,23 @@ class CategoryRepository:
         Returns:
             list: lista de categorias com aquela categoria pai.
         """
-        data = self._load()
-        return [Category.from_dict(item) for item in data if item["categoria_pai"] == str(id)]
-        
+        return self.get_tree().children(id)
+
+
+    def path(self, id: UUID) -> list[Category]:
+        """
+        Retorna o caminho de uma categoria a partir da raiz (ex: [nível 1, nível 2, nível 3]).
+
+        Args:
+            id (UUID): ID da categoria.
+
+        Returns:
+            list[Category]: Ancestrais e a própria categoria, da raiz até ela; vazio se não existir.
+        """
+        return self.get_tree().path(id)
+
 
+    @exclusive
     def update(self, category: Category):
         """
         Atualiza uma categoria existente com base no ID.
@@ -140,4 +326,35 @@ class CategoryRepository:
         if updated:
             self._save(data)
         else:
-            raise ValueError(f'Category with ID {category.id} not found.')
\ No newline at end of file
+            raise ValueError(f'Category with ID {category.id} not found.')
+
+
+    @exclusive
+    def update_many(self, categories: Iterable[Category]) -> BulkResult:
+        """
+        Atualiza várias categorias com uma única leitura e uma única gravação.
+        Se um ID se repetir no lote, a última ocorrência prevalece.
+
+        Args:
+            categories (Iterable[Category]): As categorias a serem atualizadas.
+
+        Returns:
+            BulkResult: IDs atualizados (applied) e IDs não encontrados (skipped).
+        """
+        data = self._load()
+        positions = {}
+        for idx, item in enumerate(data):
+            positions.setdefault(item["id"], idx)
+        result = BulkResult()
+
+        for category in categories:
+            idx = positions.get(str(category.id))
+            if idx is None:
+                result.skipped.append(category.id)
+                continue
+            data[idx] = category.to_dict()
+            result.applied.append(category.id)
+
+        if result.applied:
+            self._save(data)
+        return result
\ No newline at end of file
@@ -0,0 +1,114 @@
+from uuid import UUID
+from finance_app.core.models.category import Category
+
+
+class CategoryTree:
+    """
+    Índice em memória da hierarquia de categorias (nível 1 -> 2 -> 3).
+    Guarda listas de filhos, ponteiros para o pai e o caminho de ancestrais de cada categoria,
+    calculados uma única vez, para que as consultas não precisem percorrer todas as categorias.
+    Os objetos Category retornados são compartilhados com o índice e não devem ser alterados.
+    """
+
+    def __init__(self, categories: list[Category]):
+        """
+        Constrói o índice a partir da lista de categorias.
+
+        Args:
+            categories (list[Category]): Todas as categorias do repositório.
+        """
+        self._categories = {}  # ID -> Category
+        self._children = {}  # ID do pai -> filhos, na ordem do repositório
+        for category in categories:
+            self._categories.setdefault(category.id, category)
+        for category in self._categories.values():
+            self._children.setdefault(category.categoria_pai, []).append(category)
+        # Raízes: nível 1 e órfãs (categoria pai inexistente)
+        self._roots = [category for category in self._categories.values()
+                       if category.categoria_pai is None or category.categoria_pai not in self._categories]
+
+        self._paths = {}  # ID -> [raiz, ..., categoria]
+        for category in self._categories.values():
+            self._paths[category.id] = self._build_path(category)
+        self._name_paths = None  # Caminhos de nomes (calculados sob demanda)
+
+    def _build_path(self, category: Category) -> list[Category]:
+        """
+        Monta o caminho da raiz até a categoria, reaproveitando os caminhos já calculados.
+        Pais inexistentes encerram o caminho; ciclos são interrompidos.
+        """
+        chain = []
+        visited = set()
+        current = category
+        while current is not None and current.id not in visited:
+            cached = self._paths.get(current.id)
+            if cached is not None:
+                return cached + chain[::-1]
+            visited.add(current.id)
+            chain.append(current)
+            current = self._categories.get(current.categoria_pai)
+        return chain[::-1]
+
+    def __len__(self) -> int:
+        """
+        Retorna o número de categorias no índice.
+        """
+        return len(self._categories)
+
+    def get(self, id: UUID) -> Category | None:
+        """
+        Retorna a categoria com o ID informado, ou None.
+        """
+        return self._categories.get(id)
+
+    def roots(self) -> list[Category]:
+        """
+        Retorna as categorias de nível 1 (e as órfãs, cujo pai não existe).
+        """
+        return list(self._roots)
+
+    def children(self, id: UUID) -> list[Category]:
+        """
+        Retorna os filhos diretos de uma categoria.
+        """
+        return list(self._children.get(id, []))
+
+    def parent(self, id: UUID) -> Category | None:
+        """
+        Retorna a categoria pai, ou None para raízes e IDs inexistentes.
+        """
+        category = self._categories.get(id)
+        return self._categories.get(category.categoria_pai) if category else None
+
+    def path(self, id: UUID) -> list[Category]:
+        """
+        Retorna o caminho da raiz até a categoria (inclusive), ou lista vazia se o ID não existir.
+        """
+        return list(self._paths.get(id, []))
+
+    def name_paths(self) -> frozenset:
+        """
+        Retorna os caminhos de nomes existentes na hierarquia, no formato dos campos categoria_n1/n2/n3
+        das transações, com "" nos níveis não usados (ex: ("Moradia", "Contas", "")).
+        Caminhos parciais também são incluídos; caminhos com mais de três níveis (dados inconsistentes), não.
+        """
+        if self._name_paths is None:
+            names = (tuple(category.nome for category in path) for path in self._paths.values())
+            self._name_paths = frozenset(path + ("",) * (3 - len(path)) for path in names if len(path) <= 3)
+        return self._name_paths
+
+    def descendants(self, id: UUID) -> list[Category]:
+        """
+        Retorna todos os descendentes de uma categoria (sem incluí-la), em pré-ordem.
+        """
+        result = []
+        visited = {id}  # Protege contra ciclos em dados inconsistentes
+        stack = list(reversed(self._children.get(id, [])))
+        while stack:
+            category = stack.pop()
+            if category.id in visited:
+                continue
+            visited.add(category.id)
+            result.append(category)
+            stack.extend(reversed(self._children.get(category.id, [])))
+        return result
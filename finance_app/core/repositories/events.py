@@ -0,0 +1,55 @@
+from typing import Callable
+
+# Assinatura dos ouvintes: (registro antigo, registro novo), ambos no formato de dicionário.
+# add -> (None, novo); update -> (antigo, novo); delete -> (antigo, None)
+Listener = Callable[[dict | None, dict | None], None]
+
+
+class RepositoryEvents:
+    """
+    Lista de ouvintes notificados a cada alteração feita por um repositório.
+    Permite que serviços mantenham agregados/índices atualizados de forma incremental,
+    sem precisar reler todos os dados a cada consulta.
+    """
+
+    def __init__(self):
+        """
+        Inicializa sem nenhum ouvinte.
+        """
+        self._listeners = []
+
+    def __bool__(self) -> bool:
+        """
+        Retorna True se há ouvintes. Usado pelos repositórios para evitar trabalho extra
+        (ex: guardar o registro antigo) quando ninguém está ouvindo.
+        """
+        return bool(self._listeners)
+
+    def subscribe(self, listener: Listener):
+        """
+        Registra um ouvinte.
+
+        Args:
+            listener (Listener): Função chamada com (registro antigo, registro novo) a cada alteração.
+        """
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Listener):
+        """
+        Remove um ouvinte registrado.
+
+        Args:
+            listener (Listener): O ouvinte a ser removido.
+        """
+        self._listeners.remove(listener)
+
+    def publish(self, changes: list):
+        """
+        Notifica os ouvintes sobre alterações já gravadas.
+
+        Args:
+            changes (list): Pares (registro antigo, registro novo), na ordem em que foram aplicados.
+        """
+        for listener in self._listeners:
+            for old, new in changes:
+                listener(old, new)
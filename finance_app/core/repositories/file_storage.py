@@ -0,0 +1,166 @@
+import functools
+import os
+import stat
+import tempfile
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Plataformas sem fcntl (ex: Windows): a trava vira um no-op
+    fcntl = None
+
+
+def file_signature(path: str) -> tuple | None:
+    """
+    Retorna a assinatura de um arquivo, usada para detectar alterações externas.
+    Inclui o inode porque uma gravação atômica substitui o arquivo por outro.
+
+    Args:
+        path (str): Caminho do arquivo.
+
+    Returns:
+        tuple | None: (inode, mtime_ns, tamanho) do arquivo, ou None se ele não existir.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _fsync_directory(directory: str):
+    """
+    Garante que a renomeação do arquivo foi persistida no diretório (quando suportado).
+    """
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def atomic_open(filepath: str, mode: str = "w"):
+    """
+    Abre um arquivo temporário para escrita e, ao final do bloco, substitui o arquivo de destino
+    de forma atômica (fsync + os.replace). Se ocorrer um erro (ou queda) durante a escrita,
+    o arquivo original permanece intacto.
+
+    Args:
+        filepath (str): Caminho do arquivo de destino.
+        mode (str): Modo de abertura ("w" para texto, "wb" para binário).
+
+    Yields:
+        file: Arquivo temporário onde o conteúdo deve ser escrito.
+    """
+    directory = os.path.dirname(os.path.abspath(filepath))
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(filepath) + ".", suffix=".tmp", dir=directory)
+    try:
+        if os.path.exists(filepath):
+            # Preserva as permissões do arquivo original (mkstemp cria com 0600)
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(filepath).st_mode))
+        with os.fdopen(fd, mode) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _fsync_directory(directory)
+
+
+class FileLock:
+    """
+    Trava consultiva entre processos (fcntl.flock) sobre um arquivo <caminho>.lock.
+    Serializa os ciclos de leitura-alteração-gravação de processos que compartilham os mesmos dados.
+    Também serializa as threads do mesmo processo que usam a mesma instância, e é reentrante:
+    uma trava compartilhada pedida dentro de uma exclusiva reaproveita a exclusiva.
+    """
+
+    def __init__(self, filepath: str):
+        """
+        Args:
+            filepath (str): Caminho do arquivo de dados protegido pela trava.
+        """
+        self._lock_path = filepath + ".lock"
+        self._file = None
+        self._depth = 0
+        self._exclusive = False
+        self._thread_lock = threading.RLock()  # flock não distingue threads do mesmo processo
+
+    def _acquire(self, exclusive: bool):
+        """
+        Obtém a trava (ou incrementa a profundidade, se já estiver com ela).
+        """
+        self._thread_lock.acquire()
+        try:
+            if self._depth == 0:
+                # O diretório dos dados pode ainda não existir (ex: primeira execução)
+                os.makedirs(os.path.dirname(os.path.abspath(self._lock_path)), exist_ok=True)
+                self._file = open(self._lock_path, "a")
+                if fcntl is not None:
+                    fcntl.flock(self._file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+                self._exclusive = exclusive
+            elif exclusive and not self._exclusive:
+                raise RuntimeError("Cannot upgrade a shared lock to an exclusive lock.")
+        except BaseException:
+            if self._depth == 0 and self._file is not None:
+                self._file.close()
+                self._file = None
+            self._thread_lock.release()
+            raise
+        self._depth += 1
+
+    def _release(self):
+        """
+        Libera a trava quando a última utilização aninhada termina.
+        """
+        self._depth -= 1
+        if self._depth == 0:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+        self._thread_lock.release()
+
+    @contextmanager
+    def shared(self):
+        """
+        Trava compartilhada (leitura): vários leitores ao mesmo tempo, nenhum escritor.
+        """
+        self._acquire(exclusive=False)
+        try:
+            yield
+        finally:
+            self._release()
+
+    @contextmanager
+    def exclusive(self):
+        """
+        Trava exclusiva (escrita): um único processo por vez.
+        """
+        self._acquire(exclusive=True)
+        try:
+            yield
+        finally:
+            self._release()
+
+
+def exclusive(method):
+    """
+    Decorador para métodos de repositório que alteram dados: executa o método inteiro
+    (leitura, alteração e gravação) sob a trava exclusiva do repositório (self._lock).
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock.exclusive():
+            return method(self, *args, **kwargs)
+    return wrapper
@@ -0,0 +1,310 @@
+import logging
+import threading
+import time
+from bisect import bisect_left
+from typing import NamedTuple, Protocol
+from finance_app.core.repositories.bulk_result import BulkResult
+from finance_app.core.repositories.file_storage import atomic_open
+
+# Limites superiores (em segundos) dos intervalos do histograma de latência; o último é +Inf
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class CallRecord(NamedTuple):
+    """
+    Medidas de uma chamada a um método público do repositório.
+    """
+    repository: str  # Nome do repositório (ex: "TransactionRepository")
+    method: str
+    seconds: float
+    bytes_read: int  # Bytes lidos do disco (arquivo e journal)
+    bytes_written: int  # Bytes gravados no disco
+    rows_scanned: int  # Registros decodificados do disco ou percorridos no cache
+    rows_returned: int  # Registros retornados (itens da lista, 1 para um objeto, aplicados no BulkResult)
+    error: bool  # Se a chamada terminou com exceção
+
+
+class MetricsSink(Protocol):
+    """
+    Destino das medidas: recebe um CallRecord ao fim de cada chamada instrumentada.
+    """
+
+    def record(self, call: CallRecord):
+        ...
+
+
+class MethodStats:
+    """
+    Estatísticas acumuladas de um método.
+    """
+    __slots__ = ("calls", "errors", "seconds", "buckets", "bytes_read", "bytes_written",
+                 "rows_scanned", "rows_returned")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)  # Chamadas por intervalo (não cumulativo)
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.rows_scanned = 0
+        self.rows_returned = 0
+
+    def add(self, call: CallRecord):
+        """
+        Acumula uma chamada.
+        """
+        self.calls += 1
+        self.errors += call.error
+        self.seconds += call.seconds
+        self.buckets[bisect_left(LATENCY_BUCKETS, call.seconds)] += 1
+        self.bytes_read += call.bytes_read
+        self.bytes_written += call.bytes_written
+        self.rows_scanned += call.rows_scanned
+        self.rows_returned += call.rows_returned
+
+
+class InMemorySink:
+    """
+    Acumula as medidas em memória, por (repositório, método).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}  # (repositório, método) -> MethodStats
+
+    def record(self, call: CallRecord):
+        with self._lock:
+            stats = self._stats.get((call.repository, call.method))
+            if stats is None:
+                stats = self._stats[(call.repository, call.method)] = MethodStats()
+            stats.add(call)
+
+    def stats(self) -> dict:
+        """
+        Retorna as estatísticas acumuladas: (repositório, método) -> MethodStats.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def reset(self):
+        """
+        Descarta as estatísticas acumuladas.
+        """
+        with self._lock:
+            self._stats = {}
+
+
+class LogSink:
+    """
+    Emite uma linha de log por chamada (ex: para investigar um relatório lento em produção).
+    """
+
+    def __init__(self, logger: logging.Logger | None = None, level: int = logging.DEBUG):
+        """
+        Args:
+            logger (logging.Logger | None): Logger usado; padrão "finance_app.repositories".
+            level (int): Nível das mensagens.
+        """
+        self._logger = logger or logging.getLogger("finance_app.repositories")
+        self._level = level
+
+    def record(self, call: CallRecord):
+        if self._logger.isEnabledFor(self._level):
+            self._logger.log(self._level, "%s.%s %.3fms read=%dB written=%dB scanned=%d returned=%d%s",
+                             call.repository, call.method, call.seconds * 1000, call.bytes_read,
+                             call.bytes_written, call.rows_scanned, call.rows_returned,
+                             " error" if call.error else "")
+
+
+class PrometheusFileSink(InMemorySink):
+    """
+    Acumula as medidas em memória e as grava em um arquivo no formato texto do Prometheus
+    (ex: para o textfile collector do node_exporter). O arquivo é regravado de forma atômica
+    no máximo a cada 'interval' segundos, ou explicitamente com write().
+    Falhas nas gravações automáticas (ex: disco cheio) são registradas no log e não chegam
+    ao método instrumentado.
+    """
+
+    def __init__(self, filepath: str, interval: float = 10.0, logger: logging.Logger | None = None):
+        """
+        Args:
+            filepath (str): Caminho do arquivo .prom.
+            interval (float): Intervalo mínimo entre gravações automáticas, em segundos.
+            logger (logging.Logger | None): Logger das falhas de gravação; padrão "finance_app.repositories".
+        """
+        super().__init__()
+        self._filepath = filepath
+        self._interval = interval
+        self._written_at = time.monotonic()
+        self._logger = logger or logging.getLogger("finance_app.repositories")
+
+    def record(self, call: CallRecord):
+        super().record(call)
+        if time.monotonic() - self._written_at >= self._interval:
+            try:
+                self.write()
+            except OSError:
+                # A instrumentação nunca altera o comportamento do repositório: tenta de novo no próximo intervalo
+                self._logger.warning("Could not write metrics file %s", self._filepath, exc_info=True)
+
+    def render(self) -> str:
+        """
+        Retorna as estatísticas no formato texto do Prometheus.
+        """
+        stats = sorted(self.stats().items())
+        lines = []
+        counters = (
+            ("finance_repository_calls_total", "Chamadas por método.", "calls"),
+            ("finance_repository_errors_total", "Chamadas terminadas com exceção.", "errors"),
+            ("finance_repository_read_bytes_total", "Bytes lidos do disco.", "bytes_read"),
+            ("finance_repository_written_bytes_total", "Bytes gravados no disco.", "bytes_written"),
+            ("finance_repository_rows_scanned_total", "Registros decodificados ou percorridos.", "rows_scanned"),
+            ("finance_repository_rows_returned_total", "Registros retornados.", "rows_returned"),
+        )
+        for name, help_text, attribute in counters:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for (repository, method), values in stats:
+                lines.append(f'{name}{{repository="{repository}",method="{method}"}} {getattr(values, attribute)}')
+
+        name = "finance_repository_latency_seconds"
+        lines.append(f"# HELP {name} Latência das chamadas.")
+        lines.append(f"# TYPE {name} histogram")
+        for (repository, method), values in stats:
+            labels = f'repository="{repository}",method="{method}"'
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), values.buckets):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f"{name}_sum{{{labels}}} {values.seconds!r}")
+            lines.append(f"{name}_count{{{labels}}} {values.calls}")
+        return "\n".join(lines) + "\n"
+
+    def write(self):
+        """
+        Grava as estatísticas atuais no arquivo (gravação atômica).
+        """
+        self._written_at = time.monotonic()
+        with atomic_open(self._filepath) as f:
+            f.write(self.render())
+
+
+class _Probe:
+    """
+    Contadores da chamada em andamento em uma thread.
+    """
+    __slots__ = ("bytes_read", "bytes_written", "rows_scanned")
+
+    def __init__(self):
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.rows_scanned = 0
+
+
+class Instrumentation:
+    """
+    Instrumentação de um repositório: envolve os métodos públicos da instância e recebe dos
+    métodos internos (leitura, gravação, varredura) os contadores da chamada em andamento.
+    Chamadas aninhadas (ex: list_by_month -> list_by_period) contam apenas como a chamada externa.
+    """
+
+    def __init__(self, sink: MetricsSink, name: str):
+        self._sink = sink
+        self._name = name
+        self._local = threading.local()  # Probe da chamada em andamento em cada thread
+        self.methods = []  # Métodos envolvidos
+
+    def add(self, bytes_read: int = 0, bytes_written: int = 0, rows_scanned: int = 0):
+        """
+        Soma contadores à chamada em andamento na thread atual (ignorado fora de uma chamada instrumentada,
+        ex: iter_all).
+        """
+        probe = getattr(self._local, "probe", None)
+        if probe is not None:
+            probe.bytes_read += bytes_read
+            probe.bytes_written += bytes_written
+            probe.rows_scanned += rows_scanned
+
+    def wrap(self, method_name: str, method):
+        """
+        Retorna o método envolvido com a medição.
+        """
+        local, sink, name = self._local, self._sink, self._name
+
+        def instrumented(*args, **kwargs):
+            if getattr(local, "probe", None) is not None:
+                # Chamada aninhada: já medida pela chamada externa
+                return method(*args, **kwargs)
+            probe = local.probe = _Probe()
+            error = True
+            result = None
+            start = time.perf_counter()
+            try:
+                result = method(*args, **kwargs)
+                error = False
+                return result
+            finally:
+                elapsed = time.perf_counter() - start
+                local.probe = None
+                sink.record(CallRecord(name, method_name, elapsed, probe.bytes_read, probe.bytes_written,
+                                       probe.rows_scanned, _rows_returned(result), error))
+
+        instrumented.__name__ = method_name
+        instrumented.__doc__ = method.__doc__
+        return instrumented
+
+
+def _rows_returned(result) -> int:
+    """
+    Conta os registros retornados por um método.
+    """
+    if result is None:
+        return 0
+    if isinstance(result, list):
+        return len(result)
+    if isinstance(result, BulkResult):
+        return len(result.applied)
+    return 1
+
+
+def instrument(repository, sink: MetricsSink, name: str | None = None) -> Instrumentation:
+    """
+    Passa a medir as chamadas aos métodos públicos de um repositório (exceto iteradores e close).
+    Os métodos são substituídos apenas na instância: repositórios sem instrumentação não têm custo
+    extra além de uma comparação com None a cada leitura/gravação de arquivo.
+    Bytes e registros varridos são informados pelo TransactionRepository e pelo CategoryRepository;
+    em outros repositórios são medidas apenas chamadas, latência e registros retornados.
+
+    Args:
+        repository: Repositório a ser instrumentado.
+        sink (MetricsSink): Destino das medidas (ex: InMemorySink, LogSink, PrometheusFileSink).
+        name (str | None): Nome do repositório nas medidas; padrão é o nome da classe.
+
+    Returns:
+        Instrumentation: A instrumentação instalada.
+    """
+    uninstrument(repository)
+    instrumentation = Instrumentation(sink, name or type(repository).__name__)
+    for method_name in dir(type(repository)):
+        if method_name.startswith(("_", "iter_")) or method_name == "close":
+            continue
+        method = getattr(repository, method_name)
+        if callable(method):
+            setattr(repository, method_name, instrumentation.wrap(method_name, method))
+            instrumentation.methods.append(method_name)
+    repository._instrumentation = instrumentation
+    return instrumentation
+
+
+def uninstrument(repository):
+    """
+    Remove a instrumentação de um repositório (sem efeito se não estiver instrumentado).
+    """
+    instrumentation = getattr(repository, "_instrumentation", None)
+    if instrumentation is None:
+        return
+    for method_name in instrumentation.methods:
+        delattr(repository, method_name)
+    repository._instrumentation = None
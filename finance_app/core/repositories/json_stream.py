@@ -0,0 +1,68 @@
+import json
+from typing import Iterator, TextIO
+
+# Caracteres ignorados entre os elementos do array
+_SEPARATORS = " \t\r\n,"
+
+
+def iter_json_array(f: TextIO, chunk_size: int = 64 * 1024) -> Iterator[dict]:
+    """
+    Lê um arquivo contendo um array JSON de objetos e retorna seus elementos um a um,
+    decodificando o arquivo em blocos. O pico de memória é limitado pelo tamanho do bloco
+    (mais o maior elemento), e não pelo tamanho do arquivo. O arquivo é fechado ao final.
+
+    Args:
+        f (TextIO): Arquivo JSON já aberto em modo texto.
+        chunk_size (int): Quantidade de caracteres lidos por vez.
+
+    Yields:
+        dict: Cada objeto do array, na ordem do arquivo.
+
+    Raises:
+        json.JSONDecodeError: Caso o conteúdo não seja um array JSON válido.
+    """
+    decoder = json.JSONDecoder()
+    with f:
+        buffer, pos = "", 0
+        started = False
+
+        while True:
+            # Pula espaços e vírgulas, lendo mais blocos se o buffer acabar
+            while True:
+                while pos < len(buffer) and buffer[pos] in _SEPARATORS:
+                    pos += 1
+                if pos < len(buffer):
+                    break
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    if not started:
+                        # Arquivo vazio: trata como lista vazia
+                        return
+                    raise json.JSONDecodeError("Unterminated array", buffer, pos)
+                buffer, pos = chunk, 0
+
+            if not started:
+                if buffer[pos] != "[":
+                    raise json.JSONDecodeError("Expecting '['", buffer, pos)
+                started = True
+                pos += 1
+                continue
+
+            if buffer[pos] == "]":
+                return
+
+            # Decodifica o próximo elemento; se ele estiver cortado no fim do buffer, lê mais um bloco
+            while True:
+                try:
+                    item, pos = decoder.raw_decode(buffer, pos)
+                    break
+                except json.JSONDecodeError:
+                    chunk = f.read(chunk_size)
+                    if not chunk:
+                        raise
+                    buffer, pos = buffer[pos:] + chunk, 0
+            yield item
+
+            # Descarta o trecho já consumido para o buffer não crescer com o arquivo
+            if pos >= chunk_size:
+                buffer, pos = buffer[pos:], 0
@@ -0,0 +1,562 @@
+import mmap
+import os
+import struct
+from datetime import date
+from typing import Iterable, Iterator
+from uuid import UUID
+from finance_app.core.models.transaction import Transaction
+from finance_app.core.repositories.bulk_result import BulkResult
+from finance_app.core.repositories.events import RepositoryEvents
+from finance_app.core.repositories.file_storage import FileLock, atomic_open, exclusive
+from finance_app.core.repositories.transaction_queries import TransactionQueries
+from finance_app.core.repositories.transaction_repository import DATE_FIELDS, JsonMigration
+
+MAGIC = b"FAPMMAP1"
+# Assinatura, número de registros (incluindo removidos), geração (incrementada a cada alteração)
+# e número do heap de textos em uso (trocado a cada compactação)
+_HEADER = struct.Struct("<8sQQQ")
+# Registro de tamanho fixo: id (16 bytes), removido, datas (ordinais), valor, pago e,
+# para cada campo de texto, (posição, tamanho) no heap
+_TEXT_FIELDS = ("descricao", "conta", "cartao", "categoria_n1", "categoria_n2", "categoria_n3")
+_RECORD = struct.Struct("<16sBiid?" + "QI" * len(_TEXT_FIELDS))
+# Apenas (removido, data_transacao, data_efetivacao), para varrer as datas sem decodificar o resto
+_DATES = struct.Struct(f"<16xBii{_RECORD.size - 25}x")
+_DELETED_OFFSET = 16
+_PAGO_OFFSET = 33
+# Campos de texto com poucos valores distintos: gravados uma única vez no heap e reaproveitados
+_SHARED_FIELDS = frozenset(_TEXT_FIELDS[1:])
+_INITIAL_CAPACITY = 1024
+
+
+class MmapTransactionRepository(TransactionQueries, JsonMigration):
+    """
+    Repositório de transações em registros binários de tamanho fixo, acessados via mmap.
+    Possui os mesmos métodos públicos do TransactionRepository (JSON).
+
+    - <filepath>: cabeçalho + registros de tamanho fixo; o registro N fica em uma posição calculada,
+      lido direto do mapeamento (struct.unpack_from/memoryview, sem cópia do arquivo)
+    - <filepath>.<n>.heap: textos (descrição, conta, cartão, categorias), apenas acrescentados;
+      o registro guarda a posição e o tamanho de cada texto
+    - índice ID -> posição em memória, reconstruído ao abrir (ou quando outro processo altera o arquivo)
+
+    Alterações de campos fixos (ex: pago, valor, datas) são gravadas no próprio registro, sem regravar
+    o arquivo. Removidos são marcados e só saem do arquivo (junto com textos sem uso) em compact().
+    """
+
+    def __init__(self, filepath="finance_app/data/transaction.bin"):
+        """
+        Inicializa o repositório, criando os arquivos se necessário.
+
+        Args:
+            filepath (str): Caminho do arquivo de registros.
+        """
+        self._filepath = filepath
+        self.events = RepositoryEvents()  # Ouvintes notificados a cada add/update/delete
+        self._lock = FileLock(filepath)  # Serializa leitura-alteração-gravação entre processos
+        self._file = None  # Arquivo de registros
+        self._mm = None  # Mapeamento do arquivo de registros
+        self._heap = None  # Arquivo do heap de textos
+        self._heap_mm = None  # Mapeamento do heap (refeito quando o heap cresce)
+        self._heap_size = 0
+        self._inode = None
+        self._count = 0
+        self._generation = 0
+        self._heap_id = 0
+        self._index = {}  # ID (16 bytes) -> posição do registro
+        self._texts = {}  # (posição, tamanho) no heap -> texto, para os campos compartilhados
+        self._refs = {}  # Texto -> (posição, tamanho) no heap, para os campos compartilhados
+        self._ordinals = {}  # Ordinal -> data ISO
+        with self._lock.exclusive():
+            self._open()
+
+    def close(self):
+        """
+        Fecha os mapeamentos e os arquivos.
+        """
+        for resource in (self._heap_mm, self._heap, self._mm, self._file):
+            if resource is not None:
+                resource.close()
+        self._file = self._mm = self._heap = self._heap_mm = None
+
+    # ---------- Arquivos e mapeamentos ----------
+
+    def _heap_path(self, heap_id: int) -> str:
+        """
+        Retorna o caminho do heap de textos de uma geração de compactação.
+        """
+        return f"{self._filepath}.{heap_id}.heap"
+
+    def _open(self):
+        """
+        Abre (criando, se necessário) os arquivos, mapeia os registros e constrói o índice.
+        """
+        if not os.path.exists(self._filepath):
+            with atomic_open(self._filepath, "wb") as f:
+                f.write(_HEADER.pack(MAGIC, 0, 0, 0))
+                f.truncate(_HEADER.size + _INITIAL_CAPACITY * _RECORD.size)
+        self._file = open(self._filepath, "r+b")
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        magic, self._count, self._generation, self._heap_id = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Corrupted data file: {self._filepath}")
+        self._inode = os.fstat(self._file.fileno()).st_ino
+        self._heap = open(self._heap_path(self._heap_id), "a+b")
+        self._heap_size = os.fstat(self._heap.fileno()).st_size
+        self._heap_mm = None
+        self._build_index()
+
+    def _build_index(self):
+        """
+        Reconstrói o índice de IDs e o cache dos textos compartilhados varrendo os registros.
+        """
+        self._index = {}
+        self._texts = {}
+        self._refs = {}
+        end = _HEADER.size + self._count * _RECORD.size
+        with memoryview(self._mm) as view:
+            for slot, values in enumerate(_RECORD.iter_unpack(view[_HEADER.size:end])):
+                if values[1]:
+                    continue
+                self._index[values[0]] = slot
+                for i in range(1, len(_TEXT_FIELDS)):
+                    ref = values[6 + 2 * i], values[7 + 2 * i]
+                    if ref not in self._texts:
+                        text = self._read_text(*ref)
+                        self._texts[ref] = text
+                        self._refs.setdefault(text, ref)
+
+    def _refresh(self):
+        """
+        Detecta alterações feitas por outros processos: reabre os arquivos se foram substituídos
+        (compactação) e reconstrói o índice se a geração mudou.
+        """
+        if os.stat(self._filepath).st_ino != self._inode:
+            self.close()
+            self._open()
+            return
+        _, count, generation, _ = _HEADER.unpack_from(self._mm, 0)
+        if generation == self._generation:
+            return
+        if os.fstat(self._file.fileno()).st_size != len(self._mm):
+            # O arquivo cresceu: refaz o mapeamento
+            self._mm.close()
+            self._mm = mmap.mmap(self._file.fileno(), 0)
+        self._count, self._generation = count, generation
+        self._heap_size = os.fstat(self._heap.fileno()).st_size
+        self._build_index()
+
+    def _read_text(self, position: int, size: int) -> str:
+        """
+        Lê um texto do heap pelo mapeamento, refazendo-o se o heap cresceu.
+        """
+        if not size:
+            return ""
+        if self._heap_mm is None or position + size > len(self._heap_mm):
+            # Textos do lote em andamento podem estar no buffer: envia ao arquivo antes de mapear
+            self._heap.flush()
+            if self._heap_mm is not None:
+                self._heap_mm.close()
+            self._heap_mm = mmap.mmap(self._heap.fileno(), 0, access=mmap.ACCESS_READ)
+        return str(self._heap_mm[position:position + size], "utf-8")
+
+    def _store_text(self, name: str, text: str) -> tuple:
+        """
+        Acrescenta um texto ao heap (ou reaproveita o já gravado, nos campos compartilhados).
+
+        Returns:
+            tuple: (posição, tamanho) do texto no heap.
+        """
+        if name in _SHARED_FIELDS:
+            ref = self._refs.get(text)
+            if ref is not None:
+                return ref
+        data = text.encode("utf-8")
+        ref = (self._heap_size, len(data))
+        self._heap.write(data)
+        self._heap_size += len(data)
+        if name in _SHARED_FIELDS:
+            self._refs[text] = ref
+            self._texts[ref] = text
+        return ref
+
+    def _ensure_capacity(self, count: int):
+        """
+        Aumenta o arquivo (dobrando a capacidade) para caber 'count' registros.
+        """
+        capacity = (len(self._mm) - _HEADER.size) // _RECORD.size
+        if count <= capacity:
+            return
+        while capacity < count:
+            capacity = max(_INITIAL_CAPACITY, capacity * 2)
+        self._mm.close()
+        self._file.truncate(_HEADER.size + capacity * _RECORD.size)
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+
+    def _commit(self, writes: list, count: int):
+        """
+        Grava as alterações de um lote na ordem segura para quedas: primeiro os textos novos (fsync),
+        depois os registros e, por último, o cabeçalho com a nova contagem e geração.
+
+        Args:
+            writes (list): Pares (posição do registro, valores do registro).
+            count (int): Número de registros após o lote.
+        """
+        self._heap.flush()
+        os.fsync(self._heap.fileno())
+        self._ensure_capacity(count)
+        for slot, values in writes:
+            _RECORD.pack_into(self._mm, _HEADER.size + slot * _RECORD.size, *values)
+        self._count = count
+        self._generation += 1
+        _HEADER.pack_into(self._mm, 0, MAGIC, self._count, self._generation, self._heap_id)
+        self._mm.flush()
+
+    # ---------- Conversão de registros ----------
+
+    def _iso(self, ordinal: int) -> str:
+        """
+        Converte um ordinal de data em texto ISO (com cache: há poucas datas distintas).
+        """
+        iso = self._ordinals.get(ordinal)
+        if iso is None:
+            iso = self._ordinals[ordinal] = date.fromordinal(ordinal).isoformat()
+        return iso
+
+    def _text(self, values: tuple, i: int) -> str:
+        """
+        Retorna o i-ésimo campo de texto de um registro.
+        """
+        ref = values[6 + 2 * i], values[7 + 2 * i]
+        text = self._texts.get(ref)
+        return text if text is not None else self._read_text(*ref)
+
+    def _to_dict(self, values: tuple) -> dict:
+        """
+        Converte os valores de um registro no mesmo dicionário gerado por Transaction.to_dict().
+        """
+        return {
+            "id": str(UUID(bytes=values[0])),
+            "descricao": self._text(values, 0),
+            "data_transacao": self._iso(values[2]),
+            "data_efetivacao": self._iso(values[3]),
+            "valor": values[4],
+            "conta": self._text(values, 1),
+            "cartao": self._text(values, 2),
+            "categoria_n1": self._text(values, 3),
+            "categoria_n2": self._text(values, 4),
+            "categoria_n3": self._text(values, 5),
+            "pago": values[5],
+        }
+
+    def _to_values(self, record: dict, old: tuple | None = None) -> tuple:
+        """
+        Converte o dicionário de uma transação nos valores do registro, gravando os textos novos no heap.
+        Textos iguais aos do registro antigo reaproveitam a mesma posição no heap.
+        """
+        values = [
+            UUID(record["id"]).bytes,
+            0,
+            date.fromisoformat(record["data_transacao"]).toordinal(),
+            date.fromisoformat(record["data_efetivacao"]).toordinal(),
+            float(record["valor"]),
+            bool(record["pago"]),
+        ]
+        for i, name in enumerate(_TEXT_FIELDS):
+            if old is not None and self._text(old, i) == record[name]:
+                values.extend(old[6 + 2 * i:8 + 2 * i])
+            else:
+                values.extend(self._store_text(name, record[name]))
+        return tuple(values)
+
+    def _values_at(self, slot: int) -> tuple:
+        """
+        Lê os valores de um registro direto do mapeamento.
+        """
+        return _RECORD.unpack_from(self._mm, _HEADER.size + slot * _RECORD.size)
+
+    def _slots(self, slots: Iterable[int]) -> list:
+        """
+        Converte os registros das posições informadas em dicionários.
+        """
+        return [self._to_dict(self._values_at(slot)) for slot in slots]
+
+    def _live_slots(self) -> list:
+        """
+        Retorna as posições dos registros não removidos, na ordem de inserção.
+        """
+        return sorted(self._index.values())
+
+    # ---------- Interface do repositório ----------
+
+    @exclusive
+    def add(self, transaction: Transaction):
+        """
+        Adiciona uma nova transação ao repositório.
+
+        Args:
+            transaction (Transaction): A transação a ser adicionada.
+
+        Raises:
+            ValueError: Caso já exista uma transação com o mesmo ID.
+        """
+        if self.add_many([transaction]).skipped:
+            raise ValueError(f'Transaction with ID {transaction.id} already exists.')
+
+    @exclusive
+    def add_many(self, transactions: Iterable[Transaction]) -> BulkResult:
+        """
+        Adiciona várias transações com uma única gravação do cabeçalho.
+        Transações cujo ID já existe no repositório (ou que se repetem no lote) são ignoradas.
+
+        Args:
+            transactions (Iterable[Transaction]): Transações a serem adicionadas.
+
+        Returns:
+            BulkResult: IDs adicionados (applied) e IDs ignorados por duplicidade (skipped).
+        """
+        self._refresh()
+        result = BulkResult()
+        writes = []
+        changes = []
+        added = {}
+        count = self._count
+        for transaction in transactions:
+            key = transaction.id.bytes
+            if key in self._index or key in added:
+                result.skipped.append(transaction.id)
+                continue
+            record = transaction.to_dict()
+            added[key] = count
+            writes.append((count, self._to_values(record)))
+            count += 1
+            result.applied.append(transaction.id)
+            changes.append((None, record))
+        if writes:
+            self._commit(writes, count)
+            self._index.update(added)
+        self.events.publish(changes)
+        return result
+
+    @exclusive
+    def compact(self):
+        """
+        Regrava os arquivos sem os registros removidos e sem os textos que não estão mais em uso.
+        O novo heap é gravado com outro número e o arquivo de registros é substituído atomicamente,
+        então uma queda no meio mantém a versão anterior íntegra.
+        """
+        self._refresh()
+        records = self._slots(self._live_slots())
+        old_heap = self._heap_path(self._heap_id)
+        heap_id = self._heap_id + 1
+
+        self._heap.close()
+        self._heap = open(self._heap_path(heap_id), "w+b")
+        self._heap_size = 0
+        self._refs, self._texts = {}, {}
+        rows = [self._to_values(record) for record in records]
+        self._heap.flush()
+        os.fsync(self._heap.fileno())
+
+        capacity = max(_INITIAL_CAPACITY, len(rows))
+        with atomic_open(self._filepath, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, len(rows), self._generation + 1, heap_id))
+            f.write(b"".join(_RECORD.pack(*values) for values in rows))
+            f.truncate(_HEADER.size + capacity * _RECORD.size)
+        self.close()
+        self._open()
+        os.remove(old_heap)
+
+    @exclusive
+    def delete(self, transaction: Transaction):
+        """
+        Remove uma transação existente com base no seu ID.
+
+        Args:
+            transaction (Transaction): A transação a ser removida.
+        """
+        self.delete_many([transaction])
+
+    @exclusive
+    def delete_many(self, items: Iterable[Transaction | UUID]) -> BulkResult:
+        """
+        Remove várias transações, marcando os registros como removidos no próprio arquivo.
+
+        Args:
+            items (Iterable[Transaction | UUID]): Transações (ou seus IDs) a serem removidas.
+
+        Returns:
+            BulkResult: IDs removidos (applied) e IDs não encontrados ou repetidos no lote (skipped).
+        """
+        self._refresh()
+        result = BulkResult()
+        changes = []
+        for item in items:
+            item_id = item.id if isinstance(item, Transaction) else item
+            slot = self._index.pop(item_id.bytes, None)
+            if slot is None:
+                result.skipped.append(item_id)
+                continue
+            if self.events:
+                changes.append((self._to_dict(self._values_at(slot)), None))
+            self._mm[_HEADER.size + slot * _RECORD.size + _DELETED_OFFSET] = 1
+            result.applied.append(item_id)
+        if result.applied:
+            self._commit([], self._count)
+        self.events.publish(changes)
+        return result
+
+    def get_by_id(self, id: UUID) -> Transaction | None:
+        """
+        Recupera uma transação pelo seu ID, lendo apenas o seu registro.
+
+        Args:
+            id (UUID): ID da transação.
+
+        Returns:
+            Transaction | None: A transação correspondente, ou None se não encontrada.
+        """
+        with self._lock.shared():
+            self._refresh()
+            slot = self._index.get(id.bytes)
+            return Transaction.from_dict(self._to_dict(self._values_at(slot))) if slot is not None else None
+
+    def iter_all(self, chunk_size: int = 4096) -> Iterator[dict]:
+        """
+        Percorre todas as transações na ordem de inserção, decodificando um bloco de registros por vez
+        (cada bloco é lido sob a trava, que não fica presa entre os blocos).
+
+        Args:
+            chunk_size (int): Quantidade de registros decodificados por vez.
+
+        Yields:
+            dict: Cada transação (formato de dicionário).
+
+        Raises:
+            RuntimeError: Caso o arquivo seja compactado durante a iteração (as posições mudam).
+        """
+        with self._lock.shared():
+            self._refresh()
+            inode, slots = self._inode, self._live_slots()
+        for start in range(0, len(slots), chunk_size):
+            with self._lock.shared():
+                self._refresh()
+                if self._inode != inode:
+                    raise RuntimeError("Data file was compacted during iteration.")
+                chunk = [self._to_dict(self._values_at(slot)) for slot in slots[start:start + chunk_size]
+                         if self._mm[_HEADER.size + slot * _RECORD.size + _DELETED_OFFSET] == 0]
+            yield from chunk
+
+    def list_all(self) -> list:
+        """
+        Lista todas as transações armazenadas no repositório, na ordem de inserção.
+
+        Returns:
+            list: Lista de transações (formato de dicionários).
+        """
+        with self._lock.shared():
+            self._refresh()
+            return self._slots(self._live_slots())
+
+    def list_by_period(self, start: date, end: date, field: str = "data_transacao") -> list:
+        """
+        Lista transações com a data escolhida dentro do intervalo [start, end], ordenadas por essa data.
+        Varre apenas as colunas de data (struct de poucos campos sobre o memoryview) e decodifica
+        somente os registros selecionados.
+
+        Args:
+            start (date): Data inicial (inclusiva).
+            end (date): Data final (inclusiva).
+            field (str): Campo de data usado no filtro: "data_transacao" ou "data_efetivacao".
+
+        Returns:
+            list: Lista de transações no período especificado.
+
+        Raises:
+            ValueError: Caso o campo de data seja inválido.
+        """
+        if field not in DATE_FIELDS:
+            raise ValueError(f"Invalid date field: {field}. Use one of {DATE_FIELDS}.")
+        column = 1 + DATE_FIELDS.index(field)
+        first, last = start.toordinal(), end.toordinal()
+        with self._lock.shared():
+            self._refresh()
+            end_offset = _HEADER.size + self._count * _RECORD.size
+            with memoryview(self._mm) as view:
+                selected = [
+                    (values[column], slot)
+                    for slot, values in enumerate(_DATES.iter_unpack(view[_HEADER.size:end_offset]))
+                    if not values[0] and first <= values[column] <= last
+                ]
+            selected.sort()
+            return self._slots(slot for _, slot in selected)
+
+    @exclusive
+    def mark_paid(self, id: UUID, pago: bool = True):
+        """
+        Altera o status de pagamento de uma transação gravando um único byte no registro,
+        sem carregar ou regravar as demais transações.
+
+        Args:
+            id (UUID): ID da transação.
+            pago (bool): Novo status de pagamento.
+
+        Raises:
+            ValueError: Caso a transação não seja encontrada.
+        """
+        self._refresh()
+        slot = self._index.get(id.bytes)
+        if slot is None:
+            raise ValueError(f'Transaction with ID {id} not found.')
+        old = self._to_dict(self._values_at(slot)) if self.events else None
+        self._mm[_HEADER.size + slot * _RECORD.size + _PAGO_OFFSET] = 1 if pago else 0
+        self._commit([], self._count)
+        if old is not None:
+            self.events.publish([(old, {**old, "pago": pago})])
+
+    @exclusive
+    def update(self, transaction: Transaction):
+        """
+        Atualiza uma transação existente com base no ID.
+
+        Args:
+            transaction (Transaction): Transação com os dados atualizados.
+
+        Raises:
+            ValueError: Caso a transação não seja encontrada.
+        """
+        if self.update_many([transaction]).skipped:
+            raise ValueError(f'Transaction with ID {transaction.id} not found.')
+
+    @exclusive
+    def update_many(self, transactions: Iterable[Transaction]) -> BulkResult:
+        """
+        Atualiza várias transações regravando apenas os seus registros, no mesmo lugar.
+        Textos alterados são acrescentados ao heap; os inalterados mantêm a posição.
+        Se um ID se repetir no lote, a última ocorrência prevalece.
+
+        Args:
+            transactions (Iterable[Transaction]): Transações com os dados atualizados.
+
+        Returns:
+            BulkResult: IDs atualizados (applied) e IDs não encontrados (skipped).
+        """
+        self._refresh()
+        result = BulkResult()
+        changes = []
+        pending = {}  # Posição -> valores (repetições no lote substituem a anterior)
+        for transaction in transactions:
+            slot = self._index.get(transaction.id.bytes)
+            if slot is None:
+                result.skipped.append(transaction.id)
+                continue
+            old = pending.get(slot) or self._values_at(slot)
+            record = transaction.to_dict()
+            if self.events:
+                changes.append((self._to_dict(old), record))
+            pending[slot] = self._to_values(record, old)
+            result.applied.append(transaction.id)
+        if pending:
+            self._commit(list(pending.items()), self._count)
+        self.events.publish(changes)
+        return result
@@ -0,0 +1,548 @@
+import json
+import os
+from datetime import date
+from operator import itemgetter
+from typing import Iterable, Iterator
+from uuid import UUID
+from finance_app.core.models.transaction import Transaction
+from finance_app.core.repositories.bulk_result import BulkResult
+from finance_app.core.repositories.events import RepositoryEvents
+from finance_app.core.repositories.file_storage import FileLock, atomic_open, exclusive, file_signature
+from finance_app.core.repositories.instrumentation import MetricsSink, instrument
+from finance_app.core.repositories.serializers import file_serializer, get_serializer, iter_records, load_records
+from finance_app.core.repositories.transaction_queries import TransactionQueries
+from finance_app.core.repositories.transaction_repository import DATE_FIELDS, JsonMigration
+
+# Versão do formato do manifesto
+MANIFEST_FORMAT = 1
+
+
+def segment_key(record: dict) -> str:
+    """
+    Retorna o segmento de uma transação: o ano-mês ("AAAA-MM") da data da transação.
+    """
+    return record["data_transacao"][:7]
+
+
+class PartitionedTransactionRepository(TransactionQueries, JsonMigration):
+    """
+    Repositório de transações particionado por mês: um arquivo (segmento) por ano-mês da data da
+    transação e um manifesto com os segmentos existentes.
+    Possui os mesmos métodos públicos do TransactionRepository (JSON).
+
+    - <directory>/manifest.json: para cada segmento, número de transações, geração da última gravação
+      e intervalo das datas de efetivação (usado para descartar segmentos nas consultas por data_efetivacao)
+    - <directory>/<AAAA-MM>.seg: transações do mês, no formato configurado
+    - <directory>/<AAAA-MM>.ids: IDs das transações do segmento e a geração em que foram gravados
+
+    Alterações regravam apenas os segmentos afetados e o manifesto (gravado por último: um segmento
+    novo só passa a existir quando o manifesto é gravado). list_by_month e list_by_period abrem apenas
+    os segmentos que podem conter transações do período.
+
+    O índice ID -> segmento (usado por add, get_by_id, update e delete) é montado na primeira utilização
+    a partir dos arquivos .ids, sem ler os segmentos (um segmento só é lido se o seu .ids não existir ou
+    for de outra geração), e depois mantido de forma incremental: quando outro processo altera o
+    repositório, apenas os segmentos com geração diferente no manifesto são reindexados.
+    list_all segue a ordem dos meses e, dentro de cada mês, a ordem de inserção.
+    """
+
+    def __init__(self, directory="finance_app/data/transactions", file_format: str | None = None,
+                 metrics: MetricsSink | None = None):
+        """
+        Inicializa o repositório, criando o diretório se necessário.
+
+        Args:
+            directory (str): Diretório dos segmentos e do manifesto.
+            file_format (str | None): Formato dos segmentos: "json" (compacto), "json-indent" ou "binary".
+                Se None (padrão), cada segmento existente mantém o seu formato ("json" para segmentos novos).
+                Na leitura o formato é detectado automaticamente.
+            metrics (MetricsSink | None): Se informado, mede cada chamada aos métodos públicos
+                (ver instrumentation.instrument).
+        """
+        self._directory = directory
+        self._manifest_path = os.path.join(directory, "manifest.json")
+        self._serializer = get_serializer(file_format) if file_format is not None else None
+        os.makedirs(directory, exist_ok=True)
+        self.events = RepositoryEvents()  # Ouvintes notificados a cada add/update/delete
+        self._lock = FileLock(self._manifest_path)  # Serializa leitura-alteração-gravação entre processos
+        self._manifest = None  # Manifesto em memória (None: ainda não lido)
+        self._manifest_signature = None  # Assinatura do manifesto quando foi lido
+        self._ids = None  # ID (str) -> segmento (None: índice ainda não montado)
+        self._segment_ids = {}  # Segmento -> IDs indexados
+        self._indexed = {}  # Segmento -> geração indexada
+        self._instrumentation = None  # Instrumentação instalada (ver instrumentation.instrument)
+        if metrics is not None:
+            instrument(self, metrics)
+
+    def _count(self, **counters):
+        """
+        Soma contadores (bytes_read, bytes_written, rows_scanned) à chamada instrumentada em andamento.
+        """
+        if self._instrumentation is not None:
+            self._instrumentation.add(**counters)
+
+    def _segment_path(self, key: str) -> str:
+        """
+        Retorna o caminho do arquivo de um segmento.
+        """
+        return os.path.join(self._directory, f"{key}.seg")
+
+    def _ids_path(self, key: str) -> str:
+        """
+        Retorna o caminho do arquivo com os IDs de um segmento.
+        """
+        return os.path.join(self._directory, f"{key}.ids")
+
+    # ---------- Manifesto e índice ----------
+
+    def _refresh(self):
+        """
+        Relê o manifesto se ele mudou desde a última leitura (ex: gravação de outro processo)
+        e atualiza o índice de IDs apenas dos segmentos alterados.
+        """
+        signature = file_signature(self._manifest_path)
+        if self._manifest is not None and signature == self._manifest_signature:
+            return
+        self._manifest = self._read_manifest()
+        self._manifest_signature = signature
+        if self._ids is not None:
+            segments = self._manifest["segments"]
+            changed = [key for key, generation in self._indexed.items()
+                       if key not in segments or segments[key]["generation"] != generation]
+            changed += [key for key in segments if key not in self._indexed]
+            self._reindex({key: self._read_ids(key) if key in segments else () for key in changed})
+
+    def _read_manifest(self) -> dict:
+        """
+        Lê o manifesto do disco (vazio se ainda não existir).
+
+        Raises:
+            ValueError: Caso o manifesto esteja corrompido ou em um formato desconhecido.
+        """
+        try:
+            with open(self._manifest_path, "rb") as f:
+                content = f.read()
+        except FileNotFoundError:
+            return {"format": MANIFEST_FORMAT, "generation": 0, "segments": {}}
+        self._count(bytes_read=len(content))
+        try:
+            manifest = json.loads(content)
+        except ValueError as e:
+            raise ValueError(f"Corrupted manifest file: {self._manifest_path}") from e
+        if manifest.get("format") != MANIFEST_FORMAT:
+            raise ValueError(f"Unsupported manifest format: {manifest.get('format')}.")
+        return manifest
+
+    def _read_segment(self, key: str) -> list:
+        """
+        Lê as transações de um segmento, detectando seu formato.
+
+        Raises:
+            ValueError: Caso o segmento esteja corrompido.
+        """
+        path = self._segment_path(key)
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+        except FileNotFoundError:
+            return []
+        self._count(bytes_read=len(content))
+        if not content.strip():
+            return []
+        try:
+            data = load_records(content)
+        except ValueError as e:
+            raise ValueError(f"Corrupted data file: {path}") from e
+        self._count(rows_scanned=len(data))
+        return data
+
+    def _read_ids(self, key: str) -> list:
+        """
+        Lê os IDs de um segmento do seu arquivo .ids. Se o arquivo não existir, estiver corrompido ou
+        for de outra geração (ex: queda entre a gravação do segmento e a do manifesto), lê o segmento
+        e grava o .ids novamente.
+        """
+        generation = self._manifest["segments"][key]["generation"]
+        try:
+            with open(self._ids_path(key), "rb") as f:
+                content = f.read()
+            stored = json.loads(content)
+            if stored["generation"] == generation:
+                self._count(bytes_read=len(content))
+                return stored["ids"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        ids = [item["id"] for item in self._read_segment(key)]
+        self._write_ids(key, ids, generation)
+        return ids
+
+    def _write_ids(self, key: str, ids: list, generation: int):
+        """
+        Grava o arquivo .ids de um segmento.
+        """
+        content = json.dumps({"generation": generation, "ids": ids}, separators=(",", ":")).encode("utf-8")
+        with atomic_open(self._ids_path(key), "wb") as f:
+            f.write(content)
+        self._count(bytes_written=len(content))
+
+    def _index(self) -> dict:
+        """
+        Retorna o índice ID -> segmento, montando-o na primeira utilização a partir dos arquivos .ids.
+        """
+        if self._ids is None:
+            self._ids, self._segment_ids, self._indexed = {}, {}, {}
+            self._reindex({key: self._read_ids(key) for key in self._manifest["segments"]})
+        return self._ids
+
+    def _reindex(self, segments: dict):
+        """
+        Substitui no índice os IDs dos segmentos informados.
+
+        Args:
+            segments (dict): Segmento -> IDs atuais (vazio: segmento removido).
+        """
+        # Remove todos antes de adicionar: uma transação pode ter mudado de um segmento para outro
+        for key in segments:
+            for record_id in self._segment_ids.pop(key, ()):
+                if self._ids.get(record_id) == key:
+                    del self._ids[record_id]
+            self._indexed.pop(key, None)
+        entries = self._manifest["segments"]
+        for key, ids in segments.items():
+            if key not in entries:
+                continue
+            ids = self._segment_ids[key] = set(ids)
+            for record_id in ids:
+                self._ids.setdefault(record_id, key)
+            self._indexed[key] = entries[key]["generation"]
+
+    # ---------- Gravação ----------
+
+    def _touch(self, segments: dict, key: str) -> list:
+        """
+        Retorna as transações de um segmento alterado na operação em andamento, lendo-o na primeira vez.
+        """
+        if key not in segments:
+            segments[key] = self._read_segment(key) if key in self._manifest["segments"] else []
+        return segments[key]
+
+    def _write_segment(self, key: str, data: list, generation: int, entries: dict):
+        """
+        Grava um segmento e o seu arquivo .ids e registra a nova entrada em 'entries'.
+        """
+        serializer = self._serializer or file_serializer(self._segment_path(key))
+        with atomic_open(self._segment_path(key), "wb") as f:
+            serializer.dump(data, f)
+            self._count(bytes_written=f.tell())
+        self._write_ids(key, [item["id"] for item in data], generation)
+        dates = [item["data_efetivacao"] for item in data]
+        entries[key] = {"count": len(data), "generation": generation, "data_efetivacao": [min(dates), max(dates)]}
+
+    def _write_manifest(self, generation: int, entries: dict) -> dict:
+        """
+        Grava o manifesto com as entradas informadas.
+        """
+        manifest = {"format": MANIFEST_FORMAT, "generation": generation, "segments": dict(sorted(entries.items()))}
+        content = json.dumps(manifest, separators=(",", ":")).encode("utf-8")
+        with atomic_open(self._manifest_path, "wb") as f:
+            f.write(content)
+        self._count(bytes_written=len(content))
+        return manifest
+
+    def _commit(self, segments: dict):
+        """
+        Grava os segmentos alterados e, por último, o manifesto.
+        Segmentos que ganham transações são gravados antes dos que perdem; se algum deles ainda não
+        existia no manifesto, um manifesto intermediário que já o inclui é gravado antes de regravar os
+        que perdem. Assim, uma queda durante a mudança de mês de uma transação pode deixá-la duplicada,
+        mas nunca a perde.
+
+        Args:
+            segments (dict): Segmento -> lista completa de transações (lista vazia: segmento removido).
+        """
+        entries = dict(self._manifest["segments"])
+        generation = self._manifest["generation"] + 1
+        growing = [key for key, data in segments.items()
+                   if data and len(data) >= entries.get(key, {}).get("count", 0)]
+        shrinking = [key for key in segments if key not in growing]
+        try:
+            for key in growing:
+                self._write_segment(key, segments[key], generation, entries)
+            if shrinking and any(key not in self._manifest["segments"] for key in growing):
+                self._write_manifest(generation, entries)
+            for key in shrinking:
+                if segments[key]:
+                    self._write_segment(key, segments[key], generation, entries)
+                else:
+                    entries.pop(key, None)
+            manifest = self._write_manifest(generation, entries)
+        except Exception:
+            # Os segmentos podem ter sido gravados antes da falha: força a releitura do manifesto e do índice
+            self._manifest = None
+            self._ids = None
+            raise
+        self._manifest = manifest
+        self._manifest_signature = file_signature(self._manifest_path)
+        for key, data in segments.items():
+            if not data:
+                for path in (self._segment_path(key), self._ids_path(key)):
+                    if os.path.exists(path):
+                        os.remove(path)
+        if self._ids is not None:
+            self._reindex({key: [item["id"] for item in data] for key, data in segments.items()})
+
+    @exclusive
+    def add(self, transaction: Transaction):
+        """
+        Adiciona uma nova transação ao repositório, regravando apenas o segmento do seu mês.
+
+        Args:
+            transaction (Transaction): A transação a ser adicionada.
+
+        Raises:
+            ValueError: Caso já exista uma transação com o mesmo ID.
+        """
+        if self.add_many([transaction]).skipped:
+            raise ValueError(f'Transaction with ID {transaction.id} already exists.')
+
+    @exclusive
+    def add_many(self, transactions: Iterable[Transaction]) -> BulkResult:
+        """
+        Adiciona várias transações, regravando uma única vez cada segmento afetado.
+        Transações cujo ID já existe no repositório (ou que se repetem no lote) são ignoradas.
+
+        Args:
+            transactions (Iterable[Transaction]): Transações a serem adicionadas.
+
+        Returns:
+            BulkResult: IDs adicionados (applied) e IDs ignorados por duplicidade (skipped).
+        """
+        self._refresh()
+        known = self._index()
+        result = BulkResult()
+        segments = {}
+        records = []
+        seen = set()
+
+        for transaction in transactions:
+            record_id = str(transaction.id)
+            if record_id in known or record_id in seen:
+                result.skipped.append(transaction.id)
+                continue
+            seen.add(record_id)
+            record = transaction.to_dict()
+            self._touch(segments, segment_key(record)).append(record)
+            records.append(record)
+            result.applied.append(transaction.id)
+
+        if records:
+            self._commit(segments)
+            self.events.publish([(None, record) for record in records])
+        return result
+
+    @exclusive
+    def delete(self, transaction: Transaction):
+        """
+        Remove uma transação existente com base no seu ID.
+
+        Args:
+            transaction (Transaction): A transação a ser removida.
+        """
+        self.delete_many([transaction])
+
+    @exclusive
+    def delete_many(self, items: Iterable[Transaction | UUID]) -> BulkResult:
+        """
+        Remove várias transações, regravando uma única vez cada segmento afetado.
+
+        Args:
+            items (Iterable[Transaction | UUID]): Transações (ou seus IDs) a serem removidas.
+
+        Returns:
+            BulkResult: IDs removidos (applied) e IDs não encontrados ou repetidos no lote (skipped).
+        """
+        self._refresh()
+        known = self._index()
+        result = BulkResult()
+        to_delete = {}  # Segmento -> IDs removidos
+
+        for item in items:
+            item_id = item.id if isinstance(item, Transaction) else item
+            record_id = str(item_id)
+            key = known.get(record_id)
+            if key is None or record_id in to_delete.get(key, ()):
+                result.skipped.append(item_id)
+                continue
+            to_delete.setdefault(key, set()).add(record_id)
+            result.applied.append(item_id)
+
+        if to_delete:
+            segments = {}
+            removed = []
+            for key, ids in to_delete.items():
+                data = self._read_segment(key)
+                removed.extend(item for item in data if item["id"] in ids)
+                segments[key] = [item for item in data if item["id"] not in ids]
+            self._commit(segments)
+            self.events.publish([(item, None) for item in removed])
+        return result
+
+    @exclusive
+    def update(self, transaction: Transaction):
+        """
+        Atualiza uma transação existente com base no ID.
+
+        Args:
+            transaction (Transaction): Transação com os dados atualizados.
+
+        Raises:
+            ValueError: Caso a transação não seja encontrada.
+        """
+        if self.update_many([transaction]).skipped:
+            raise ValueError(f'Transaction with ID {transaction.id} not found.')
+
+    @exclusive
+    def update_many(self, transactions: Iterable[Transaction]) -> BulkResult:
+        """
+        Atualiza várias transações, regravando uma única vez cada segmento afetado.
+        Uma transação cuja data mudou de mês sai do segmento antigo e vai para o fim do novo.
+        Se um ID se repetir no lote, a última ocorrência prevalece.
+
+        Args:
+            transactions (Iterable[Transaction]): Transações com os dados atualizados.
+
+        Returns:
+            BulkResult: IDs atualizados (applied) e IDs não encontrados (skipped).
+        """
+        self._refresh()
+        known = self._index()
+        result = BulkResult()
+        segments = {}
+        positions = {}  # Segmento -> {ID: posição na lista do segmento}
+        current = {}  # ID -> segmento após as alterações anteriores do lote
+        changes = []
+
+        for transaction in transactions:
+            record_id = str(transaction.id)
+            key = current.get(record_id) or known.get(record_id)
+            if key is None:
+                result.skipped.append(transaction.id)
+                continue
+            record = transaction.to_dict()
+            new_key = segment_key(record)
+            pos = self._positions(segments, positions, key)[record_id]
+            old = segments[key][pos]
+            if new_key == key:
+                segments[key][pos] = record
+            else:
+                # Marca a posição antiga (removida ao final) para não deslocar as demais
+                segments[key][pos] = None
+                del positions[key][record_id]
+                target = self._positions(segments, positions, new_key)
+                target[record_id] = len(segments[new_key])
+                segments[new_key].append(record)
+            current[record_id] = new_key
+            changes.append((old, record))
+            result.applied.append(transaction.id)
+
+        if changes:
+            self._commit({key: [item for item in data if item is not None] for key, data in segments.items()})
+            self.events.publish(changes)
+        return result
+
+    def _positions(self, segments: dict, positions: dict, key: str) -> dict:
+        """
+        Retorna o mapa ID -> posição de um segmento alterado na operação em andamento.
+        """
+        if key not in positions:
+            positions[key] = {}
+            for pos, item in enumerate(self._touch(segments, key)):
+                positions[key].setdefault(item["id"], pos)
+        return positions[key]
+
+    # ---------- Leitura ----------
+
+    def get_by_id(self, id: UUID) -> Transaction | None:
+        """
+        Recupera uma transação pelo seu ID, lendo apenas o segmento que a contém.
+
+        Args:
+            id (UUID): ID da transação.
+
+        Returns:
+            Transaction | None: A transação correspondente, ou None se não encontrada.
+        """
+        record_id = str(id)
+        with self._lock.shared():
+            self._refresh()
+            key = self._index().get(record_id)
+            data = self._read_segment(key) if key is not None else []
+        for item in data:
+            if item["id"] == record_id:
+                return Transaction.from_dict(item)
+        return None
+
+    def iter_all(self, chunk_size: int = 64 * 1024) -> Iterator[dict]:
+        """
+        Percorre todas as transações, um segmento por vez, sem carregar todos em memória.
+
+        Args:
+            chunk_size (int): Quantidade de caracteres (JSON) ou bytes (binário) lidos do arquivo por vez.
+
+        Yields:
+            dict: Cada transação (formato de dicionário), na mesma ordem de list_all.
+        """
+        # Sob a trava, abre todos os segmentos; depois a leitura segue sem trava, pois uma
+        # gravação atômica substitui o arquivo sem alterar o que já está aberto
+        files = []
+        try:
+            with self._lock.shared():
+                self._refresh()
+                for key in self._manifest["segments"]:
+                    files.append(open(self._segment_path(key), "rb"))
+            for f in files:
+                yield from iter_records(f, chunk_size)
+        finally:
+            for f in files:
+                f.close()
+
+    def list_all(self) -> list:
+        """
+        Lista todas as transações armazenadas no repositório, mês a mês.
+
+        Returns:
+            list: Lista de transações (formato de dicionários).
+        """
+        with self._lock.shared():
+            self._refresh()
+            return [item for key in self._manifest["segments"] for item in self._read_segment(key)]
+
+    def list_by_period(self, start: date, end: date, field: str = "data_transacao") -> list:
+        """
+        Lista transações com a data escolhida dentro do intervalo [start, end], ordenadas por essa data.
+        Lê apenas os segmentos que podem conter transações do período: pelo mês do segmento
+        (data_transacao) ou pelo intervalo de datas de efetivação registrado no manifesto (data_efetivacao).
+
+        Args:
+            start (date): Data inicial (inclusiva).
+            end (date): Data final (inclusiva).
+            field (str): Campo de data usado no filtro: "data_transacao" ou "data_efetivacao".
+
+        Returns:
+            list: Lista de transações no período especificado.
+
+        Raises:
+            ValueError: Caso o campo de data seja inválido.
+        """
+        if field not in DATE_FIELDS:
+            raise ValueError(f"Invalid date field: {field}. Use one of {DATE_FIELDS}.")
+        start_iso, end_iso = start.isoformat(), end.isoformat()
+        with self._lock.shared():
+            self._refresh()
+            if field == "data_transacao":
+                keys = [key for key in self._manifest["segments"] if start_iso[:7] <= key <= end_iso[:7]]
+            else:
+                keys = [key for key, info in self._manifest["segments"].items()
+                        if info["data_efetivacao"][0] <= end_iso and start_iso <= info["data_efetivacao"][1]]
+            data = [item for key in keys for item in self._read_segment(key) if start_iso <= item[field] <= end_iso]
+        return sorted(data, key=itemgetter(field))
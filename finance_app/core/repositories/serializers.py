@@ -0,0 +1,302 @@
+import io
+import json
+import struct
+from typing import BinaryIO, Iterator
+from finance_app.core.repositories.file_storage import FileLock, atomic_open
+from finance_app.core.repositories.json_stream import iter_json_array
+
+# Assinatura no início dos arquivos binários (usada na detecção automática do formato)
+MAGIC = b"FAPBIN\x00\x01"
+# Tamanho da tabela de textos, tamanho da tabela de layouts e número de blocos de registros
+_HEADER = struct.Struct("<III")
+# Layout e quantidade de registros de um bloco
+_RUN = struct.Struct("<II")
+# Tipo do valor -> código struct (textos são gravados como índices na tabela de textos)
+_CODES = {"s": "I", "i": "q", "f": "d", "b": "?", "n": "?"}
+
+
+class JsonSerializer:
+    """
+    Serializa os registros como um array JSON em UTF-8.
+    Sem indentação (padrão) o arquivo fica com cerca de metade do tamanho e é gravado/lido mais rápido.
+    """
+
+    def __init__(self, indent: int | None = None):
+        """
+        Args:
+            indent (int | None): Indentação do JSON; None gera o formato compacto.
+        """
+        self._indent = indent
+
+    def dump(self, records: list, f: BinaryIO):
+        """
+        Grava os registros em um arquivo aberto em modo binário.
+        """
+        separators = (",", ":") if self._indent is None else None
+        f.write(json.dumps(records, indent=self._indent, separators=separators, ensure_ascii=False).encode("utf-8"))
+
+    def loads(self, content: bytes) -> list:
+        """
+        Decodifica o conteúdo de um arquivo.
+
+        Raises:
+            ValueError: Caso o conteúdo não seja JSON válido.
+        """
+        return json.loads(content)
+
+    def iter_load(self, f: BinaryIO, chunk_size: int = 64 * 1024) -> Iterator[dict]:
+        """
+        Percorre os registros de um arquivo aberto em modo binário, decodificando-o em blocos.
+        O arquivo é fechado ao final.
+        """
+        return iter_json_array(io.TextIOWrapper(f, encoding="utf-8"), chunk_size)
+
+
+class BinarySerializer:
+    """
+    Formato binário compacto, implementado apenas com a biblioteca padrão (struct):
+    - cabeçalho com a assinatura MAGIC
+    - tabela de textos: cada texto distinto aparece uma única vez e os registros guardam seu índice
+      (contas, categorias e datas se repetem muito)
+    - tabela de layouts: chaves e tipos dos campos de cada formato de registro
+    - blocos de registros consecutivos com o mesmo layout, empacotados com um struct de tamanho fixo
+      (ex: valores como double de 8 bytes, booleanos como 1 byte)
+    Aceita registros planos com valores str, int, float, bool ou None.
+    """
+
+    def dump(self, records: list, f: BinaryIO):
+        """
+        Grava os registros em um arquivo aberto em modo binário.
+
+        Raises:
+            ValueError: Caso algum valor não seja de um tipo suportado.
+        """
+        strings = {}  # Texto -> índice na tabela
+        layouts = {}  # (chaves, tipos) -> índice do layout
+        runs = []  # [índice do layout, linhas]
+
+        for record in records:
+            kinds = "".join(map(_kind, record.values()))
+            layout_key = (tuple(record), kinds)
+            layout = layouts.get(layout_key)
+            if layout is None:
+                layout = layouts[layout_key] = len(layouts)
+            row = []
+            for value, kind in zip(record.values(), kinds):
+                if kind == "s":
+                    index = strings.get(value)
+                    if index is None:
+                        index = strings[value] = len(strings)
+                    row.append(index)
+                elif kind == "n":
+                    row.append(False)
+                else:
+                    row.append(value)
+            if runs and runs[-1][0] == layout:
+                runs[-1][1].append(row)
+            else:
+                runs.append([layout, [row]])
+
+        # As tabelas são arrays JSON: o decodificador em C é mais rápido que ler texto a texto
+        string_table = json.dumps(list(strings), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        layout_table = json.dumps([[list(keys), kinds] for keys, kinds in layouts],
+                                  ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        structs = [_struct(kinds) for _, kinds in layouts]
+
+        f.write(MAGIC)
+        f.write(_HEADER.pack(len(string_table), len(layout_table), len(runs)))
+        f.write(string_table)
+        f.write(layout_table)
+        for layout, rows in runs:
+            pack = structs[layout].pack
+            f.write(_RUN.pack(layout, len(rows)))
+            try:
+                f.write(b"".join([pack(*row) for row in rows]))
+            except struct.error as e:
+                raise ValueError(f"Value out of range for the binary format: {e}") from e
+
+    def loads(self, content: bytes) -> list:
+        """
+        Decodifica o conteúdo de um arquivo.
+
+        Raises:
+            ValueError: Caso o conteúdo não seja um arquivo binário válido.
+        """
+        return list(self.iter_load(io.BytesIO(content)))
+
+    def iter_load(self, f: BinaryIO, chunk_size: int = 64 * 1024) -> Iterator[dict]:
+        """
+        Percorre os registros de um arquivo aberto em modo binário, lendo os blocos de registros
+        aos poucos (as tabelas de textos e layouts são carregadas por inteiro). O arquivo é fechado ao final.
+
+        Raises:
+            ValueError: Caso o conteúdo não seja um arquivo binário válido.
+        """
+        with f:
+            try:
+                if f.read(len(MAGIC)) != MAGIC:
+                    raise ValueError("Not a binary data file.")
+                string_size, layout_size, run_count = _HEADER.unpack(_read_exact(f, _HEADER.size))
+                strings = json.loads(_read_exact(f, string_size))
+                layouts = []
+                for keys, kinds in json.loads(_read_exact(f, layout_size)):
+                    layouts.append((keys, _struct(kinds),
+                                    [i for i, kind in enumerate(kinds) if kind == "s"],
+                                    [i for i, kind in enumerate(kinds) if kind == "n"]))
+
+                for _ in range(run_count):
+                    layout, count = _RUN.unpack(_read_exact(f, _RUN.size))
+                    keys, row_struct, text_columns, none_columns = layouts[layout]
+                    if row_struct.size == 0:
+                        # Registros sem campos
+                        for _ in range(count):
+                            yield {}
+                        continue
+                    per_chunk = max(1, chunk_size // row_struct.size)
+                    while count:
+                        rows = min(count, per_chunk)
+                        count -= rows
+                        for row in row_struct.iter_unpack(_read_exact(f, rows * row_struct.size)):
+                            values = list(row)
+                            for i in text_columns:
+                                values[i] = strings[values[i]]
+                            for i in none_columns:
+                                values[i] = None
+                            yield dict(zip(keys, values))
+            except (struct.error, IndexError, TypeError) as e:
+                raise ValueError(f"Invalid binary data file: {e}") from e
+
+
+def _kind(value) -> str:
+    """
+    Retorna o tipo de um valor no formato binário.
+    """
+    if value is None:
+        return "n"
+    kind = type(value)
+    if kind is str:
+        return "s"
+    if kind is bool:
+        return "b"
+    if kind is int:
+        return "i"
+    if kind is float:
+        return "f"
+    raise ValueError(f"Unsupported value type for the binary format: {kind.__name__}")
+
+
+def _struct(kinds: str) -> struct.Struct:
+    """
+    Retorna o struct que empacota uma linha com os tipos informados (sem alinhamento).
+    """
+    return struct.Struct("<" + "".join(map(_CODES.__getitem__, kinds)))
+
+
+def _read_exact(f: BinaryIO, size: int) -> bytes:
+    """
+    Lê exatamente 'size' bytes do arquivo.
+
+    Raises:
+        ValueError: Caso o arquivo termine antes (arquivo truncado).
+    """
+    data = f.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated binary data file.")
+    return data
+
+
+# Formatos disponíveis para os arquivos dos repositórios
+SERIALIZERS = {
+    "json": JsonSerializer(),
+    "json-indent": JsonSerializer(indent=4),
+    "binary": BinarySerializer(),
+}
+
+
+def get_serializer(file_format: str):
+    """
+    Retorna o serializador de um formato.
+
+    Args:
+        file_format (str): Nome do formato ("json", "json-indent" ou "binary").
+
+    Raises:
+        ValueError: Caso o formato não exista.
+    """
+    try:
+        return SERIALIZERS[file_format]
+    except KeyError:
+        raise ValueError(f"Invalid file format: {file_format}. Use one of {tuple(SERIALIZERS)}.") from None
+
+
+def detect(head: bytes):
+    """
+    Detecta o formato de um arquivo a partir dos seus primeiros bytes.
+    Qualquer conteúdo sem a assinatura binária é tratado como JSON (com ou sem indentação).
+    """
+    return SERIALIZERS["binary"] if head.startswith(MAGIC) else SERIALIZERS["json"]
+
+
+def file_serializer(filepath: str, file_format: str | None = None):
+    """
+    Retorna o serializador usado nas gravações de um arquivo de dados.
+    Sem formato informado, mantém o formato do arquivo existente (detectado pelos primeiros bytes),
+    para que um arquivo binário não seja regravado em JSON nem um JSON indentado (o formato original
+    dos repositórios) seja regravado compacto; arquivos novos, vazios ou com lista vazia usam "json".
+
+    Args:
+        filepath (str): Caminho do arquivo de dados.
+        file_format (str | None): Formato de gravação ("json", "json-indent" ou "binary"), ou None.
+
+    Raises:
+        ValueError: Caso o formato não exista.
+    """
+    if file_format is not None:
+        return get_serializer(file_format)
+    try:
+        with open(filepath, "rb") as f:
+            head = f.read(len(MAGIC))
+    except FileNotFoundError:
+        return SERIALIZERS["json"]
+    if head.startswith((b"[\n", b"[\r\n")):
+        # JSON indentado: quebra a linha logo após o "[" (o compacto começa com "[{")
+        return SERIALIZERS["json-indent"]
+    return detect(head)
+
+
+def load_records(content: bytes) -> list:
+    """
+    Decodifica o conteúdo de um arquivo de dados, detectando o formato automaticamente.
+
+    Raises:
+        ValueError: Caso o conteúdo seja inválido para o formato detectado.
+    """
+    return detect(content).loads(content)
+
+
+def iter_records(f: BinaryIO, chunk_size: int = 64 * 1024) -> Iterator[dict]:
+    """
+    Percorre os registros de um arquivo aberto em modo binário, detectando o formato automaticamente.
+    O arquivo é fechado ao final.
+    """
+    head = f.read(len(MAGIC))
+    f.seek(0)
+    return detect(head).iter_load(f, chunk_size)
+
+
+def convert_file(filepath: str, file_format: str):
+    """
+    Converte um arquivo de dados existente para outro formato (gravação atômica, sob a trava do arquivo).
+    Repositórios que abrirem o arquivo depois devem usar o mesmo formato para mantê-lo nas próximas gravações.
+
+    Args:
+        filepath (str): Caminho do arquivo de dados.
+        file_format (str): Formato de destino ("json", "json-indent" ou "binary").
+    """
+    serializer = get_serializer(file_format)
+    with FileLock(filepath).exclusive():
+        with open(filepath, "rb") as f:
+            content = f.read()
+        records = load_records(content) if content.strip() else []
+        with atomic_open(filepath, "wb") as f:
+            serializer.dump(records, f)
@@ -0,0 +1,345 @@
+import sqlite3
+import threading
+from datetime import date
+from typing import Iterable, Iterator
+from uuid import UUID
+from finance_app.core.models.transaction import Transaction
+from finance_app.core.repositories.bulk_result import BulkResult
+from finance_app.core.repositories.events import RepositoryEvents
+from finance_app.core.repositories.transaction_queries import TransactionQueries
+from finance_app.core.repositories.transaction_repository import DATE_FIELDS, JsonMigration
+
+# Colunas na mesma ordem de Transaction.to_dict()
+_COLUMNS = (
+    "id", "descricao", "data_transacao", "data_efetivacao", "valor", "conta", "cartao",
+    "categoria_n1", "categoria_n2", "categoria_n3", "pago",
+)
+
+_TABLE = """
+CREATE TABLE IF NOT EXISTS transactions (
+    id TEXT PRIMARY KEY,
+    descricao TEXT NOT NULL,
+    data_transacao TEXT NOT NULL,
+    data_efetivacao TEXT NOT NULL,
+    valor INTEGER NOT NULL, -- Centavos (ponto fixo): somas no banco não acumulam erro de ponto flutuante
+    conta TEXT NOT NULL,
+    cartao TEXT NOT NULL,
+    categoria_n1 TEXT NOT NULL,
+    categoria_n2 TEXT NOT NULL,
+    categoria_n3 TEXT NOT NULL,
+    pago INTEGER NOT NULL
+);
+"""
+
+_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_transactions_data_transacao ON transactions (data_transacao);
+CREATE INDEX IF NOT EXISTS idx_transactions_data_efetivacao ON transactions (data_efetivacao);
+CREATE INDEX IF NOT EXISTS idx_transactions_conta ON transactions (conta);
+CREATE INDEX IF NOT EXISTS idx_transactions_cartao ON transactions (cartao);
+CREATE INDEX IF NOT EXISTS idx_transactions_categoria_n1 ON transactions (categoria_n1);
+CREATE INDEX IF NOT EXISTS idx_transactions_categoria_n2 ON transactions (categoria_n2);
+CREATE INDEX IF NOT EXISTS idx_transactions_categoria_n3 ON transactions (categoria_n3);
+"""
+
+# Bancos criados com valor REAL (reais em ponto flutuante): recria a tabela com valor em centavos,
+# mantendo a ordem de inserção (rowid)
+_MIGRATE_CENTS = f"""
+BEGIN;
+ALTER TABLE transactions RENAME TO transactions_real;
+{_TABLE}
+INSERT INTO transactions ({', '.join(_COLUMNS)})
+    SELECT {', '.join('CAST(ROUND(valor * 100) AS INTEGER)' if c == 'valor' else c for c in _COLUMNS)}
+    FROM transactions_real ORDER BY rowid;
+DROP TABLE transactions_real;
+COMMIT;
+"""
+
+# Comandos fixos e parametrizados: o módulo sqlite3 mantém os statements preparados em cache
+_SELECT = f"SELECT {', '.join(_COLUMNS)} FROM transactions"
+# ON CONFLICT(id) ignora apenas IDs repetidos; violações de NOT NULL continuam gerando erro
+_INSERT = (f"INSERT INTO transactions ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' for _ in _COLUMNS)}) "
+           "ON CONFLICT(id) DO NOTHING")
+_UPDATE = f"UPDATE transactions SET {', '.join(f'{c} = ?' for c in _COLUMNS[1:])} WHERE id = ?"
+_DELETE = "DELETE FROM transactions WHERE id = ?"
+
+# Linhas lidas do cursor por vez em iter_all
+_FETCH_SIZE = 1024
+
+
+class SQLiteTransactionRepository(TransactionQueries, JsonMigration):
+    """
+    Repositório baseado em SQLite para persistência de transações.
+    Possui os mesmos métodos públicos do TransactionRepository (JSON), com consultas por
+    período resolvidas por índices em vez da leitura do arquivo inteiro. Os valores são gravados
+    em centavos (INTEGER) e convertidos de volta para reais na leitura.
+
+    A conexão pode ser usada a partir de várias threads (ex: AsyncTransactionRepository): cada acesso
+    a ela é serializado por uma trava.
+    """
+
+    def __init__(self, filepath="finance_app/data/transaction.db"):
+        """
+        Inicializa o repositório, criando o esquema e os índices se necessário.
+
+        Args:
+            filepath (str): Caminho do banco SQLite que armazena as transações.
+        """
+        self._filepath = filepath
+        self.events = RepositoryEvents()  # Ouvintes notificados a cada add/update/delete
+        self._lock = threading.Lock()  # Serializa o uso da conexão entre threads
+        self._conn = sqlite3.connect(filepath, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_TABLE)
+        columns = {row[1]: row[2] for row in self._conn.execute("PRAGMA table_info(transactions)")}
+        if columns["valor"] == "REAL":
+            self._conn.executescript(_MIGRATE_CENTS)
+        self._conn.executescript(_INDEXES)
+
+    def close(self):
+        """
+        Fecha a conexão com o banco.
+        """
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _to_row(record: dict) -> tuple:
+        """
+        Converte o dicionário de uma transação em uma tupla na ordem das colunas (valor em centavos).
+        """
+        row = [record[column] for column in _COLUMNS]
+        row[4] = round(row[4] * 100)
+        return tuple(row)
+
+    @staticmethod
+    def _to_dict(row: tuple) -> dict:
+        """
+        Converte uma linha do banco no mesmo dicionário gerado por Transaction.to_dict().
+        """
+        record = dict(zip(_COLUMNS, row))
+        record["valor"] = record["valor"] / 100
+        record["pago"] = bool(record["pago"])
+        return record
+
+    def _insert(self, records: Iterable[dict]) -> BulkResult:
+        """
+        Insere registros em uma única transação do banco, ignorando IDs já existentes.
+
+        Args:
+            records (Iterable[dict]): Transações no formato de dicionários.
+
+        Returns:
+            BulkResult: IDs inseridos (applied) e IDs ignorados por duplicidade (skipped).
+
+        Raises:
+            ValueError: Caso algum registro seja inválido (ex: campo nulo); nenhum registro é inserido.
+        """
+        result = BulkResult()
+        changes = []
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
+            for position, record in enumerate(records):
+                try:
+                    cursor.execute(_INSERT, self._to_row(record))
+                except (KeyError, TypeError, sqlite3.IntegrityError) as e:
+                    raise ValueError(f"Invalid record at position {position}: {e!r}") from e
+                if cursor.rowcount:
+                    result.applied.append(UUID(record["id"]))
+                    changes.append((None, record))
+                else:
+                    result.skipped.append(UUID(record["id"]))
+        self.events.publish(changes)
+        return result
+
+    def _fetch(self, cursor: sqlite3.Cursor, record_id: str) -> dict | None:
+        """
+        Busca uma transação pelo ID (formato de dicionário), usando o cursor da transação em andamento.
+        """
+        row = cursor.execute(f"{_SELECT} WHERE id = ?", (record_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def add(self, transaction: Transaction):
+        """
+        Adiciona uma nova transação ao repositório.
+        Diferente do TransactionRepository (JSON), que grava o registro sem verificar o ID, o ID é
+        chave primária: um ID repetido é rejeitado, como nos repositórios mmap e particionado.
+
+        Args:
+            transaction (Transaction): A transação a ser adicionada.
+
+        Raises:
+            ValueError: Caso já exista uma transação com o mesmo ID.
+        """
+        if self._insert([transaction.to_dict()]).skipped:
+            raise ValueError(f'Transaction with ID {transaction.id} already exists.')
+
+    def add_many(self, transactions: Iterable[Transaction]) -> BulkResult:
+        """
+        Adiciona várias transações em uma única transação do banco.
+        Transações cujo ID já existe no repositório (ou que se repetem no lote) são ignoradas.
+
+        Args:
+            transactions (Iterable[Transaction]): Transações a serem adicionadas.
+
+        Returns:
+            BulkResult: IDs adicionados (applied) e IDs ignorados por duplicidade (skipped).
+        """
+        return self._insert(transaction.to_dict() for transaction in transactions)
+
+    def compact(self):
+        """
+        Incorpora o WAL ao arquivo principal do banco (checkpoint) e trunca o WAL.
+        """
+        with self._lock:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def delete(self, transaction: Transaction):
+        """
+        Remove uma transação existente com base no seu ID.
+
+        Args:
+            transaction (Transaction): A transação a ser removida.
+        """
+        self.delete_many([transaction])
+
+    def delete_many(self, items: Iterable[Transaction | UUID]) -> BulkResult:
+        """
+        Remove várias transações em uma única transação do banco.
+
+        Args:
+            items (Iterable[Transaction | UUID]): Transações (ou seus IDs) a serem removidas.
+
+        Returns:
+            BulkResult: IDs removidos (applied) e IDs não encontrados ou repetidos no lote (skipped).
+        """
+        result = BulkResult()
+        changes = []
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
+            for item in items:
+                item_id = item.id if isinstance(item, Transaction) else item
+                # Só busca o registro antigo se houver ouvintes
+                old = self._fetch(cursor, str(item_id)) if self.events else None
+                cursor.execute(_DELETE, (str(item_id),))
+                if cursor.rowcount:
+                    result.applied.append(item_id)
+                    changes.append((old, None))
+                else:
+                    result.skipped.append(item_id)
+        self.events.publish(changes)
+        return result
+
+    def get_by_id(self, id: UUID) -> Transaction | None:
+        """
+        Recupera uma transação pelo seu ID.
+
+        Args:
+            id (UUID): ID da transação.
+
+        Returns:
+            Transaction | None: A transação correspondente, ou None se não encontrada.
+        """
+        with self._lock:
+            row = self._conn.execute(f"{_SELECT} WHERE id = ?", (str(id),)).fetchone()
+        return Transaction.from_dict(self._to_dict(row)) if row else None
+
+    def iter_all(self, chunk_size: int = _FETCH_SIZE) -> Iterator[dict]:
+        """
+        Percorre todas as transações na ordem de inserção, lendo as linhas do cursor sob demanda
+        (em blocos, sem manter a trava da conexão entre um bloco e outro).
+
+        Args:
+            chunk_size (int): Quantidade de linhas lidas do cursor por vez.
+
+        Yields:
+            dict: Cada transação (formato de dicionário).
+        """
+        with self._lock:
+            cursor = self._conn.execute(f"{_SELECT} ORDER BY rowid")
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                return
+            for row in rows:
+                yield self._to_dict(row)
+
+    def list_all(self) -> list:
+        """
+        Lista todas as transações armazenadas no repositório, na ordem de inserção.
+
+        Returns:
+            list: Lista de transações (formato de dicionários).
+        """
+        with self._lock:
+            rows = self._conn.execute(f"{_SELECT} ORDER BY rowid").fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def list_by_period(self, start: date, end: date, field: str = "data_transacao") -> list:
+        """
+        Lista transações com a data escolhida dentro do intervalo [start, end], ordenadas por essa data.
+        A consulta é uma busca por intervalo no índice do campo escolhido.
+
+        Args:
+            start (date): Data inicial (inclusiva).
+            end (date): Data final (inclusiva).
+            field (str): Campo de data usado no filtro: "data_transacao" ou "data_efetivacao".
+
+        Returns:
+            list: Lista de transações no período especificado.
+
+        Raises:
+            ValueError: Caso o campo de data seja inválido.
+        """
+        if field not in DATE_FIELDS:
+            raise ValueError(f"Invalid date field: {field}. Use one of {DATE_FIELDS}.")
+        # O nome do campo vem da lista fixa acima, então pode ser interpolado com segurança
+        with self._lock:
+            rows = self._conn.execute(
+                f"{_SELECT} WHERE {field} BETWEEN ? AND ? ORDER BY {field}, rowid",
+                (start.isoformat(), end.isoformat()),
+            ).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def update(self, transaction: Transaction):
+        """
+        Atualiza uma transação existente com base no ID.
+
+        Args:
+            transaction (Transaction): Transação com os dados atualizados.
+
+        Raises:
+            ValueError: Caso a transação não seja encontrada.
+        """
+        if self.update_many([transaction]).skipped:
+            raise ValueError(f'Transaction with ID {transaction.id} not found.')
+
+    def update_many(self, transactions: Iterable[Transaction]) -> BulkResult:
+        """
+        Atualiza várias transações em uma única transação do banco.
+        Se um ID se repetir no lote, a última ocorrência prevalece.
+
+        Args:
+            transactions (Iterable[Transaction]): Transações com os dados atualizados.
+
+        Returns:
+            BulkResult: IDs atualizados (applied) e IDs não encontrados (skipped).
+        """
+        result = BulkResult()
+        changes = []
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
+            for transaction in transactions:
+                record = transaction.to_dict()
+                # Só busca o registro antigo se houver ouvintes
+                old = self._fetch(cursor, record["id"]) if self.events else None
+                row = self._to_row(record)
+                cursor.execute(_UPDATE, row[1:] + row[:1])
+                if cursor.rowcount:
+                    result.applied.append(transaction.id)
+                    changes.append((old, record))
+                else:
+                    result.skipped.append(transaction.id)
+        self.events.publish(changes)
+        return result
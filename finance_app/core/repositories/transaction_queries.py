@@ -0,0 +1,54 @@
+from calendar import monthrange
+from datetime import date
+from typing import Callable, Iterator
+from finance_app.core.models.transaction import Transaction
+from finance_app.core.models.transaction_view import TransactionView
+
+
+class TransactionQueries:
+    """
+    Consultas derivadas, iguais em todos os backends de transações (JSON, SQLite, mmap, particionado).
+    Dependem apenas dos métodos que cada backend implementa: iter_all, list_all e list_by_period.
+    """
+
+    def iter_where(self, predicate: Callable[[dict], bool], chunk_size: int | None = None) -> Iterator[dict]:
+        """
+        Percorre as transações que satisfazem um filtro, sem carregar todas em memória.
+
+        Args:
+            predicate (Callable[[dict], bool]): Filtro aplicado a cada transação (formato de dicionário).
+            chunk_size (int | None): Tamanho dos blocos lidos por iter_all; None usa o padrão do backend.
+
+        Returns:
+            Iterator[dict]: Transações que satisfazem o filtro, na mesma ordem de iter_all.
+        """
+        items = self.iter_all() if chunk_size is None else self.iter_all(chunk_size)
+        return (item for item in items if predicate(item))
+
+    def list_transactions(self, trusted: bool = False) -> list:
+        """
+        Lista todas as transações como objetos, na mesma ordem de list_all.
+
+        Args:
+            trusted (bool): Se False (padrão), cria cada Transaction com validação completa.
+                Se True, retorna TransactionView sem revalidar cada linha (os registros gravados
+                vêm de objetos Transaction).
+
+        Returns:
+            list: Lista de Transaction (estrito) ou de TransactionView (confiável).
+        """
+        records = self.list_all()
+        return TransactionView.from_dicts(records) if trusted else Transaction.from_dicts(records)
+
+    def list_by_month(self, year: int, month: int) -> list:
+        """
+        Lista transações filtradas por ano e mês (data da transação), ordenadas por data.
+
+        Args:
+            year (int): Ano desejado.
+            month (int): Mês desejado.
+
+        Returns:
+            list: Lista de transações no período especificado.
+        """
+        return self.list_by_period(date(year, month, 1), date(year, month, monthrange(year, month)[1]))
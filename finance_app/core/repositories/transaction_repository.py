@@ -1,50 +1,513 @@
 import json
+import os
 from uuid import UUID
 from finance_app.core.models.transaction import Transaction
-from datetime import datetime
+from finance_app.core.models.transaction_view import TransactionView
+from bisect import bisect_left, bisect_right
+from datetime import date
+from operator import itemgetter
+from typing import Iterable, Iterator, NamedTuple
+from finance_app.core.repositories.bulk_result import BulkResult
+from finance_app.core.repositories.events import RepositoryEvents
+from finance_app.core.repositories.file_storage import FileLock, atomic_open, exclusive, file_signature
+from finance_app.core.repositories.instrumentation import MetricsSink, instrument
+from finance_app.core.repositories.validation_stamp import ValidationStamp
+from finance_app.core.repositories.serializers import file_serializer, get_serializer, iter_records, load_records
+from finance_app.core.repositories.transaction_queries import TransactionQueries
 
-class TransactionRepository:
+# Campos de data que podem ser usados em consultas por período
+DATE_FIELDS = ("data_transacao", "data_efetivacao")
+
+
+def _replay(data: list, ops: list) -> list:
+    """
+    Aplica as operações do journal sobre a lista de transações do snapshot.
+    A aplicação é idempotente: um "add" de um ID já existente é ignorado, de modo que
+    reaplicar um log já incorporado ao snapshot (ex: queda durante a compactação) não duplica dados.
+
+    Args:
+        data (list): Lista de transações do snapshot (formato de dicionários).
+        ops (list): Operações do journal, na ordem em que foram gravadas.
+
+    Returns:
+        list: Lista de transações resultante.
+    """
+    positions = {}  # ID -> posições em 'data'
+    for pos, item in enumerate(data):
+        positions.setdefault(item["id"], []).append(pos)
+
+    for op in ops:
+        record_id = op["id"]
+        if op["op"] == "add":
+            if record_id not in positions:
+                positions[record_id] = [len(data)]
+                data.append(op["data"])
+        elif op["op"] == "update":
+            if record_id in positions:
+                data[positions[record_id][0]] = op["data"]
+        elif op["op"] == "delete":
+            for pos in positions.pop(record_id, []):
+                data[pos] = None
+
+    return [item for item in data if item is not None]
+
+
+class _LogOutcome(NamedTuple):
+    """
+    Estado final de um ID após a aplicação das operações do journal (ver _simulate_log).
+    """
+    present: bool  # Se o ID existe ao final
+    moved: bool  # Se o registro foi (re)adicionado pelo log e, portanto, vai para o fim da lista
+    record: dict | None  # Registro final vindo do log (None: mantém o do snapshot)
+    seq: int  # Posição no log do "add" efetivo (ordena os registros adicionados)
+    deleted: bool  # Se houve um "delete" efetivo (remove também duplicatas do snapshot)
+
+
+def _simulate_log(id_ops: list, present: bool) -> _LogOutcome:
+    """
+    Aplica as operações do journal de um único ID, com a mesma semântica de _replay,
+    sem precisar do snapshot em memória.
+
+    Args:
+        id_ops (list): Pares (posição no log, operação) referentes ao ID.
+        present (bool): Se o ID existe no snapshot.
+
+    Returns:
+        _LogOutcome: Estado final do ID.
+    """
+    moved, record, seq, deleted = False, None, -1, False
+    for op_seq, op in id_ops:
+        if op["op"] == "add":
+            if not present:
+                present, moved, record, seq = True, True, op["data"], op_seq
+        elif op["op"] == "update":
+            if present:
+                record = op["data"]
+        elif op["op"] == "delete":
+            if present:
+                present, deleted = False, True
+    return _LogOutcome(present, moved, record, seq, deleted)
+
+
+class TransactionRepository(TransactionQueries):
     """
     Repositório simples baseado em arquivo JSON para persistência de transações.
     Responsável por adicionar, remover, buscar e listar objetos Transaction.
     """
 
-    def __init__(self, filepath="finance_app/data/transaction.json"):
+    def __init__(self, filepath="finance_app/data/transaction.json", cache: bool = False,
+                 journal: bool = False, compact_threshold: int = 1024 * 1024, file_format: str | None = None,
+                 metrics: MetricsSink | None = None):
         """
         Inicializa o repositório com o caminho do arquivo de dados.
 
         Args:
             filepath (str): Caminho do arquivo JSON que armazena as transações.
+            cache (bool): Se True, mantém as transações em memória com um índice por ID e os índices
+                ordenados por data usados em list_by_period. O arquivo só é relido quando seu mtime/tamanho mudar.
+            journal (bool): Se True, as alterações são anexadas como linhas JSON em um log
+                ao lado do arquivo (<filepath>.log), em vez de regravar o arquivo inteiro.
+                Sem cache, o repositório mantém em memória apenas o conjunto de IDs existentes
+                (usado por update e pelos métodos em lote); com ouvintes em 'events', as escritas
+                ainda leem os dados para publicar o registro antigo.
+            compact_threshold (int): Tamanho mínimo (em bytes) do log para disparar a compactação.
+                A compactação só ocorre quando o log também passa da metade do snapshot,
+                mantendo o custo amortizado de cada escrita constante.
+            file_format (str | None): Formato usado nas gravações: "json" (compacto), "json-indent" ou "binary".
+                Se None (padrão), mantém o formato do arquivo existente ("json" para arquivos novos).
+                Na leitura o formato é detectado automaticamente.
+            metrics (MetricsSink | None): Se informado, mede cada chamada aos métodos públicos
+                (latência, bytes lidos/gravados, registros varridos/retornados). Ver instrumentation.instrument.
         """
         self._filepath = filepath
+        self._cache = cache
+        self._journal = journal
+        self._log_path = filepath + ".log"
+        self._compact_threshold = compact_threshold
+        self._serializer = get_serializer(file_format) if file_format is not None else None
+        self._cached_data = None  # Lista de dicionários em memória (modo cache)
+        self._cached_index = {}  # ID (str) -> dicionário da transação
+        self._cached_positions = {}  # ID (str) -> posição da transação em _cached_data
+        self._cached_signature = None  # Assinatura (inode, mtime_ns, tamanho) do arquivo quando foi lido
+        self._date_indexes = {}  # Campo de data -> (datas ISO ordenadas, transações na mesma ordem)
+        self._journal_ids = None  # IDs existentes (modo journal sem cache; None: ainda não lidos)
+        self._journal_ids_signature = None  # Assinatura do arquivo e do log quando os IDs foram lidos
+        self.events = RepositoryEvents()  # Ouvintes notificados a cada add/update/delete
+        self._lock = FileLock(filepath)  # Serializa leitura-alteração-gravação entre processos
+        self._stamp = ValidationStamp(filepath, (filepath, self._log_path) if journal else (filepath,))
+        self._validated_signature = None  # Assinatura do arquivo quando sua validação foi confirmada
+        self._instrumentation = None  # Instrumentação instalada (ver instrumentation.instrument)
+        if metrics is not None:
+            instrument(self, metrics)
+
+    def _count(self, **counters):
+        """
+        Soma contadores (bytes_read, bytes_written, rows_scanned) à chamada instrumentada em andamento.
+        Sem instrumentação, custa apenas a comparação com None.
+        """
+        if self._instrumentation is not None:
+            self._instrumentation.add(**counters)
+
+    def _signature(self) -> tuple | None:
+        """
+        Retorna a assinatura atual do arquivo, usada para detectar alterações externas.
+        No modo journal, a assinatura também inclui o log.
+
+        Returns:
+            tuple | None: (inode, mtime_ns, tamanho) do arquivo, ou None se ele não existir.
+        """
+        if self._journal:
+            return (file_signature(self._filepath), file_signature(self._log_path))
+        return file_signature(self._filepath)
+
+    def _set_cache(self, data: list):
+        """
+        Atualiza o cache em memória e o índice por ID com os dados fornecidos.
+
+        Args:
+            data (list): Lista de transações no formato de dicionários.
+        """
+        self._cached_data = data
+        self._index_cache()
+        self._cached_signature = self._signature()
+        self._date_indexes = {}
+
+    def _index_cache(self):
+        """
+        Reconstrói os índices por ID do cache a partir de _cached_data.
+        """
+        index = {}
+        positions = {}
+        for pos, item in enumerate(self._cached_data):
+            # Em caso de IDs repetidos, mantém a primeira ocorrência (mesmo comportamento da busca linear)
+            if item["id"] not in index:
+                index[item["id"]] = item
+                positions[item["id"]] = pos
+        self._cached_index = index
+        self._cached_positions = positions
+
+    def _invalidate_cache(self):
+        """
+        Descarta o cache em memória, forçando a releitura do arquivo no próximo acesso.
+        """
+        self._cached_data = None
+        self._cached_index = {}
+        self._cached_positions = {}
+        self._cached_signature = None
+        self._date_indexes = {}
 
     def _load(self) -> list:
         """
         Carrega e retorna a lista de transações do arquivo JSON.
+        No modo cache, só relê o arquivo se ele foi alterado desde a última leitura.
+
+        Returns:
+            list: Lista de transações no formato de dicionários.
+        """
+        with self._lock.shared():
+            if not self._cache:
+                return self._read()
+            if self._cached_data is None or self._signature() != self._cached_signature:
+                self._set_cache(self._read())
+            return self._cached_data
+
+    def _read(self) -> list:
+        """
+        Lê o arquivo JSON do disco. No modo journal, reaplica o log sobre o snapshot.
 
         Returns:
             list: Lista de transações no formato de dicionários.
         """
+        data = self._read_snapshot()
+        if self._journal:
+            data = _replay(data, self._read_log())
+        self._count(rows_scanned=len(data))
+        return data
+
+    def _read_snapshot(self) -> list:
+        """
+        Lê o arquivo principal (snapshot) do disco, detectando seu formato.
+
+        Returns:
+            list: Lista de transações no formato de dicionários.
+
+        Raises:
+            ValueError: Caso o arquivo esteja corrompido (em vez de tratá-lo como vazio e perder os dados
+                na próxima gravação).
+        """
         try:
-            with open(self._filepath, "r") as f:
-                return json.load(f)
+            with open(self._filepath, "rb") as f:
+                content = f.read()
         except FileNotFoundError:
             # Arquivo ainda não existe: retorna lista vazia
             return []
-        except json.JSONDecodeError:
-            # Arquivo corrompido ou vazio: trata como lista vazia
+        self._count(bytes_read=len(content))
+        if not content.strip():
+            # Arquivo vazio: trata como lista vazia
             return []
+        try:
+            return load_records(content)
+        except ValueError as e:
+            raise ValueError(f"Corrupted data file: {self._filepath}") from e
+
+    def _read_log(self) -> list:
+        """
+        Lê as operações do journal.
+
+        Returns:
+            list: Operações no formato {"op": ..., "id": ..., "data": ...}.
+        """
+        ops = []
+        try:
+            with open(self._log_path, "r") as f:
+                self._count(bytes_read=os.fstat(f.fileno()).st_size)
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        ops.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        # Linha final incompleta (queda durante a escrita): descarta o restante
+                        break
+        except FileNotFoundError:
+            pass
+        return ops
+
+    def _ensure_valid(self, data: list):
+        """
+        Garante que os dados carregados passaram pela validação completa (Transaction.from_dict),
+        consultando o carimbo de validação apenas quando o arquivo mudou desde a última confirmação.
+
+        Args:
+            data (list): Transações carregadas do arquivo atual.
+        """
+        signature = self._signature()
+        if signature != self._validated_signature:
+            self._stamp.ensure(data, Transaction.from_dict)
+            self._validated_signature = signature
+
+    def _still_valid(self) -> bool:
+        """
+        Retorna True se o conteúdo atual do arquivo já foi validado. Usado antes das gravações:
+        como os registros gravados vêm de objetos Transaction, o resultado continua válido.
+        """
+        return self._validated_signature is not None and self._validated_signature == self._signature()
+
+    def _append_log(self, ops: list):
+        """
+        Anexa operações ao journal, atualizando o cache em memória e compactando se necessário.
+
+        Args:
+            ops (list): Operações no formato {"op": ..., "id": ..., "data": ...}.
+        """
+        valid = self._still_valid()
+        ids_current = self._journal_ids is not None and self._journal_ids_signature == self._signature()
+        text = "".join(json.dumps(op) + "\n" for op in ops)
+        with open(self._log_path, "a") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        self._validated_signature = self._signature() if valid else None
+        if ids_current:
+            # Mesma semântica de _replay: "add" de um ID existente e "update" de um ausente não alteram o conjunto
+            for op in ops:
+                if op["op"] == "add":
+                    self._journal_ids.add(op["id"])
+                elif op["op"] == "delete":
+                    self._journal_ids.discard(op["id"])
+            self._journal_ids_signature = self._signature()
+        else:
+            self._journal_ids = None
+        # json.dumps usa apenas ASCII: caracteres e bytes coincidem
+        self._count(bytes_written=len(text))
+
+        if self._cache and self._cached_data is not None:
+            self._apply_to_cache(ops)
+            self._cached_signature = self._signature()
+
+        log_size = os.path.getsize(self._log_path)
+        snapshot_size = os.path.getsize(self._filepath) if os.path.exists(self._filepath) else 0
+        if log_size > max(self._compact_threshold, snapshot_size // 2):
+            self.compact()
 
-    def _save(self, data: list):
+    def _apply_to_cache(self, ops: list):
         """
-        Salva a lista de transações no arquivo JSON.
+        Aplica operações do journal ao cache em memória, com a mesma semântica de _replay.
+
+        Args:
+            ops (list): Operações no formato {"op": ..., "id": ..., "data": ...}.
+        """
+        deleted = set()
+        changes = []  # (antigo, novo) aplicados, para os índices de datas
+        for op in ops:
+            record_id = op["id"]
+            if op["op"] == "add":
+                if record_id not in self._cached_index:
+                    self._cached_positions[record_id] = len(self._cached_data)
+                    self._cached_data.append(op["data"])
+                    self._cached_index[record_id] = op["data"]
+                    changes.append((None, op["data"]))
+            elif op["op"] == "update":
+                pos = self._cached_positions.get(record_id)
+                if pos is not None:
+                    # Substitui (sem alterar o dicionário antigo, que pode estar com quem chamou list_all)
+                    changes.append((self._cached_data[pos], op["data"]))
+                    self._cached_data[pos] = op["data"]
+                    self._cached_index[record_id] = op["data"]
+            elif op["op"] == "delete":
+                old = self._cached_index.pop(record_id, None)
+                if old is not None:
+                    del self._cached_positions[record_id]
+                    deleted.add(record_id)
+                    changes.append((old, None))
+        self._update_date_indexes(changes)
+
+        if deleted:
+            # Uma única passada pela lista: mantém apenas o registro vigente de cada ID removido
+            # (um ID pode ter sido removido e adicionado de novo no mesmo lote)
+            index = self._cached_index
+            self._cached_data[:] = [
+                item for item in self._cached_data
+                if item["id"] not in deleted or index.get(item["id"]) is item
+            ]
+            self._index_cache()
+
+    def _save(self, data: list, changes: list | None = None):
+        """
+        Salva a lista de transações no arquivo, no formato configurado.
 
         Args:
             data (list): Lista de transações no formato de dicionários.
+            changes (list | None): Alterações (antigo, novo) que levaram o cache atual a 'data'.
+                Se informadas, os índices de datas do cache são atualizados em vez de descartados.
+        """
+        valid = self._still_valid()
+        try:
+            # Grava em arquivo temporário + fsync + rename: uma queda não trunca os dados
+            serializer = self._serializer or file_serializer(self._filepath)
+            with atomic_open(self._filepath, "wb") as f:
+                serializer.dump(data, f)
+                self._count(bytes_written=f.tell())
+            if self._journal and os.path.exists(self._log_path):
+                # O snapshot já contém todas as operações: o log pode ser descartado
+                os.remove(self._log_path)
+        except Exception:
+            # O cache pode ter sido alterado antes da falha: descarta para não divergir do disco
+            self._invalidate_cache()
+            self._validated_signature = None
+            self._journal_ids = None
+            raise
+        if self._journal and not self._cache:
+            self._journal_ids = {item["id"] for item in data}
+            self._journal_ids_signature = self._signature()
+        self._validated_signature = None
+        if valid:
+            # O arquivo já é reescrito por inteiro: atualiza também o carimbo para outros processos
+            self._stamp.write(self._stamp.digest())
+            self._validated_signature = self._signature()
+        if self._cache:
+            indexes = self._date_indexes
+            self._set_cache(data)
+            if changes is not None:
+                self._date_indexes = indexes
+                self._update_date_indexes(changes)
+
+    def _date_index(self, field: str) -> tuple:
+        """
+        Retorna o índice ordenado do cache para um campo de data, construindo-o se necessário.
+        O índice é construído na primeira consulta e depois mantido pelas gravações deste repositório
+        (ver _update_date_indexes); só é reconstruído se o arquivo for alterado por outro processo.
+
+        Args:
+            field (str): Campo de data ("data_transacao" ou "data_efetivacao").
+
+        Returns:
+            tuple: (lista de datas ISO ordenadas, lista de transações na mesma ordem).
         """
-        with open(self._filepath, "w") as f:
-            json.dump(data, f, indent=4)
+        if field not in self._date_indexes:
+            # Datas ISO (AAAA-MM-DD) ordenam como strings: não é preciso converter para date
+            items = sorted(self._cached_data, key=itemgetter(field))
+            self._date_indexes[field] = ([item[field] for item in items], items)
+        return self._date_indexes[field]
 
+    def _update_date_indexes(self, changes: list):
+        """
+        Atualiza os índices de datas já construídos com as alterações do cache, sem reordenar:
+        cada transação removida sai pela posição (busca binária pela data) e cada nova entra com
+        bisect.insort, após as de mesma data. Uma alteração que mantém a data substitui a transação
+        na mesma posição.
+
+        Args:
+            changes (list): Pares (antigo, novo) na ordem em que foram aplicados ao cache
+                (antigo None: inclusão; novo None: remoção).
+        """
+        for field, (keys, items) in self._date_indexes.items():
+            for old, new in changes:
+                if old is not None:
+                    first, last = bisect_left(keys, old[field]), bisect_right(keys, old[field])
+                    pos = next((pos for pos in range(first, last) if items[pos] is old), None)
+                    if pos is None:
+                        # O índice não corresponde ao cache: descarta para reconstruir na próxima consulta
+                        self._date_indexes = {}
+                        return
+                    if new is not None and new[field] == old[field]:
+                        items[pos] = new
+                        continue
+                    del keys[pos]
+                    del items[pos]
+                if new is not None:
+                    pos = bisect_right(keys, new[field])
+                    keys.insert(pos, new[field])
+                    items.insert(pos, new)
+
+    def _known_ids(self) -> set:
+        """
+        Retorna os IDs existentes no modo journal sem cache, sem reler o snapshot e o log a cada
+        escrita: o conjunto é montado na primeira utilização e mantido pelas escritas deste repositório
+        (ver _append_log). É relido apenas se o arquivo ou o log forem alterados por outro processo.
+
+        Returns:
+            set: IDs (str) das transações existentes.
+        """
+        signature = self._signature()
+        if self._journal_ids is None or signature != self._journal_ids_signature:
+            self._journal_ids = {item["id"] for item in self._load()}
+            self._journal_ids_signature = signature
+        return self._journal_ids
+
+    def _existing(self) -> tuple:
+        """
+        Retorna os dados e os IDs existentes usados pelas escritas em lote.
+        No modo journal sem cache e sem ouvintes, só os IDs são necessários: usa _known_ids,
+        sem ler os dados (O(1) por escrita, em vez de O(N)).
+
+        Returns:
+            tuple: (lista de transações ou None, mapa ID -> transação ou conjunto de IDs).
+        """
+        if self._journal and not (self._cache or self.events):
+            return None, self._known_ids()
+        data = self._load()
+        return data, self._records_by_id(data)
+
+    def _records_by_id(self, data: list) -> dict:
+        """
+        Retorna um mapa ID -> transação (primeira ocorrência) para buscas em O(1).
+
+        Args:
+            data (list): Lista de transações retornada por _load.
+
+        Returns:
+            dict: O índice do cache (modo cache) ou um mapa construído a partir de 'data'.
+        """
+        if self._cache:
+            return self._cached_index
+        records = {}
+        for item in data:
+            records.setdefault(item["id"], item)
+        return records
+
+    @exclusive
     def add(self, transaction: Transaction):
         """
         Adiciona uma nova transação ao repositório.
@@ -52,10 +515,66 @@ class TransactionRepository:
         Args:
             transaction (Transaction): A transação a ser adicionada.
         """
+        record = transaction.to_dict()
+        if self._journal:
+            exists = False
+            if self._cache or self.events:
+                # Garante que o cache está atualizado antes de aplicar a operação
+                exists = record["id"] in self._records_by_id(self._load())
+            self._append_log([{"op": "add", "id": record["id"], "data": record}])
+            if not exists:
+                # No journal, o add de um ID já existente é ignorado: não há o que notificar
+                self.events.publish([(None, record)])
+            return
         data = self._load()
-        data.append(transaction.to_dict())
-        self._save(data)
+        data.append(record)
+        self._save(data, [(None, record)])
+        self.events.publish([(None, record)])
+
+    @exclusive
+    def add_many(self, transactions: Iterable[Transaction]) -> BulkResult:
+        """
+        Adiciona várias transações com uma única leitura e uma única gravação.
+        Transações cujo ID já existe no repositório (ou que se repetem no lote) são ignoradas.
+
+        Args:
+            transactions (Iterable[Transaction]): Transações a serem adicionadas.
+
+        Returns:
+            BulkResult: IDs adicionados (applied) e IDs ignorados por duplicidade (skipped).
+        """
+        data, known = self._existing()
+        result = BulkResult()
+        records = []
+        seen = set()
+
+        for transaction in transactions:
+            record_id = str(transaction.id)
+            if record_id in known or record_id in seen:
+                result.skipped.append(transaction.id)
+                continue
+            seen.add(record_id)
+            records.append(transaction.to_dict())
+            result.applied.append(transaction.id)
 
+        if records:
+            if self._journal:
+                self._append_log([{"op": "add", "id": record["id"], "data": record} for record in records])
+            else:
+                data.extend(records)
+                self._save(data, [(None, record) for record in records])
+            self.events.publish([(None, record) for record in records])
+        return result
+
+    @exclusive
+    def compact(self):
+        """
+        Incorpora o journal ao snapshot e remove o log.
+        Sem efeito prático fora do modo journal, além de regravar o arquivo.
+        """
+        self._save(self._load(), [])
+
+    @exclusive
     def delete(self, transaction: Transaction):
         """
         Remove uma transação existente com base no seu ID.
@@ -63,10 +582,56 @@ class TransactionRepository:
         Args:
             transaction (Transaction): A transação a ser removida.
         """
+        record_id = str(transaction.id)
+        if self._journal:
+            removed = []
+            if self._cache or self.events:
+                # Garante que o cache está atualizado antes de aplicar a operação
+                data = self._load()
+                if self.events:
+                    removed = [item for item in data if item["id"] == record_id]
+            self._append_log([{"op": "delete", "id": record_id}])
+            self.events.publish([(item, None) for item in removed])
+            return
         data = self._load()
         # Remove todas as transações com ID igual ao da fornecida
-        new_data = [item for item in data if item["id"] != str(transaction.id)]
-        self._save(new_data)
+        new_data = [item for item in data if item["id"] != record_id]
+        removed = [item for item in data if item["id"] == record_id] if self._cache or self.events else []
+        self._save(new_data, [(item, None) for item in removed])
+        self.events.publish([(item, None) for item in removed])
+
+    @exclusive
+    def delete_many(self, items: Iterable[Transaction | UUID]) -> BulkResult:
+        """
+        Remove várias transações com uma única leitura e uma única gravação.
+
+        Args:
+            items (Iterable[Transaction | UUID]): Transações (ou seus IDs) a serem removidas.
+
+        Returns:
+            BulkResult: IDs removidos (applied) e IDs não encontrados ou repetidos no lote (skipped).
+        """
+        data, known = self._existing()
+        result = BulkResult()
+        to_delete = set()
+
+        for item in items:
+            item_id = item.id if isinstance(item, Transaction) else item
+            record_id = str(item_id)
+            if record_id not in known or record_id in to_delete:
+                result.skipped.append(item_id)
+                continue
+            to_delete.add(record_id)
+            result.applied.append(item_id)
+
+        if to_delete:
+            removed = [item for item in data if item["id"] in to_delete] if self._cache or self.events else []
+            if self._journal:
+                self._append_log([{"op": "delete", "id": str(item_id)} for item_id in result.applied])
+            else:
+                self._save([item for item in data if item["id"] not in to_delete], [(item, None) for item in removed])
+            self.events.publish([(item, None) for item in removed])
+        return result
 
     def get_by_id(self, id: UUID) -> Transaction | None:
         """
@@ -79,35 +644,140 @@ class TransactionRepository:
             Transaction | None: A transação correspondente, ou None se não encontrada.
         """
         data = self._load()
+        if self._cache:
+            # Modo cache: busca O(1) pelo índice em memória
+            item = self._cached_index.get(str(id))
+            self._count(rows_scanned=1 if item else 0)
+            return Transaction.from_dict(item) if item else None
         for item in data:
             if item["id"] == str(id):
                 return Transaction.from_dict(item)
         return None
 
+    def iter_all(self, chunk_size: int = 64 * 1024) -> Iterator[dict]:
+        """
+        Percorre todas as transações sem carregar o arquivo inteiro em memória.
+        O arquivo é decodificado em blocos; no modo journal, o log (limitado pela compactação)
+        é aplicado durante a leitura. No modo cache, percorre os dados já em memória.
+
+        Args:
+            chunk_size (int): Quantidade de caracteres (JSON) ou bytes (binário) lidos do arquivo por vez.
+
+        Yields:
+            dict: Cada transação (formato de dicionário), na mesma ordem de list_all.
+        """
+        if self._cache:
+            yield from list(self._load())
+            return
+
+        # Sob a trava, lê o log e abre o snapshot; depois a leitura segue sem trava,
+        # pois uma gravação atômica substitui o arquivo sem alterar o que já está aberto
+        with self._lock.shared():
+            ops = self._read_log() if self._journal else []
+            try:
+                f = open(self._filepath, "rb")
+            except FileNotFoundError:
+                f = None
+        records = iter_records(f, chunk_size) if f is not None else iter(())
+        if not ops:
+            yield from records
+            return
+
+        by_id = {}  # ID -> [(posição no log, operação)]
+        for op_seq, op in enumerate(ops):
+            by_id.setdefault(op["id"], []).append((op_seq, op))
+
+        in_snapshot = {}  # ID tocado pelo log e presente no snapshot -> estado final
+        for item in records:
+            record_id = item["id"]
+            if record_id not in by_id:
+                yield item
+            elif record_id in in_snapshot:
+                # Duplicata no snapshot: só é mantida se não houve delete do ID
+                if not in_snapshot[record_id].deleted:
+                    yield item
+            else:
+                outcome = in_snapshot[record_id] = _simulate_log(by_id[record_id], True)
+                if outcome.present and not outcome.moved:
+                    yield outcome.record or item
+
+        # Registros adicionados pelo log vão para o fim, na ordem do "add" efetivo
+        added = []
+        for record_id, id_ops in by_id.items():
+            outcome = in_snapshot.get(record_id) or _simulate_log(id_ops, False)
+            if outcome.present and outcome.moved:
+                added.append((outcome.seq, outcome.record))
+        for _, record in sorted(added, key=itemgetter(0)):
+            yield record
+
     def list_all(self) -> list:
         """
         Lista todas as transações armazenadas no repositório.
+        No modo cache, os dicionários retornados são compartilhados com o cache e não devem ser alterados.
 
         Returns:
             list: Lista de transações (formato de dicionários).
         """
-        return self._load()
+        # Cópia rasa: quem chama pode alterar a lista sem afetar o cache
+        return list(self._load())
 
-    def list_by_month(self, year: int, month: int) -> list:
+    def list_transactions(self, trusted: bool = False) -> list:
         """
-        Lista transações filtradas por ano e mês.
+        Lista todas as transações como objetos, na mesma ordem de list_all.
 
         Args:
-            year (int): Ano desejado.
-            month (int): Mês desejado.
+            trusted (bool): Se False (padrão), cria cada Transaction com validação completa, o caminho
+                adequado para dados de origem não confiável. Se True, o arquivo é validado uma única vez
+                (carimbo com checksum e versão do esquema) e são retornadas TransactionView, que não
+                revalidam cada linha e só convertem ID e datas no primeiro acesso.
+
+        Returns:
+            list: Lista de Transaction (estrito) ou de TransactionView (confiável).
+
+        Raises:
+            ValueError: Caso alguma transação seja inválida.
+        """
+        with self._lock.shared():
+            data = self._load()
+            if not trusted:
+                return Transaction.from_dicts(data)
+            self._ensure_valid(data)
+            return TransactionView.from_dicts(data)
+
+    def list_by_period(self, start: date, end: date, field: str = "data_transacao") -> list:
+        """
+        Lista transações com a data escolhida dentro do intervalo [start, end], ordenadas por essa data.
+        O índice ordenado com busca binária (O(log N + k)) só existe no modo cache, onde é mantido
+        entre as chamadas. Sem cache, cada chamada relê o arquivo e percorre todas as linhas (O(N),
+        mais a ordenação das k encontradas): montar o índice a cada leitura custaria mais que a varredura.
+
+        Args:
+            start (date): Data inicial (inclusiva).
+            end (date): Data final (inclusiva).
+            field (str): Campo de data usado no filtro: "data_transacao" ou "data_efetivacao"
+                (ex: ciclo de fatura do cartão).
 
         Returns:
             list: Lista de transações no período especificado.
+
+        Raises:
+            ValueError: Caso o campo de data seja inválido.
         """
+        if field not in DATE_FIELDS:
+            raise ValueError(f"Invalid date field: {field}. Use one of {DATE_FIELDS}.")
+        start_iso, end_iso = start.isoformat(), end.isoformat()
         data = self._load()
-        # Aqui assumimos que os campos 'year' e 'month' existem no dict salvo
-        return [item for item in data if datetime.strptime(item["data_transacao"], "%Y-%m-%d").year  == year and datetime.strptime(item["data_transacao"], "%Y-%m-%d").month == month]
 
+        if self._cache:
+            keys, items = self._date_index(field)
+            first, last = bisect_left(keys, start_iso), bisect_right(keys, end_iso)
+            self._count(rows_scanned=last - first)
+            return items[first:last]
+
+        # Sem cache: compara as strings ISO diretamente, sem strptime por linha
+        return sorted((item for item in data if start_iso <= item[field] <= end_iso), key=itemgetter(field))
+
+    @exclusive
     def update(self, transaction: Transaction):
         """
         Atualiza uma transação existente com base no ID.
@@ -118,17 +788,105 @@ class TransactionRepository:
         Raises:
             ValueError: Caso a transação não seja encontrada.
         """
+        record_id = str(transaction.id)
+        record = transaction.to_dict()
+
+        if self._journal:
+            if self._cache or self.events:
+                old = self._records_by_id(self._load()).get(record_id)
+                exists = old is not None
+            else:
+                # Sem cache e sem ouvintes: confere apenas o conjunto de IDs, sem ler os dados
+                old, exists = None, record_id in self._known_ids()
+            if not exists:
+                raise ValueError(f'Transaction with ID {transaction.id} not found.')
+            self._append_log([{"op": "update", "id": record_id, "data": record}])
+            self.events.publish([(old, record)])
+            return
+
         data = self._load()
+
         updated = False
 
         for idx, item in enumerate(data):
-            if item["id"] == str(transaction.id):
-                data[idx] = transaction.to_dict()
+            if item["id"] == record_id:
+                data[idx] = record
                 updated = True
                 break
 
         if updated:
-            self._save(data)
+            self._save(data, [(item, record)])
+            self.events.publish([(item, record)])
         else:
             raise ValueError(f'Transaction with ID {transaction.id} not found.')
 
+    @exclusive
+    def update_many(self, transactions: Iterable[Transaction]) -> BulkResult:
+        """
+        Atualiza várias transações com uma única leitura e uma única gravação.
+        Se um ID se repetir no lote, a última ocorrência prevalece.
+
+        Args:
+            transactions (Iterable[Transaction]): Transações com os dados atualizados.
+
+        Returns:
+            BulkResult: IDs atualizados (applied) e IDs não encontrados (skipped).
+        """
+        data, known = self._existing()
+        result = BulkResult()
+        records = []
+        changes = []
+        current = {}  # ID -> versão mais recente dentro do lote
+
+        for transaction in transactions:
+            record_id = str(transaction.id)
+            if record_id not in known:
+                result.skipped.append(transaction.id)
+                continue
+            record = transaction.to_dict()
+            if self.events:
+                changes.append((current.get(record_id) or known[record_id], record))
+                current[record_id] = record
+            records.append(record)
+            result.applied.append(transaction.id)
+
+        if records:
+            if self._journal:
+                self._append_log([{"op": "update", "id": record["id"], "data": record} for record in records])
+            else:
+                positions = {}
+                for idx, item in enumerate(data):
+                    positions.setdefault(item["id"], idx)
+                replaced = []
+                for record in records:
+                    pos = positions[record["id"]]
+                    replaced.append((data[pos], record))
+                    data[pos] = record
+                self._save(data, replaced)
+            self.events.publish(changes)
+        return result
+
+
+class JsonMigration:
+    """
+    Importação do arquivo do TransactionRepository, comum aos backends alternativos
+    (SQLite, mmap e particionado), que a herdam junto com TransactionQueries.
+    """
+
+    def migrate_from_json(self, filepath="finance_app/data/transaction.json") -> BulkResult:
+        """
+        Importa (uma única vez) as transações de um arquivo do TransactionRepository, com add_many.
+        Pode ser executada novamente com segurança: IDs já importados são ignorados.
+
+        Args:
+            filepath (str): Caminho do arquivo de origem.
+
+        Returns:
+            BulkResult: IDs importados (applied) e IDs já existentes (skipped).
+
+        Raises:
+            ValueError: Caso alguma transação do arquivo seja inválida.
+        """
+        # journal=True apenas para a leitura: incorpora um eventual log pendente ao lado do arquivo
+        source = TransactionRepository(filepath=filepath, journal=True)
+        return self.add_many(source.list_transactions())
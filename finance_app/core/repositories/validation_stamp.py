@@ -0,0 +1,83 @@
+import hashlib
+import json
+from typing import Callable
+from finance_app.core.repositories.file_storage import atomic_open
+
+# Versão do esquema dos registros. Incrementar invalida todos os carimbos já gravados.
+SCHEMA_VERSION = 1
+
+
+class ValidationStamp:
+    """
+    Carimbo de validação persistido ao lado do arquivo de dados (<caminho>.stamp).
+    Registra a versão do esquema e o checksum (BLAKE2b) do conteúdo que passou pela validação
+    completa, linha a linha. Enquanto o conteúdo não mudar, as cargas confiáveis podem pular a
+    validação, mesmo em outro processo: calcular o checksum custa muito menos que validar cada linha.
+    """
+
+    def __init__(self, filepath: str, covered: tuple):
+        """
+        Args:
+            filepath (str): Caminho do arquivo de dados (o carimbo fica em <filepath>.stamp).
+            covered (tuple): Arquivos cujo conteúdo o checksum cobre (ex: snapshot e journal).
+        """
+        self._stamp_path = filepath + ".stamp"
+        self._covered = covered
+
+    def digest(self) -> str:
+        """
+        Calcula o checksum do conteúdo atual dos arquivos cobertos (arquivos ausentes contam como vazios).
+        """
+        checksum = hashlib.blake2b(digest_size=16)
+        for path in self._covered:
+            # Separador entre arquivos: o mesmo conteúdo dividido de outra forma gera outro checksum
+            checksum.update(b"\0")
+            try:
+                with open(path, "rb") as f:
+                    for block in iter(lambda: f.read(1024 * 1024), b""):
+                        checksum.update(block)
+            except FileNotFoundError:
+                pass
+        return checksum.hexdigest()
+
+    def matches(self, digest: str) -> bool:
+        """
+        Retorna True se o carimbo gravado corresponde ao checksum e à versão atual do esquema.
+        """
+        try:
+            with open(self._stamp_path, "r") as f:
+                stamp = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return False
+        return stamp == {"schema": SCHEMA_VERSION, "digest": digest}
+
+    def write(self, digest: str):
+        """
+        Grava o carimbo para o checksum informado.
+        """
+        with atomic_open(self._stamp_path) as f:
+            json.dump({"schema": SCHEMA_VERSION, "digest": digest}, f)
+
+    def ensure(self, records: list, validate: Callable[[dict], object], persist: bool = True):
+        """
+        Garante que o conteúdo atual foi validado: se o carimbo não corresponde, valida cada
+        registro com a função estrita e grava um novo carimbo.
+
+        Args:
+            records (list): Registros carregados dos arquivos cobertos.
+            validate (Callable[[dict], object]): Conversão estrita de um registro (ex: Transaction.from_dict).
+            persist (bool): Se False, apenas valida, sem gravar o carimbo (para caminhos somente leitura).
+
+        Raises:
+            ValueError: Caso algum registro seja inválido (nenhum carimbo é gravado).
+        """
+        digest = self.digest()
+        if self.matches(digest):
+            return
+        for position, record in enumerate(records):
+            try:
+                validate(record)
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"Invalid record at position {position}: {e!r}") from e
+        if persist:
+            self.write(digest)
@@ -0,0 +1,242 @@
+import math
+from typing import Iterable, NamedTuple
+from finance_app.core.models.transaction import Transaction
+from finance_app.core.repositories.bulk_result import BulkResult
+from finance_app.core.services.transaction_search import tokenize
+
+
+class CategoryPrediction(NamedTuple):
+    """
+    Categoria sugerida para uma descrição.
+    """
+    categoria_n1: str
+    categoria_n2: str
+    categoria_n3: str
+    confidence: float  # Entre 0 e 1
+    source: str  # "merchant" (tabela de estabelecimentos) ou "bayes" (naive Bayes)
+
+
+def merchant_key(descricao: str) -> str:
+    """
+    Normaliza uma descrição para a tabela de estabelecimentos: sem acentos, maiúsculas, pontuação
+    e termos com dígitos (parcelas, datas, códigos). Ex: "UBER *TRIP 1234" -> "uber trip"
+    """
+    return " ".join(token for token in tokenize(descricao) if not any(char.isdigit() for char in token))
+
+
+class AutoCategorizer:
+    """
+    Classificador local (offline) de transações, treinado com o histórico já categorizado.
+    1. Tabela de estabelecimentos: descrição normalizada -> contagem de cada categoria.
+       Se uma categoria domina a descrição, ela é usada.
+    2. Naive Bayes multinomial sobre os termos da descrição, quando a tabela não decide.
+
+    O treino é incremental (train/untrain ajustam apenas contagens) e as sugestões são validadas
+    contra a hierarquia do CategoryRepository: só são sugeridos caminhos n1 > n2 > n3 existentes.
+    """
+
+    def __init__(self, category_repository, min_merchant_share: float = 0.6):
+        """
+        Args:
+            category_repository: Repositório de categorias (ex: CategoryRepository), com get_tree().
+            min_merchant_share (float): Fração mínima das ocorrências de uma descrição que uma categoria
+                precisa ter para ser sugerida pela tabela de estabelecimentos.
+        """
+        self._categories = category_repository
+        self._min_merchant_share = min_merchant_share
+        # Rótulo: (categoria_n1, categoria_n2, categoria_n3), com "" nos níveis não usados
+        self._merchants = {}  # Descrição normalizada -> {rótulo: contagem}
+        self._label_counts = {}  # Rótulo -> número de transações
+        self._label_tokens = {}  # Rótulo -> total de termos
+        self._token_labels = {}  # Termo -> {rótulo: contagem}
+        self._total = 0
+
+    # ---------- Treino ----------
+
+    def _learn(self, records: Iterable[Transaction | dict], sign: int) -> int:
+        """
+        Soma (sign=1) ou subtrai (sign=-1) as contagens das transações categorizadas.
+
+        Returns:
+            int: Número de transações consideradas.
+        """
+        used = 0
+        for record in records:
+            if isinstance(record, Transaction):
+                record = record.to_dict()
+            label = (record["categoria_n1"], record["categoria_n2"], record["categoria_n3"])
+            if not label[0]:
+                # Transação sem categoria: nada a aprender
+                continue
+            used += 1
+            self._total += sign
+            _add(self._label_counts, label, sign)
+            _add_nested(self._merchants, merchant_key(record["descricao"]), label, sign)
+            tokens = tokenize(record["descricao"])
+            _add(self._label_tokens, label, sign * len(tokens))
+            for token in tokens:
+                _add_nested(self._token_labels, token, label, sign)
+        return used
+
+    def train(self, records: Iterable[Transaction | dict]) -> int:
+        """
+        Aprende com transações já categorizadas (incremental: pode ser chamado a cada lote novo).
+
+        Args:
+            records (Iterable[Transaction | dict]): Transações (ou dicionários no formato de to_dict).
+
+        Returns:
+            int: Número de transações categorizadas usadas no treino.
+        """
+        return self._learn(records, 1)
+
+    def untrain(self, records: Iterable[Transaction | dict]) -> int:
+        """
+        Desfaz o treino de transações (ex: removidas ou recategorizadas), sem retreinar do zero.
+
+        Args:
+            records (Iterable[Transaction | dict]): As mesmas transações passadas a train.
+
+        Returns:
+            int: Número de transações categorizadas removidas do treino.
+        """
+        return self._learn(records, -1)
+
+    def train_from_repository(self, repository) -> int:
+        """
+        Treina com todas as transações de um repositório, em uma única leitura.
+
+        Args:
+            repository: Repositório de transações com 'iter_all' (ex: TransactionRepository).
+
+        Returns:
+            int: Número de transações categorizadas usadas no treino.
+        """
+        return self.train(repository.iter_all())
+
+    # ---------- Hierarquia ----------
+
+    def _valid_labels(self) -> frozenset:
+        """
+        Retorna os rótulos que existem na hierarquia de categorias (calculados uma única vez por árvore:
+        o repositório de categorias só reconstrói a árvore quando as categorias mudam).
+        """
+        return self._categories.get_tree().name_paths()
+
+    # ---------- Predição ----------
+
+    def _predict(self, descricao: str, valid: frozenset) -> CategoryPrediction | None:
+        """
+        Sugere a categoria de uma descrição entre os rótulos válidos.
+        """
+        counts = self._merchants.get(merchant_key(descricao))
+        if counts:
+            total = sum(counts.values())
+            label, count = max(((label, count) for label, count in counts.items() if label in valid),
+                               key=lambda item: item[1], default=(None, 0))
+            if label is not None and count / total >= self._min_merchant_share:
+                return CategoryPrediction(*label, count / total, "merchant")
+
+        tokens = [token for token in tokenize(descricao) if token in self._token_labels]
+        if not tokens:
+            return None
+        # Candidatos: rótulos válidos que já apareceram com algum dos termos
+        candidates = {label for token in tokens for label in self._token_labels[token] if label in valid}
+        if not candidates:
+            return None
+        vocabulary = len(self._token_labels)
+        scores = {}
+        for label in candidates:
+            denominator = self._label_tokens[label] + vocabulary
+            score = math.log(self._label_counts[label] / self._total)
+            for token in tokens:
+                # Suavização de Laplace: termos nunca vistos com o rótulo não zeram a probabilidade
+                score += math.log((self._token_labels[token].get(label, 0) + 1) / denominator)
+            scores[label] = score
+        best = max(scores, key=scores.get)
+        # Probabilidade normalizada entre os candidatos (softmax dos log-scores)
+        confidence = 1 / sum(math.exp(score - scores[best]) for score in scores.values())
+        return CategoryPrediction(*best, confidence, "bayes")
+
+    def predict(self, descricao: str) -> CategoryPrediction | None:
+        """
+        Sugere a categoria de uma descrição.
+
+        Args:
+            descricao (str): Descrição da transação.
+
+        Returns:
+            CategoryPrediction | None: Sugestão (sempre um caminho existente na hierarquia),
+                ou None se o histórico não tiver informação sobre a descrição.
+        """
+        return self._predict(descricao, self._valid_labels())
+
+    def predict_many(self, descriptions: Iterable[str]) -> list[CategoryPrediction | None]:
+        """
+        Sugere categorias para várias descrições, com uma única consulta à hierarquia
+        e reaproveitando a sugestão de descrições repetidas no lote.
+
+        Args:
+            descriptions (Iterable[str]): Descrições das transações.
+
+        Returns:
+            list[CategoryPrediction | None]: Uma sugestão (ou None) por descrição, na mesma ordem.
+        """
+        valid = self._valid_labels()
+        cache = {}
+        predictions = []
+        for descricao in descriptions:
+            if descricao not in cache:
+                cache[descricao] = self._predict(descricao, valid)
+            predictions.append(cache[descricao])
+        return predictions
+
+    def categorize_many(self, transactions: Iterable[Transaction], min_confidence: float = 0.0,
+                        overwrite: bool = False) -> BulkResult:
+        """
+        Preenche categoria_n1/n2/n3 das transações (no próprio objeto) com as sugestões.
+        As transações não são gravadas: use o repositório (ex: add_many) em seguida.
+
+        Args:
+            transactions (Iterable[Transaction]): Transações a serem categorizadas.
+            min_confidence (float): Confiança mínima para aplicar uma sugestão.
+            overwrite (bool): Se True, substitui também categorias já preenchidas.
+
+        Returns:
+            BulkResult: IDs categorizados (applied) e IDs mantidos como estavam (skipped).
+        """
+        transactions = list(transactions)
+        pending = [transaction for transaction in transactions if overwrite or not transaction.categoria_n1]
+        predictions = dict(zip(map(id, pending), self.predict_many(t.descricao for t in pending)))
+        result = BulkResult()
+        for transaction in transactions:
+            prediction = predictions.get(id(transaction))
+            if prediction is None or prediction.confidence < min_confidence:
+                result.skipped.append(transaction.id)
+                continue
+            transaction.categoria_n1 = prediction.categoria_n1
+            transaction.categoria_n2 = prediction.categoria_n2
+            transaction.categoria_n3 = prediction.categoria_n3
+            result.applied.append(transaction.id)
+        return result
+
+
+def _add(counts: dict, key, delta: int):
+    """
+    Soma delta à contagem de uma chave, removendo-a quando chega a zero.
+    """
+    total = counts.get(key, 0) + delta
+    if total > 0:
+        counts[key] = total
+    else:
+        counts.pop(key, None)
+
+
+def _add_nested(counts: dict, outer, key, delta: int):
+    """
+    Soma delta à contagem counts[outer][key], removendo o dicionário interno quando fica vazio.
+    """
+    inner = counts.setdefault(outer, {})
+    _add(inner, key, delta)
+    if not inner:
+        del counts[outer]
@@ -0,0 +1,203 @@
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from finance_app.core.services.repository_observer import RepositoryObserver
+
+
+class _Ledger:
+    """
+    Somas de prefixo das transações de uma conta, por data de efetivação (em centavos).
+    As alterações só ajustam o valor do dia e marcam o sufixo a partir dele como desatualizado;
+    o sufixo é recalculado uma única vez na próxima consulta (várias alterações seguidas,
+    como uma importação, custam um único recálculo).
+    """
+    __slots__ = ("days", "deltas", "paid_deltas", "totals", "paid_totals", "dirty")
+
+    def __init__(self):
+        self.days = []  # Datas de efetivação distintas (ordinais), em ordem
+        self.deltas = []  # Soma das transações de cada dia
+        self.paid_deltas = []  # Soma das transações pagas de cada dia
+        self.totals = []  # Saldo acumulado até cada dia (todas as transações)
+        self.paid_totals = []  # Saldo acumulado até cada dia (apenas pagas)
+        self.dirty = 0  # Primeira posição com saldo acumulado desatualizado
+
+    def add(self, day: int, cents: int, paid: bool):
+        """
+        Soma o valor de uma transação no dia informado.
+        """
+        i = bisect_left(self.days, day)
+        if i == len(self.days) or self.days[i] != day:
+            self.days.insert(i, day)
+            self.deltas.insert(i, 0)
+            self.paid_deltas.insert(i, 0)
+            self.totals.insert(i, 0)
+            self.paid_totals.insert(i, 0)
+        self.deltas[i] += cents
+        if paid:
+            self.paid_deltas[i] += cents
+        if not self.deltas[i] and not self.paid_deltas[i]:
+            # Dia zerado: sai da lista para não acumular datas sem movimento
+            for values in (self.days, self.deltas, self.paid_deltas, self.totals, self.paid_totals):
+                del values[i]
+        self.dirty = min(self.dirty, i)
+
+    def refresh(self):
+        """
+        Recalcula os saldos acumulados do sufixo desatualizado.
+        """
+        start = self.dirty
+        if start >= len(self.days):
+            return
+        total = self.totals[start - 1] if start else 0
+        paid_total = self.paid_totals[start - 1] if start else 0
+        totals, paid_totals = self.totals, self.paid_totals
+        for i in range(start, len(self.days)):
+            total += self.deltas[i]
+            paid_total += self.paid_deltas[i]
+            totals[i] = total
+            paid_totals[i] = paid_total
+        self.dirty = len(self.days)
+
+    def balance(self, day: int, include_unpaid: bool) -> int:
+        """
+        Saldo acumulado até o dia informado (inclusive), em centavos.
+        """
+        self.refresh()
+        i = bisect_right(self.days, day)
+        if not i:
+            return 0
+        return (self.totals if include_unpaid else self.paid_totals)[i - 1]
+
+
+class BalanceService(RepositoryObserver):
+    """
+    Motor de saldos e fluxo de caixa por conta.
+    Mantém, para cada conta, as somas de prefixo das transações pela data de efetivação,
+    atualizadas de forma incremental pelos eventos do repositório. Cada add/update/delete ajusta
+    apenas o dia afetado e o sufixo de saldos a partir dele é recalculado na próxima consulta.
+    - saldo em uma data: O(log N) (busca binária nas datas)
+    - série diária de um período: O(log N + dias)
+
+    O saldo realizado considera apenas as transações pagas; a projeção inclui também as não pagas
+    (ex: contas futuras ainda não pagas), até a data consultada.
+    """
+
+    def __init__(self, repository):
+        """
+        Constrói os saldos a partir do repositório e passa a observar suas alterações.
+
+        Args:
+            repository: Repositório de transações com 'events' e 'iter_all' (ex: TransactionRepository).
+        """
+        self._ledgers = {}  # Conta -> _Ledger
+        super().__init__(repository)
+
+    def rebuild(self):
+        """
+        Recalcula todos os saldos com uma única leitura do repositório.
+        """
+        # Agrega por (conta, dia) antes de montar as listas ordenadas: evita inserções no meio
+        days = {}  # Conta -> {dia: [centavos, centavos pagos]}
+        ordinals = {}  # Data ISO -> ordinal (há poucas datas distintas)
+        for record in self._repository.iter_all():
+            iso = record["data_efetivacao"]
+            day = ordinals.get(iso)
+            if day is None:
+                day = ordinals[iso] = date.fromisoformat(iso).toordinal()
+            cents = round(record["valor"] * 100)
+            cell = days.setdefault(record["conta"], {}).setdefault(day, [0, 0])
+            cell[0] += cents
+            if record["pago"]:
+                cell[1] += cents
+
+        self._ledgers = {}
+        for conta, cells in days.items():
+            ledger = self._ledgers[conta] = _Ledger()
+            for day in sorted(cells):
+                cents, paid_cents = cells[day]
+                if cents or paid_cents:
+                    ledger.days.append(day)
+                    ledger.deltas.append(cents)
+                    ledger.paid_deltas.append(paid_cents)
+            ledger.totals = [0] * len(ledger.days)
+            ledger.paid_totals = [0] * len(ledger.days)
+
+    def _apply(self, record: dict, sign: int):
+        """
+        Soma (sign=1) ou subtrai (sign=-1) o valor de uma transação no dia de efetivação da sua conta.
+        """
+        ledger = self._ledgers.get(record["conta"])
+        if ledger is None:
+            ledger = self._ledgers[record["conta"]] = _Ledger()
+        day = date.fromisoformat(record["data_efetivacao"]).toordinal()
+        ledger.add(day, sign * round(record["valor"] * 100), record["pago"])
+
+    def accounts(self) -> list[str]:
+        """
+        Retorna as contas com transações, em ordem alfabética.
+        """
+        return sorted(conta for conta, ledger in self._ledgers.items() if ledger.days)
+
+    def balance_at(self, conta: str, day: date, include_unpaid: bool = False) -> float:
+        """
+        Retorna o saldo de uma conta ao final de um dia.
+
+        Args:
+            conta (str): Nome da conta.
+            day (date): Data consultada (transações efetivadas até ela, inclusive).
+            include_unpaid (bool): Se True, inclui as transações não pagas (projeção).
+
+        Returns:
+            float: Saldo da conta.
+        """
+        ledger = self._ledgers.get(conta)
+        if ledger is None:
+            return 0.0
+        return ledger.balance(day.toordinal(), include_unpaid) / 100
+
+    def daily_balances(self, conta: str, start: date, end: date, include_unpaid: bool = False) -> list[tuple]:
+        """
+        Retorna o saldo de uma conta ao final de cada dia de um período.
+
+        Args:
+            conta (str): Nome da conta.
+            start (date): Primeiro dia (inclusive).
+            end (date): Último dia (inclusive).
+            include_unpaid (bool): Se True, inclui as transações não pagas (projeção).
+
+        Returns:
+            list[tuple]: Pares (data, saldo), um por dia do período.
+        """
+        if end < start:
+            return []
+        ledger = self._ledgers.get(conta)
+        if ledger is None:
+            return [(start + timedelta(days=i), 0.0) for i in range((end - start).days + 1)]
+        ledger.refresh()
+        days = ledger.days
+        totals = ledger.totals if include_unpaid else ledger.paid_totals
+        first = start.toordinal()
+        # Posição do primeiro dia com movimento depois do início; o saldo corrente vem do dia anterior
+        i = bisect_right(days, first)
+        cents = totals[i - 1] if i else 0
+        series = []
+        for offset in range((end - start).days + 1):
+            while i < len(days) and days[i] <= first + offset:
+                cents = totals[i]
+                i += 1
+            series.append((start + timedelta(days=offset), cents / 100))
+        return series
+
+    def projection(self, conta: str, start: date, end: date) -> list[tuple]:
+        """
+        Projeção do fluxo de caixa: saldo diário incluindo as transações não pagas.
+        Equivale a daily_balances com include_unpaid=True.
+
+        Args:
+            conta (str): Nome da conta.
+            start (date): Primeiro dia (inclusive).
+            end (date): Último dia (inclusive).
+
+        Returns:
+            list[tuple]: Pares (data, saldo projetado), um por dia do período.
+        """
+        return self.daily_balances(conta, start, end, include_unpaid=True)
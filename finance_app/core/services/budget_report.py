@@ -0,0 +1,140 @@
+from finance_app.core.repositories.transaction_repository import DATE_FIELDS
+from finance_app.core.services.repository_observer import RepositoryObserver
+
+LEVELS = (1, 2, 3)
+
+
+class BudgetReportService(RepositoryObserver):
+    """
+    Serviço de relatório orçado vs realizado.
+    Mantém totais realizados por (ano, mês, caminho da categoria), em centavos, atualizados de forma
+    incremental pelos eventos do repositório: cada add/update/delete ajusta apenas as células
+    afetadas, sem reler as transações. Cada consulta de célula custa O(1).
+
+    As categorias são identificadas pelo caminho na hierarquia, (n1,), (n1, n2) ou (n1, n2, n3):
+    subcategorias com o mesmo nome em categorias diferentes (ex: "Outros" em "Moradia" e em "Lazer")
+    ficam em células separadas.
+    """
+
+    def __init__(self, repository, month_field: str = "data_transacao"):
+        """
+        Constrói os totais a partir do repositório e passa a observar suas alterações.
+
+        Args:
+            repository: Repositório de transações com 'events' e 'iter_all' (ex: TransactionRepository).
+            month_field (str): Campo de data que define o mês da transação
+                ("data_transacao" ou "data_efetivacao").
+        """
+        if month_field not in DATE_FIELDS:
+            raise ValueError(f"Invalid date field: {month_field}. Use one of {DATE_FIELDS}.")
+        self._month_field = month_field
+        self._actuals = {}  # (ano, mês, nível) -> {caminho: centavos}
+        self._budgets = {}  # (ano, mês, nível) -> {caminho: centavos}
+        super().__init__(repository)
+
+    def _reset(self):
+        """
+        Descarta os totais realizados (os orçamentos definidos são mantidos).
+        """
+        self._actuals = {}
+
+    def _apply(self, record: dict, sign: int):
+        """
+        Soma (sign=1) ou subtrai (sign=-1) o valor de uma transação nas células de cada nível.
+        """
+        # Datas ISO: o mês é extraído direto da string, sem conversão para date
+        iso = record[self._month_field]
+        year, month = int(iso[:4]), int(iso[5:7])
+        cents = sign * round(record["valor"] * 100)
+        path = (record["categoria_n1"], record["categoria_n2"], record["categoria_n3"])
+        for level in LEVELS:
+            if not path[level - 1]:
+                break
+            category = path[:level]
+            key = (year, month, level)
+            cell = self._actuals.setdefault(key, {})
+            total = cell.get(category, 0) + cents
+            if total:
+                cell[category] = total
+            else:
+                # Célula zerada: remove para não acumular categorias/meses vazios
+                cell.pop(category, None)
+                if not cell:
+                    del self._actuals[key]
+
+    @staticmethod
+    def _check_path(path: tuple, parent: bool = False) -> tuple:
+        """
+        Confere um caminho de categorias: tupla com 1 a 3 nomes (ou vazia, se 'parent').
+
+        Raises:
+            ValueError: Caso o caminho seja inválido.
+        """
+        sizes = (0, 1, 2) if parent else LEVELS
+        if not isinstance(path, tuple) or len(path) not in sizes or not all(isinstance(name, str) and name for name in path):
+            raise ValueError("Invalid category path. Use a tuple (n1,), (n1, n2) or (n1, n2, n3).")
+        return path
+
+    def set_budget(self, year: int, month: int, path: tuple, valor: float):
+        """
+        Define o valor orçado de uma categoria em um mês.
+        Use o mesmo sinal das transações (ex: despesas negativas).
+
+        Args:
+            year (int): Ano.
+            month (int): Mês.
+            path (tuple): Caminho da categoria: (n1,), (n1, n2) ou (n1, n2, n3).
+            valor (float): Valor orçado.
+
+        Raises:
+            ValueError: Caso o caminho seja inválido.
+        """
+        path = self._check_path(path)
+        self._budgets.setdefault((year, month, len(path)), {})[path] = round(valor * 100)
+
+    def budget(self, year: int, month: int, path: tuple) -> float:
+        """
+        Retorna o valor orçado de uma categoria (caminho) em um mês (0 se não definido).
+        """
+        path = self._check_path(path)
+        return self._budgets.get((year, month, len(path)), {}).get(path, 0) / 100
+
+    def actual(self, year: int, month: int, path: tuple) -> float:
+        """
+        Retorna o valor realizado (soma das transações) de uma categoria (caminho) em um mês.
+        """
+        path = self._check_path(path)
+        return self._actuals.get((year, month, len(path)), {}).get(path, 0) / 100
+
+    def compare(self, year: int, month: int, parent: tuple = ()) -> list:
+        """
+        Monta a tabela comparativa orçado vs realizado de um mês para as subcategorias diretas de 'parent'.
+
+        Args:
+            year (int): Ano.
+            month (int): Mês.
+            parent (tuple): Caminho da categoria pai: () para as categorias de nível 1 (padrão),
+                (n1,) para as de nível 2 e (n1, n2) para as de nível 3.
+
+        Returns:
+            list: Linhas {"categoria", "orcado", "realizado", "diferenca"} (diferenca = realizado - orcado),
+                ordenadas por categoria (nome da subcategoria).
+
+        Raises:
+            ValueError: Caso o caminho seja inválido.
+        """
+        parent = self._check_path(parent, parent=True)
+        level = len(parent) + 1
+        budgets = self._budgets.get((year, month, level), {})
+        actuals = self._actuals.get((year, month, level), {})
+        rows = []
+        for path in sorted(path for path in budgets.keys() | actuals.keys() if path[:-1] == parent):
+            budgeted = budgets.get(path, 0)
+            actual = actuals.get(path, 0)
+            rows.append({
+                "categoria": path[-1],
+                "orcado": budgeted / 100,
+                "realizado": actual / 100,
+                "diferenca": (actual - budgeted) / 100,
+            })
+        return rows
@@ -0,0 +1,246 @@
+from dataclasses import replace
+from typing import Iterable, NamedTuple
+from uuid import UUID
+from finance_app.core.models.category import Category
+from finance_app.core.models.transaction import Transaction
+from finance_app.core.repositories.bulk_result import BulkResult
+from finance_app.core.repositories.category_tree import CategoryTree
+from finance_app.core.services.repository_observer import RepositoryObserver
+
+LEVELS = (1, 2, 3)
+
+
+class PathViolation(NamedTuple):
+    """
+    Transação cujo caminho de categorias não existe na hierarquia.
+    """
+    id: str
+    path: tuple  # (categoria_n1, categoria_n2, categoria_n3)
+    level: int  # Primeiro nível sem categoria correspondente (1, 2 ou 3)
+
+
+class CascadeResult(NamedTuple):
+    """
+    Resultado de uma exclusão ou renomeação de categoria.
+    """
+    categories: BulkResult  # Categorias removidas/atualizadas
+    transactions: BulkResult  # Transações atualizadas em cascata
+
+
+def _path(record: Transaction | dict) -> tuple:
+    """
+    Retorna o caminho de categorias (categoria_n1, categoria_n2, categoria_n3) de uma transação.
+    """
+    if isinstance(record, Transaction):
+        return record.categoria_n1, record.categoria_n2, record.categoria_n3
+    return record["categoria_n1"], record["categoria_n2"], record["categoria_n3"]
+
+
+def validate_paths(records: Iterable[Transaction | dict], tree: CategoryTree) -> list[PathViolation]:
+    """
+    Confere os caminhos de categorias de todas as transações contra a hierarquia, em uma única passada:
+    cada transação custa uma consulta ao conjunto de caminhos existentes (O(N) no total).
+    Transações sem categoria ("", "", "") e caminhos parciais existentes (ex: apenas nível 1 e 2) são válidos.
+
+    Args:
+        records (Iterable[Transaction | dict]): Transações (ou dicionários no formato de to_dict).
+        tree (CategoryTree): Hierarquia de categorias (ex: CategoryRepository.get_tree()).
+
+    Returns:
+        list[PathViolation]: Transações com caminho inexistente, na ordem recebida.
+    """
+    valid = tree.name_paths() | {("", "", "")}
+    violations = []
+    for record in records:
+        path = _path(record)
+        if path in valid:
+            continue
+        # O caminho completo é inválido: algum prefixo (no máximo o próprio caminho) não existe
+        level = next(level for level in LEVELS if path[:level] + ("",) * (3 - level) not in valid)
+        record_id = str(record.id) if isinstance(record, Transaction) else record["id"]
+        violations.append(PathViolation(record_id, path, level))
+    return violations
+
+
+class CategoryIntegrityService(RepositoryObserver):
+    """
+    Integridade referencial entre as transações (categoria_n1/n2/n3, gravadas como texto) e as
+    categorias do CategoryRepository.
+
+    Mantém um índice reverso prefixo do caminho -> IDs das transações, atualizado pelos eventos do
+    repositório de transações: (n1,), (n1, n2) e (n1, n2, n3) apontam para as transações que os usam,
+    de modo que as transações de uma categoria e de todas as suas subcategorias são obtidas em O(1).
+    Exclusões e renomeações de categorias são conferidas pelo índice, sem reler as transações; em cascata,
+    as transações afetadas são lidas em uma única passada e gravadas com um único update_many.
+    """
+
+    def __init__(self, transaction_repository, category_repository):
+        """
+        Constrói o índice a partir do repositório de transações e passa a observar suas alterações.
+
+        Args:
+            transaction_repository: Repositório de transações com 'events', 'iter_all', 'iter_where' e
+                'update_many' (ex: TransactionRepository).
+            category_repository: Repositório de categorias (ex: CategoryRepository).
+        """
+        self._categories = category_repository
+        self._references = {}  # Prefixo do caminho -> IDs (str) das transações
+        super().__init__(transaction_repository)  # Observado: self._repository
+
+    def _reset(self):
+        """
+        Descarta o índice reverso.
+        """
+        self._references = {}
+
+    def _apply(self, record: dict, sign: int):
+        """
+        Adiciona (sign=1) ou remove (sign=-1) a transação nos prefixos do seu caminho de categorias.
+        """
+        path = _path(record)
+        for level in LEVELS:
+            if not path[level - 1]:
+                break
+            prefix = path[:level]
+            if sign > 0:
+                self._references.setdefault(prefix, set()).add(record["id"])
+            else:
+                ids = self._references.get(prefix)
+                if ids is not None:
+                    ids.discard(record["id"])
+                    if not ids:
+                        del self._references[prefix]
+
+    def _name_path(self, tree: CategoryTree, id: UUID) -> tuple:
+        """
+        Retorna o caminho de nomes de uma categoria (ex: ("Moradia", "Contas")).
+
+        Raises:
+            ValueError: Caso a categoria não exista.
+        """
+        path = tree.path(id)
+        if not path:
+            raise ValueError("Category not found!")
+        return tuple(category.nome for category in path)
+
+    def references(self, category: Category | UUID) -> set[str]:
+        """
+        Retorna os IDs das transações que usam a categoria ou uma de suas subcategorias.
+
+        Args:
+            category (Category | UUID): Categoria (ou seu ID).
+
+        Returns:
+            set[str]: IDs das transações.
+
+        Raises:
+            ValueError: Caso a categoria não exista.
+        """
+        category_id = category.id if isinstance(category, Category) else category
+        path = self._name_path(self._categories.get_tree(), category_id)
+        return set(self._references.get(path, ()))
+
+    def violations(self) -> list[PathViolation]:
+        """
+        Confere todas as transações do repositório contra a hierarquia atual (ver validate_paths).
+
+        Returns:
+            list[PathViolation]: Transações com caminho de categorias inexistente.
+        """
+        return validate_paths(self._repository.iter_all(), self._categories.get_tree())
+
+    def _rewrite(self, ids: set, old_path: tuple, new_path: tuple, keep_subcategories: bool) -> BulkResult:
+        """
+        Troca o prefixo 'old_path' por 'new_path' no caminho das transações informadas, com uma única
+        passada pelo repositório e um único update_many.
+
+        Args:
+            ids (set): IDs das transações afetadas.
+            old_path (tuple): Prefixo atual.
+            new_path (tuple): Novo prefixo (vazio: transação sem categoria).
+            keep_subcategories (bool): Se True, mantém os níveis abaixo do prefixo; se False, eles são limpos.
+        """
+        if not ids:
+            return BulkResult()
+        ids = set(ids)  # O índice é alterado pelos eventos do update_many
+        updated = []
+        for record in self._repository.iter_where(lambda record: record["id"] in ids):
+            tail = _path(record)[len(old_path):] if keep_subcategories else ()
+            n1, n2, n3 = (new_path + tail + ("", "", ""))[:3]
+            updated.append(Transaction.from_dict({**record, "categoria_n1": n1, "categoria_n2": n2,
+                                                  "categoria_n3": n3}))
+        return self._repository.update_many(updated)
+
+    def delete_category(self, category: Category | UUID, cascade: bool = False,
+                        replacement: Category | UUID | None = None) -> CascadeResult:
+        """
+        Remove uma categoria, conferindo antes as transações e subcategorias que dependem dela.
+
+        Args:
+            category (Category | UUID): Categoria (ou seu ID) a ser removida.
+            cascade (bool): Se False (padrão), a exclusão é recusada se a categoria tiver subcategorias
+                ou for usada por transações. Se True, as subcategorias também são removidas e as
+                transações passam para 'replacement' (ou para a categoria pai; sem categoria, no nível 1).
+            replacement (Category | UUID | None): Categoria que recebe as transações na exclusão em cascata.
+
+        Returns:
+            CascadeResult: Categorias removidas e transações atualizadas.
+
+        Raises:
+            ValueError: Caso a categoria (ou a substituta) não exista, a exclusão seja recusada ou a substituta
+                seja removida junto com a categoria.
+        """
+        tree = self._categories.get_tree()
+        category_id = category.id if isinstance(category, Category) else category
+        path = self._name_path(tree, category_id)
+        subcategories = tree.descendants(category_id)
+        ids = self._references.get(path, set())
+        if not cascade:
+            if subcategories:
+                raise ValueError(f"Category has {len(subcategories)} subcategories.")
+            if ids:
+                raise ValueError(f"Category is referenced by {len(ids)} transactions.")
+
+        new_path = path[:-1]
+        if replacement is not None:
+            replacement_id = replacement.id if isinstance(replacement, Category) else replacement
+            if replacement_id == category_id or replacement_id in {sub.id for sub in subcategories}:
+                raise ValueError("Replacement category cannot be deleted with the category.")
+            new_path = self._name_path(tree, replacement_id)
+
+        transactions = self._rewrite(ids, path, new_path, keep_subcategories=False)
+        categories = self._categories.delete_many([category_id] + [sub.id for sub in subcategories])
+        return CascadeResult(categories, transactions)
+
+    def rename_category(self, category: Category | UUID, nome: str, cascade: bool = False) -> CascadeResult:
+        """
+        Renomeia uma categoria, conferindo antes as transações que usam o nome atual.
+
+        Args:
+            category (Category | UUID): Categoria (ou seu ID) a ser renomeada.
+            nome (str): Novo nome.
+            cascade (bool): Se False (padrão), a renomeação é recusada se a categoria (ou uma subcategoria)
+                for usada por transações. Se True, o nome é trocado também nessas transações.
+
+        Returns:
+            CascadeResult: Categoria atualizada e transações atualizadas.
+
+        Raises:
+            ValueError: Caso a categoria não exista, outra categoria com o mesmo pai já use o nome
+                ou a renomeação seja recusada.
+        """
+        tree = self._categories.get_tree()
+        category_id = category.id if isinstance(category, Category) else category
+        path = self._name_path(tree, category_id)
+        current = tree.get(category_id)
+        parent = tree.parent(category_id)
+        siblings = tree.children(parent.id) if parent is not None else tree.roots()
+        if any(sibling.nome == nome and sibling.id != category_id for sibling in siblings):
+            raise ValueError(f"Category name already in use: {nome}.")
+        ids = self._references.get(path, set())
+        if ids and not cascade:
+            raise ValueError(f"Category is referenced by {len(ids)} transactions.")
+
+        categories = self._categories.update_many([replace(current, nome=nome)])
+        transactions = self._rewrite(ids, path, path[:-1] + (nome,), keep_subcategories=True)
+        return CascadeResult(categories, transactions)
@@ -0,0 +1,190 @@
+from typing import NamedTuple
+from finance_app.core.models.transaction import Transaction
+from finance_app.core.models.transaction_view import TransactionView
+from finance_app.core.repositories.transaction_repository import DATE_FIELDS
+from finance_app.core.services.repository_observer import RepositoryObserver
+
+
+class InvoiceSummary(NamedTuple):
+    """
+    Totais de uma fatura (cartão, mês), com o mesmo sinal das transações (ex: compras negativas).
+    """
+    cartao: str
+    year: int
+    month: int
+    total: float
+    paid: float  # Soma das transações pagas
+    unpaid: float  # Soma das transações não pagas
+    count: int  # Número de lançamentos
+
+
+class _Invoice:
+    """
+    Estado de uma fatura no índice: lançamentos e totais em centavos.
+    """
+    __slots__ = ("items", "paid", "unpaid")
+
+    def __init__(self):
+        self.items = {}  # ID -> TransactionView, na ordem do repositório
+        self.paid = 0
+        self.unpaid = 0
+
+
+class InvoiceService(RepositoryObserver):
+    """
+    Serviço de faturas de cartão de crédito.
+    Indexa as transações com cartão por (cartão, ano, mês) com uma única leitura do repositório e
+    mantém o índice pelos eventos: cada add/update/delete (ex: marcar como pago) ajusta apenas a fatura
+    afetada. Os totais de uma fatura custam O(1) e os lançamentos O(itens da fatura), sem varrer o ledger.
+    """
+
+    def __init__(self, repository, month_field: str = "data_efetivacao"):
+        """
+        Constrói o índice a partir do repositório e passa a observar suas alterações.
+
+        Args:
+            repository: Repositório de transações com 'events' e 'iter_all' (ex: TransactionRepository).
+            month_field (str): Campo de data que define o mês da fatura ("data_efetivacao", padrão,
+                ou "data_transacao").
+        """
+        if month_field not in DATE_FIELDS:
+            raise ValueError(f"Invalid date field: {month_field}. Use one of {DATE_FIELDS}.")
+        self._month_field = month_field
+        self._invoices = {}  # (cartão, ano, mês) -> _Invoice
+        self._keys = {}  # ID -> (cartão, ano, mês) da fatura da transação
+        super().__init__(repository)
+
+    def _reset(self):
+        """
+        Descarta o índice de faturas.
+        """
+        self._invoices = {}
+        self._keys = {}
+
+    def _apply(self, record: dict, sign: int):
+        """
+        Inclui (sign=1) ou retira (sign=-1) uma transação da sua fatura.
+        """
+        if sign > 0:
+            self._add(record)
+        else:
+            self._remove(record)
+
+    def _key(self, record: dict) -> tuple:
+        """
+        Retorna a chave (cartão, ano, mês) da fatura de uma transação.
+        """
+        # Datas ISO: o mês é extraído direto da string, sem conversão para date
+        iso = record[self._month_field]
+        return (record["cartao"], int(iso[:4]), int(iso[5:7]))
+
+    def _add(self, record: dict):
+        """
+        Inclui uma transação (formato de dicionário) na sua fatura. Transações sem cartão são ignoradas.
+        """
+        if not record["cartao"] or record["id"] in self._keys:
+            # Sem cartão não há fatura; ID repetido: o índice guarda apenas a primeira ocorrência
+            return
+        key = self._key(record)
+        invoice = self._invoices.get(key)
+        if invoice is None:
+            invoice = self._invoices[key] = _Invoice()
+        self._keys[record["id"]] = key
+        invoice.items[record["id"]] = TransactionView.from_dict(record)
+        self._add_totals(invoice, record, 1)
+
+    def _remove(self, record: dict):
+        """
+        Retira uma transação (formato de dicionário) da sua fatura.
+        """
+        key = self._keys.pop(record["id"], None)
+        if key is None:
+            return
+        invoice = self._invoices[key]
+        del invoice.items[record["id"]]
+        self._add_totals(invoice, record, -1)
+        if not invoice.items:
+            # Fatura sem lançamentos: sai do índice para não acumular meses vazios
+            del self._invoices[key]
+
+    @staticmethod
+    def _add_totals(invoice: _Invoice, record: dict, sign: int):
+        """
+        Soma (sign=1) ou subtrai (sign=-1) o valor da transação no total pago ou não pago da fatura.
+        """
+        cents = sign * round(record["valor"] * 100)
+        if record["pago"]:
+            invoice.paid += cents
+        else:
+            invoice.unpaid += cents
+
+    def _on_change(self, old: dict | None, new: dict | None):
+        """
+        Ouvinte dos eventos do repositório: retira o registro antigo e inclui o novo.
+        """
+        if (old is not None and new is not None and old["id"] == new["id"] and old["id"] in self._keys
+                and new["cartao"] and self._key(new) == self._keys[old["id"]]):
+            # Atualização na mesma fatura (ex: marcar como pago): mantém a posição do lançamento
+            invoice = self._invoices[self._keys[old["id"]]]
+            self._add_totals(invoice, old, -1)
+            self._add_totals(invoice, new, 1)
+            invoice.items[new["id"]] = TransactionView.from_dict(new)
+            return
+        super()._on_change(old, new)
+
+    def summary(self, cartao: str, year: int, month: int) -> InvoiceSummary:
+        """
+        Retorna os totais de uma fatura (zerados se o cartão não tiver lançamentos no mês).
+
+        Args:
+            cartao (str): Nome do cartão.
+            year (int): Ano da fatura.
+            month (int): Mês da fatura.
+
+        Returns:
+            InvoiceSummary: Total, parte paga, parte não paga e número de lançamentos.
+        """
+        invoice = self._invoices.get((cartao, year, month))
+        if invoice is None:
+            return InvoiceSummary(cartao, year, month, 0.0, 0.0, 0.0, 0)
+        return InvoiceSummary(cartao, year, month, (invoice.paid + invoice.unpaid) / 100,
+                              invoice.paid / 100, invoice.unpaid / 100, len(invoice.items))
+
+    def items(self, cartao: str, year: int, month: int) -> list[Transaction]:
+        """
+        Retorna os lançamentos de uma fatura, na ordem do repositório.
+
+        Args:
+            cartao (str): Nome do cartão.
+            year (int): Ano da fatura.
+            month (int): Mês da fatura.
+
+        Returns:
+            list[Transaction]: Transações da fatura.
+        """
+        invoice = self._invoices.get((cartao, year, month))
+        if invoice is None:
+            return []
+        return [view.to_transaction() for view in invoice.items.values()]
+
+    def cards(self) -> list[str]:
+        """
+        Retorna os cartões que têm alguma fatura, em ordem alfabética.
+        """
+        return sorted({cartao for cartao, _, _ in self._invoices})
+
+    def summaries(self, cartao: str | None = None, year: int | None = None) -> list[InvoiceSummary]:
+        """
+        Retorna os totais das faturas existentes, ordenados por cartão, ano e mês.
+        O custo é proporcional ao número de faturas, não ao de transações
+        (ex: doze meses de dez cartões = 120 faturas, nenhuma varredura do repositório).
+
+        Args:
+            cartao (str | None): Filtra por cartão.
+            year (int | None): Filtra por ano.
+
+        Returns:
+            list[InvoiceSummary]: Totais de cada fatura.
+        """
+        return [self.summary(*key) for key in sorted(self._invoices)
+                if (cartao is None or key[0] == cartao) and (year is None or key[1] == year)]
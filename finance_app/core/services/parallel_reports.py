@@ -0,0 +1,209 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, NamedTuple
+from finance_app.core.services.transaction_frame import DATE_COLUMNS, TransactionFrame
+
+
+class _Chunk(NamedTuple):
+    """
+    Partição enviada a um processo: fatias contíguas das colunas do frame, apenas arrays de inteiros,
+    que são serializados (pickle) como blocos de bytes, sem um objeto por transação.
+    """
+    months: array  # Mês de cada linha (ano * 12 + mês - 1)
+    categories: tuple  # Códigos das categorias n1..n{level}, um array por nível (dicionários no processo principal)
+    values: array  # Valor de cada linha, em centavos
+
+
+class CategoryReport(NamedTuple):
+    """
+    Relatório de categorias de um nível, com valores no mesmo sinal das transações.
+    Meses no formato "AAAA-MM". Cada categoria é identificada pelo caminho (n1, ..., n{level}), de modo que
+    subcategorias de mesmo nome em pais diferentes não são somadas juntas.
+    """
+    level: int
+    months: list  # Meses do período coberto (do primeiro ao último mês com transações, sem lacunas)
+    monthly: dict  # (mês, n1, ..., n{level}) -> total do mês
+    totals: dict  # Caminho da categoria -> total do período
+    yearly: dict  # (ano, n1, ..., n{level}) -> total do ano
+    monthly_average: dict  # Categoria -> média mensal no período (meses sem transações contam como 0)
+    monthly_stddev: dict  # Categoria -> desvio padrão dos totais mensais (ex: identificar meses anômalos)
+    seasonality: dict  # Categoria -> tupla com a média de cada mês do calendário (janeiro a dezembro)
+    average_transaction: dict  # Categoria -> valor médio por transação
+
+
+def aggregate_chunk(chunk: _Chunk) -> dict:
+    """
+    Agregado parcial de uma partição (executado nos processos do pool).
+
+    Returns:
+        dict: (mês, códigos das categorias n1..n{level}) -> [centavos, número de transações]
+    """
+    cells = {}
+    for key, cents in zip(zip(chunk.months, *chunk.categories), chunk.values):
+        cell = cells.get(key)
+        if cell is None:
+            cells[key] = [cents, 1]
+        else:
+            cell[0] += cents
+            cell[1] += 1
+    return cells
+
+
+class ParallelReportExecutor:
+    """
+    Executa relatórios de categorias em vários núcleos.
+    As transações são convertidas para um TransactionFrame (colunas compactas), divididas em fatias
+    contíguas de linhas (uma por processo) e cada fatia é agregada por (mês, caminho da categoria) em um
+    processo do ProcessPoolExecutor. Como a soma das células é associativa, uma mesma célula pode aparecer em
+    várias fatias: os agregados parciais são somados no processo principal, que calcula os indicadores
+    finais (totais, médias, desvio padrão, sazonalidade). O processo principal não percorre as linhas:
+    apenas copia as fatias dos arrays e soma as células parciais.
+
+    A conversão para o frame é feita uma única vez no processo principal: para vários relatórios
+    sobre os mesmos dados, passe o próprio TransactionFrame.
+    """
+
+    def __init__(self, max_workers: int | None = None, month_field: str = "data_transacao"):
+        """
+        Args:
+            max_workers (int | None): Número de processos (padrão: número de núcleos). Com 1, tudo é
+                executado no próprio processo.
+            month_field (str): Campo de data que define o mês de cada transação.
+        """
+        if month_field not in DATE_COLUMNS:
+            raise ValueError(f"Invalid date field: {month_field}. Use one of {DATE_COLUMNS}.")
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._month_field = month_field
+
+    def partition(self, frame: TransactionFrame, level: int = 1, parts: int | None = None) -> list[_Chunk]:
+        """
+        Divide as linhas do frame em fatias contíguas de tamanhos próximos (cópias de trechos dos
+        arrays, sem percorrer as linhas).
+
+        Args:
+            frame (TransactionFrame): Transações em formato colunar.
+            level (int): Nível da categoria: cada fatia leva as colunas de categoria n1 até esse nível.
+            parts (int | None): Número de fatias (padrão: número de processos).
+
+        Returns:
+            list[_Chunk]: Fatias na ordem das linhas do frame (sem fatias vazias).
+        """
+        months = frame.months(self._month_field)
+        categories = [frame.columns[f"categoria_n{n}"] for n in range(1, level + 1)]
+        values = frame.columns["valor"]
+        parts = max(1, min(parts or self._max_workers, len(frame)))
+        bounds = [len(frame) * index // parts for index in range(parts + 1)]
+        return [_Chunk(months[start:end], tuple(column[start:end] for column in categories), values[start:end])
+                for start, end in zip(bounds, bounds[1:]) if end > start]
+
+    def monthly_cells(self, source, level: int = 1) -> dict:
+        """
+        Agrega as transações por (mês, caminho da categoria), em paralelo.
+
+        Args:
+            source: TransactionFrame, repositório com iter_all ou transações no formato de dicionários.
+            level (int): Nível da categoria (1, 2 ou 3).
+
+        Returns:
+            dict: ("AAAA-MM", n1, ..., n{level}) -> (centavos, número de transações)
+        """
+        if level not in (1, 2, 3):
+            raise ValueError("Nivel hierárquico de categoria inválido. Use 1, 2 ou 3.")
+        frame = _as_frame(source)
+        chunks = self.partition(frame, level)
+        dictionaries = [frame.dictionaries[f"categoria_n{n}"] for n in range(1, level + 1)]
+        if self._max_workers == 1 or len(chunks) <= 1:
+            partials = map(aggregate_chunk, chunks)
+            return _decode(_merge(partials), dictionaries)
+        with ProcessPoolExecutor(max_workers=self._max_workers) as pool:
+            partials = pool.map(aggregate_chunk, chunks)
+            return _decode(_merge(partials), dictionaries)
+
+    def category_report(self, source, level: int = 1) -> CategoryReport:
+        """
+        Calcula o relatório de categorias de um nível (totais, médias, sazonalidade).
+
+        Args:
+            source: TransactionFrame, repositório com iter_all ou transações no formato de dicionários.
+            level (int): Nível da categoria (1, 2 ou 3).
+
+        Returns:
+            CategoryReport: Indicadores por categoria.
+        """
+        cells = self.monthly_cells(source, level)
+        if not cells:
+            return CategoryReport(level, [], {}, {}, {}, {}, {}, {}, {})
+
+        indexes = [int(key[0][:4]) * 12 + int(key[0][5:7]) - 1 for key in cells]
+        months = [f"{index // 12:04d}-{index % 12 + 1:02d}" for index in range(min(indexes), max(indexes) + 1)]
+        monthly, totals, yearly, counts = {}, {}, {}, {}
+        by_category = {}  # Caminho da categoria -> {mês: centavos}
+        for key, (cents, count) in cells.items():
+            month, category = key[0], key[1:]
+            monthly[key] = cents / 100
+            totals[category] = totals.get(category, 0) + cents
+            year_key = (int(month[:4]),) + category
+            yearly[year_key] = yearly.get(year_key, 0) + cents
+            counts[category] = counts.get(category, 0) + count
+            by_category.setdefault(category, {})[month] = cents
+
+        monthly_average, monthly_stddev, seasonality = {}, {}, {}
+        for category, values in by_category.items():
+            series = [values.get(month, 0) for month in months]
+            mean = sum(series) / len(series)
+            monthly_average[category] = mean / 100
+            monthly_stddev[category] = (sum((value - mean) ** 2 for value in series) / len(series)) ** 0.5 / 100
+            calendar = [[] for _ in range(12)]
+            for month, value in zip(months, series):
+                calendar[int(month[5:7]) - 1].append(value)
+            seasonality[category] = tuple(sum(values) / len(values) / 100 if values else 0.0
+                                          for values in calendar)
+
+        return CategoryReport(
+            level=level,
+            months=months,
+            monthly=monthly,
+            totals={category: cents / 100 for category, cents in totals.items()},
+            yearly={key: cents / 100 for key, cents in yearly.items()},
+            monthly_average=monthly_average,
+            monthly_stddev=monthly_stddev,
+            seasonality=seasonality,
+            average_transaction={category: totals[category] / counts[category] / 100 for category in totals},
+        )
+
+
+def _as_frame(source) -> TransactionFrame:
+    """
+    Converte a origem dos dados em TransactionFrame.
+    """
+    if isinstance(source, TransactionFrame):
+        return source
+    if hasattr(source, "iter_all"):
+        return TransactionFrame.from_repository(source)
+    return TransactionFrame.from_records(source)
+
+
+def _merge(partials: Iterable[dict]) -> dict:
+    """
+    Soma os agregados parciais das partições.
+    """
+    merged = {}
+    for cells in partials:
+        for key, (cents, count) in cells.items():
+            cell = merged.get(key)
+            if cell is None:
+                merged[key] = [cents, count]
+            else:
+                cell[0] += cents
+                cell[1] += count
+    return merged
+
+
+def _decode(cells: dict, dictionaries: list) -> dict:
+    """
+    Converte as chaves (mês, códigos n1..n{level}) em ("AAAA-MM", n1, ..., n{level}).
+    """
+    return {(f"{key[0] // 12:04d}-{key[0] % 12 + 1:02d}",)
+            + tuple(names[code] for names, code in zip(dictionaries, key[1:])): (cents, count)
+            for key, (cents, count) in cells.items()}
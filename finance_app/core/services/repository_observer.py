@@ -0,0 +1,59 @@
+class RepositoryObserver:
+    """
+    Base dos serviços que mantêm um índice em memória derivado das transações de um repositório.
+    O índice é construído com uma única leitura (rebuild) e mantido pelos eventos do repositório:
+    cada add/update/delete chega como (registro antigo, registro novo) e ajusta apenas o que mudou.
+
+    O índice reflete as alterações feitas pela instância de repositório observada; alterações externas
+    ao arquivo (ex: outro processo ou outra instância gravando o mesmo arquivo) exigem rebuild().
+
+    Subclasses implementam _apply (e _reset, se usarem o rebuild padrão) e podem sobrescrever rebuild
+    ou _on_change para caminhos mais rápidos.
+    """
+
+    def __init__(self, repository):
+        """
+        Constrói o índice a partir do repositório e passa a observar suas alterações.
+        Subclasses inicializam seu próprio estado antes de chamar este construtor.
+
+        Args:
+            repository: Repositório de transações com 'events' e 'iter_all' (ex: TransactionRepository).
+        """
+        self._repository = repository
+        self.rebuild()
+        repository.events.subscribe(self._on_change)
+
+    def close(self):
+        """
+        Deixa de observar o repositório.
+        """
+        self._repository.events.unsubscribe(self._on_change)
+
+    def rebuild(self):
+        """
+        Reconstrói o índice com uma única leitura do repositório.
+        """
+        self._reset()
+        for record in self._repository.iter_all():
+            self._apply(record, 1)
+
+    def _reset(self):
+        """
+        Descarta o estado derivado das transações (usado pelo rebuild padrão).
+        """
+        raise NotImplementedError
+
+    def _on_change(self, old: dict | None, new: dict | None):
+        """
+        Ouvinte dos eventos do repositório: desfaz o registro antigo e aplica o novo.
+        """
+        if old is not None:
+            self._apply(old, -1)
+        if new is not None:
+            self._apply(new, 1)
+
+    def _apply(self, record: dict, sign: int):
+        """
+        Aplica (sign=1) ou desfaz (sign=-1) uma transação (formato de dicionário) no índice.
+        """
+        raise NotImplementedError
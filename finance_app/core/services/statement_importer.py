@@ -0,0 +1,317 @@
+import codecs
+import csv
+import hashlib
+import html
+import io
+import re
+import sys
+import uuid
+from datetime import date, datetime
+from typing import BinaryIO, Iterable, Iterator, NamedTuple
+from finance_app.core.models.transaction import Transaction
+from finance_app.core.services.repository_observer import RepositoryObserver
+
+# Marcações de um arquivo OFX (SGML ou XML): <TAG>valor ou </TAG>
+_OFX_TAG = re.compile(r"<(/?)([A-Za-z0-9.]+)>([^<]*)")
+_SPACES = re.compile(r"\s+")
+
+
+class CsvFormat(NamedTuple):
+    """
+    Layout de um extrato CSV: nome da coluna de cada campo e formatos de data/valor.
+    Os padrões correspondem ao formato comum dos bancos brasileiros (ex: 05/04/2025;-1.234,56).
+    """
+    columns: dict = {"data_transacao": "Data", "descricao": "Descrição", "valor": "Valor"}  # Campo -> coluna
+    date_format: str = "%d/%m/%Y"
+    decimal: str = ","  # Separador decimal dos valores ("," ou ".")
+    delimiter: str = ";"
+    encoding: str = "utf-8-sig"
+
+
+class ImportResult(NamedTuple):
+    """
+    Resultado de uma importação de extrato.
+    """
+    rows: int  # Linhas lidas do arquivo
+    imported: list  # IDs das transações gravadas, na ordem do arquivo
+    duplicates: int  # Linhas ignoradas por já existirem no repositório
+
+
+def dedup_key(record: dict) -> bytes:
+    """
+    Chave de deduplicação de uma transação (formato de dicionário): hash de 16 bytes de
+    (data da transação, valor em centavos, descrição sem espaços repetidos, conta).
+
+    Args:
+        record (dict): Transação no formato de to_dict.
+
+    Returns:
+        bytes: Chave da transação no índice de deduplicação.
+    """
+    text = "\x1f".join((record["data_transacao"], str(round(record["valor"] * 100)),
+                        _SPACES.sub(" ", record["descricao"]).strip(), record["conta"]))
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def parse_amount(text: str, decimal: str = ",") -> float:
+    """
+    Converte um valor de extrato em float. Ex: "R$ -1.234,56" -> -1234.56
+
+    Args:
+        text (str): Valor como aparece no arquivo.
+        decimal (str): Separador decimal ("," ou ".").
+
+    Raises:
+        ValueError: Caso o texto não seja um valor numérico.
+    """
+    text = text.replace("R$", "").replace(" ", "").replace("\xa0", "")
+    if decimal == ",":
+        text = text.replace(".", "").replace(",", ".")
+    else:
+        text = text.replace(",", "")
+    return float(text)
+
+
+def iter_ofx_transactions(f, chunk_size: int = 64 * 1024) -> Iterator[dict]:
+    """
+    Percorre os lançamentos (<STMTTRN>) de um extrato OFX aberto em modo texto, lendo-o em blocos.
+    Aceita OFX 1.x (SGML, sem fechamento dos campos) e 2.x (XML).
+
+    Args:
+        f: Arquivo OFX aberto em modo texto.
+        chunk_size (int): Quantidade de caracteres lidos por vez.
+
+    Returns:
+        Iterator[dict]: Campos de cada lançamento (ex: {"DTPOSTED": "20250405", "TRNAMT": "-150.00", ...}),
+            com as entidades (ex: "&amp;") já convertidas.
+    """
+    current = None
+    buffer = ""
+    while True:
+        chunk = f.read(chunk_size)
+        buffer += chunk
+        # O valor de um campo termina no próximo "<": só o texto antes do último "<" está completo
+        cut = len(buffer) if not chunk else buffer.rfind("<")
+        if cut <= 0:
+            if not chunk:
+                return
+            continue
+        complete, buffer = buffer[:cut], buffer[cut:]
+        for closing, tag, value in _OFX_TAG.findall(complete):
+            tag = tag.upper()
+            if tag == "STMTTRN":
+                if closing:
+                    if current is not None:
+                        yield current
+                    current = None
+                else:
+                    current = {}
+            elif current is not None and not closing:
+                # Valores podem trazer entidades (ex: "&amp;" no XML do OFX 2.x)
+                current[tag] = html.unescape(value.strip())
+
+
+class StatementImporter(RepositoryObserver):
+    """
+    Importa extratos bancários (CSV ou OFX) para um repositório de transações.
+    O arquivo é lido em fluxo e gravado em lotes (um add_many por lote), sem carregar o extrato inteiro.
+
+    Mantém um índice de deduplicação (chave de dedup_key -> quantidade de transações) construído com uma
+    leitura do repositório e atualizado pelos seus eventos. Reimportar o mesmo extrato não duplica dados:
+    a n-ésima ocorrência de uma chave no arquivo só é gravada se o repositório tiver menos de n transações
+    com essa chave (lançamentos legítimos repetidos, como duas compras iguais no mesmo dia, são mantidos).
+    """
+
+    def __init__(self, repository, chunk_size: int = 10000):
+        """
+        Constrói o índice de deduplicação e passa a observar as alterações do repositório.
+
+        Args:
+            repository: Repositório de transações com 'events', 'iter_all' e 'add_many'.
+            chunk_size (int): Número de linhas do extrato por lote gravado.
+        """
+        self._chunk_size = chunk_size
+        self._counts = {}  # Chave de deduplicação -> quantidade de transações no repositório
+        super().__init__(repository)
+
+    def _reset(self):
+        """
+        Descarta o índice de deduplicação.
+        """
+        self._counts = {}
+
+    def _apply(self, record: dict, sign: int):
+        """
+        Soma (sign=1) ou subtrai (sign=-1) uma transação na contagem da sua chave de deduplicação.
+        """
+        key = dedup_key(record)
+        count = self._counts.get(key, 0) + sign
+        if count > 0:
+            self._counts[key] = count
+        else:
+            self._counts.pop(key, None)
+
+    def import_transactions(self, transactions: Iterable[Transaction]) -> ImportResult:
+        """
+        Grava transações já convertidas, ignorando as que já existem no repositório.
+        Cada lote é gravado com um único add_many; se a leitura falhar no meio, os lotes anteriores
+        permanecem gravados e uma nova importação do mesmo arquivo grava apenas o restante.
+
+        Args:
+            transactions (Iterable[Transaction]): Transações na ordem do extrato.
+
+        Returns:
+            ImportResult: Linhas lidas, IDs gravados e número de duplicatas ignoradas.
+        """
+        seen = {}  # Chave -> ocorrências no extrato até agora
+        imported = []
+        rows = duplicates = 0
+        batch = []
+        for transaction in transactions:
+            rows += 1
+            key = dedup_key(transaction.to_dict())
+            occurrence = seen[key] = seen.get(key, 0) + 1
+            # O índice só muda após a gravação do lote; até lá, ele tem as ocorrências dos lotes anteriores
+            if occurrence <= self._counts.get(key, 0):
+                duplicates += 1
+                continue
+            batch.append(transaction)
+            if len(batch) >= self._chunk_size:
+                imported.extend(self._repository.add_many(batch).applied)
+                batch = []
+        if batch:
+            imported.extend(self._repository.add_many(batch).applied)
+        return ImportResult(rows, imported, duplicates)
+
+    def import_csv(self, f: BinaryIO | str, conta: str, cartao: str = "",
+                   csv_format: CsvFormat = CsvFormat()) -> ImportResult:
+        """
+        Importa um extrato CSV com cabeçalho.
+        Colunas mapeáveis: data_transacao, descricao e valor (obrigatórias), data_efetivacao
+        (padrão: data da transação), conta, cartao e categoria_n1/n2/n3.
+
+        Args:
+            f (BinaryIO | str): Caminho do arquivo ou arquivo aberto em modo binário.
+            conta (str): Conta das transações (usada quando o extrato não tem a coluna "conta").
+            cartao (str): Cartão das transações (usado quando o extrato não tem a coluna "cartao").
+            csv_format (CsvFormat): Layout do arquivo.
+
+        Returns:
+            ImportResult: Linhas lidas, IDs gravados e número de duplicatas ignoradas.
+
+        Raises:
+            ValueError: Caso falte uma coluna obrigatória ou alguma linha seja inválida.
+        """
+        # newline="": o módulo csv trata as quebras de linha (inclusive dentro de campos entre aspas)
+        with io.TextIOWrapper(_open_binary(f), encoding=csv_format.encoding, newline="") as text:
+            reader = csv.reader(text, delimiter=csv_format.delimiter)
+            header = next(reader, None)
+            if header is None:
+                return ImportResult(0, [], 0)
+            return self.import_transactions(_csv_transactions(reader, header, conta, cartao, csv_format))
+
+    def import_ofx(self, f: BinaryIO | str, conta: str, cartao: str = "",
+                   encoding: str = "utf-8") -> ImportResult:
+        """
+        Importa um extrato OFX (conta corrente ou cartão de crédito).
+        A descrição vem de MEMO (ou NAME, se não houver MEMO) e a data de DTPOSTED.
+
+        Args:
+            f (BinaryIO | str): Caminho do arquivo ou arquivo aberto em modo binário.
+            conta (str): Conta das transações.
+            cartao (str): Cartão das transações, se for um extrato de cartão.
+            encoding (str): Codificação do arquivo (ex: "cp1252" para arquivos com CHARSET:1252).
+
+        Returns:
+            ImportResult: Linhas lidas, IDs gravados e número de duplicatas ignoradas.
+
+        Raises:
+            ValueError: Caso algum lançamento seja inválido.
+        """
+        with _open_binary(f) as binary:
+            text = codecs.getreader(encoding)(binary, errors="replace")
+            return self.import_transactions(_ofx_transactions(iter_ofx_transactions(text), conta, cartao))
+
+
+def _open_binary(f: BinaryIO | str) -> BinaryIO:
+    """
+    Abre o caminho em modo binário, ou usa o arquivo já aberto (que é fechado ao final).
+    """
+    return open(f, "rb") if isinstance(f, str) else f
+
+
+def _csv_transactions(reader, header: list, conta: str, cartao: str, csv_format: CsvFormat) -> Iterator[Transaction]:
+    """
+    Converte as linhas de um CSV em transações.
+    """
+    positions = {}
+    for field, column in csv_format.columns.items():
+        if column not in header:
+            raise ValueError(f"Column not found in CSV header: {column}")
+        positions[field] = header.index(column)
+    for field in ("data_transacao", "descricao", "valor"):
+        if field not in positions:
+            raise ValueError(f"Missing required column mapping: {field}")
+
+    dates = {}  # Texto -> date (extratos têm poucas datas distintas)
+
+    def parse_date(text: str) -> date:
+        parsed = dates.get(text)
+        if parsed is None:
+            parsed = dates[text] = datetime.strptime(text.strip(), csv_format.date_format).date()
+        return parsed
+
+    def column(row: list, field: str, default: str = "") -> str:
+        return row[positions[field]].strip() if field in positions else default
+
+    for row in reader:
+        if not any(row):
+            continue
+        try:
+            data_transacao = parse_date(row[positions["data_transacao"]])
+            yield Transaction(
+                id=uuid.uuid4(),
+                descricao=row[positions["descricao"]].strip(),
+                valor=parse_amount(row[positions["valor"]], csv_format.decimal),
+                data_transacao=data_transacao,
+                data_efetivacao=(parse_date(row[positions["data_efetivacao"]])
+                                 if "data_efetivacao" in positions else data_transacao),
+                conta=sys.intern(column(row, "conta", conta)),
+                cartao=sys.intern(column(row, "cartao", cartao)),
+                categoria_n1=sys.intern(column(row, "categoria_n1")),
+                categoria_n2=sys.intern(column(row, "categoria_n2")),
+                categoria_n3=sys.intern(column(row, "categoria_n3")),
+            )
+        except (IndexError, ValueError) as e:
+            # line_num conta as linhas físicas lidas (campos entre aspas podem ocupar várias)
+            raise ValueError(f"Invalid CSV row at line {reader.line_num}: {e}") from e
+
+
+def _ofx_transactions(entries: Iterator[dict], conta: str, cartao: str) -> Iterator[Transaction]:
+    """
+    Converte os lançamentos de um OFX em transações.
+    """
+    conta, cartao = sys.intern(conta), sys.intern(cartao)
+    dates = {}
+    for position, entry in enumerate(entries):
+        try:
+            # DTPOSTED: AAAAMMDD[HHMMSS[.XXX][fuso]]
+            posted = entry["DTPOSTED"][:8]
+            data = dates.get(posted)
+            if data is None:
+                data = dates[posted] = datetime.strptime(posted, "%Y%m%d").date()
+            yield Transaction(
+                id=uuid.uuid4(),
+                descricao=entry.get("MEMO") or entry.get("NAME", ""),
+                # Alguns bancos usam vírgula como separador decimal no OFX
+                valor=float(entry["TRNAMT"].replace(",", ".")),
+                data_transacao=data,
+                data_efetivacao=data,
+                conta=conta,
+                cartao=cartao,
+                categoria_n1="",
+                categoria_n2="",
+                categoria_n3="",
+            )
+        except (KeyError, ValueError) as e:
+            raise ValueError(f"Invalid OFX transaction at position {position}: {e!r}") from e
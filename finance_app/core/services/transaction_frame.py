@@ -0,0 +1,254 @@
+from array import array
+from datetime import date
+from itertools import accumulate, compress
+from operator import and_
+from typing import Iterable
+
+# Colunas de texto codificadas por dicionário (texto -> código inteiro)
+CODED_COLUMNS = ("conta", "cartao", "categoria_n1", "categoria_n2", "categoria_n3")
+DATE_COLUMNS = ("data_transacao", "data_efetivacao")
+
+
+class TransactionFrame:
+    """
+    Representação colunar de um conjunto de transações, voltada para agregações.
+    Cada campo é guardado em um array compacto da biblioteca padrão (módulo array):
+    - datas como ordinais inteiros (date.toordinal)
+    - valores em centavos (inteiro de 64 bits, ponto fixo)
+    - contas, cartões e categorias codificados por dicionário em inteiros
+    As operações percorrem os arrays com funções implementadas em C (map, compress, accumulate,
+    sorted), evitando laços Python com acesso a atributos por linha.
+    """
+
+    def __init__(self, dictionaries: dict | None = None):
+        """
+        Cria um frame vazio. Use from_records ou from_repository para populá-lo.
+
+        Args:
+            dictionaries (dict | None): Dicionários de códigos compartilhados (uso interno, em filtros).
+        """
+        self.ids = []
+        self.columns = {
+            "data_transacao": array("l"),
+            "data_efetivacao": array("l"),
+            "valor": array("q"),  # Centavos
+            "pago": array("b"),
+        }
+        for name in CODED_COLUMNS:
+            self.columns[name] = array("l")
+        # Nome da coluna -> lista de textos, onde a posição é o código
+        self.dictionaries = dictionaries if dictionaries is not None else {name: [] for name in CODED_COLUMNS}
+        self._codes = {name: {text: code for code, text in enumerate(values)}
+                       for name, values in self.dictionaries.items()}
+        self._month_cache = {}  # Coluna de data -> array com o mês (ano * 12 + mês - 1) de cada linha
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict]) -> "TransactionFrame":
+        """
+        Constrói o frame a partir de transações no formato de dicionários (Transaction.to_dict()).
+
+        Args:
+            records (Iterable[dict]): Transações no formato de dicionários.
+
+        Returns:
+            TransactionFrame: Frame populado.
+        """
+        frame = cls()
+        columns = frame.columns
+        ordinals = {}  # Cache de data ISO -> ordinal (há poucas datas distintas)
+
+        for record in records:
+            frame.ids.append(record["id"])
+            for name in DATE_COLUMNS:
+                iso = record[name]
+                ordinal = ordinals.get(iso)
+                if ordinal is None:
+                    ordinal = ordinals[iso] = date.fromisoformat(iso).toordinal()
+                columns[name].append(ordinal)
+            columns["valor"].append(round(record["valor"] * 100))
+            columns["pago"].append(1 if record["pago"] else 0)
+            for name in CODED_COLUMNS:
+                columns[name].append(frame._encode(name, record[name]))
+        return frame
+
+    @classmethod
+    def from_repository(cls, repository) -> "TransactionFrame":
+        """
+        Constrói o frame percorrendo um repositório de transações em modo streaming.
+
+        Args:
+            repository: Repositório com o método iter_all (ex: TransactionRepository).
+
+        Returns:
+            TransactionFrame: Frame populado.
+        """
+        return cls.from_records(repository.iter_all())
+
+    def __len__(self) -> int:
+        """
+        Retorna o número de linhas (transações) do frame.
+        """
+        return len(self.ids)
+
+    def _encode(self, name: str, text: str) -> int:
+        """
+        Retorna o código de um texto na coluna, registrando-o no dicionário se for novo.
+        """
+        code = self._codes[name].get(text)
+        if code is None:
+            code = self._codes[name][text] = len(self.dictionaries[name])
+            self.dictionaries[name].append(text)
+        return code
+
+    def months(self, field: str = "data_transacao") -> array:
+        """
+        Retorna a coluna de meses (ano * 12 + mês - 1) derivada de uma coluna de data.
+        A coluna é calculada uma única vez por campo e não deve ser alterada.
+        """
+        if field not in self._month_cache:
+            months = {}  # Ordinal -> mês
+            for ordinal in set(self.columns[field]):
+                day = date.fromordinal(ordinal)
+                months[ordinal] = day.year * 12 + day.month - 1
+            self._month_cache[field] = array("l", map(months.__getitem__, self.columns[field]))
+        return self._month_cache[field]
+
+    def _take(self, rows: list) -> "TransactionFrame":
+        """
+        Retorna um novo frame apenas com as linhas informadas, compartilhando os dicionários.
+        """
+        frame = TransactionFrame(self.dictionaries)
+        frame.ids = list(map(self.ids.__getitem__, rows))
+        for name, column in self.columns.items():
+            frame.columns[name] = array(column.typecode, map(column.__getitem__, rows))
+        return frame
+
+    def filter(self, start: date | None = None, end: date | None = None, field: str = "data_transacao",
+               **equals) -> "TransactionFrame":
+        """
+        Filtra as linhas por intervalo de datas e/ou igualdade em colunas codificadas.
+
+        Args:
+            start (date | None): Data inicial (inclusiva).
+            end (date | None): Data final (inclusiva).
+            field (str): Coluna de data usada no intervalo.
+            **equals: Colunas codificadas e o texto esperado (ex: categoria_n1="Moradia", pago=True).
+
+        Returns:
+            TransactionFrame: Novo frame com as linhas selecionadas.
+        """
+        if field not in DATE_COLUMNS:
+            raise ValueError(f"Invalid date field: {field}. Use one of {DATE_COLUMNS}.")
+        masks = []
+        if start is not None:
+            masks.append(map(start.toordinal().__le__, self.columns[field]))
+        if end is not None:
+            masks.append(map(end.toordinal().__ge__, self.columns[field]))
+        for name, value in equals.items():
+            if name == "pago":
+                masks.append(map((1 if value else 0).__eq__, self.columns["pago"]))
+                continue
+            if name not in CODED_COLUMNS:
+                raise ValueError(f"Invalid column: {name}. Use one of {CODED_COLUMNS + ('pago',)}.")
+            code = self._codes[name].get(value)
+            if code is None:
+                # Texto inexistente: nenhuma linha corresponde
+                return self._take([])
+            masks.append(map(code.__eq__, self.columns[name]))
+
+        if not masks:
+            return self._take(range(len(self)))
+        mask = masks[0]
+        for other in masks[1:]:
+            mask = map(and_, mask, other)
+        return self._take(list(compress(range(len(self)), mask)))
+
+    def group_sum(self, by: tuple, month_field: str = "data_transacao") -> dict:
+        """
+        Soma os valores (em centavos) agrupando por uma ou mais colunas.
+
+        Args:
+            by (tuple): Colunas de agrupamento: colunas codificadas e/ou "month"
+                (mês de month_field, no formato "AAAA-MM").
+            month_field (str): Coluna de data usada para "month".
+
+        Returns:
+            dict: Tupla com os valores das colunas (na ordem de 'by') -> soma em centavos,
+                na ordem em que cada grupo aparece pela primeira vez.
+        """
+        keys = []
+        for name in by:
+            if name == "month":
+                keys.append(self.months(month_field))
+            elif name in CODED_COLUMNS:
+                keys.append(self.columns[name])
+            else:
+                raise ValueError(f"Invalid group column: {name}.")
+
+        # Uma única passada acumulando por chave de códigos; só as chaves distintas são decodificadas
+        totals = {}
+        get = totals.get
+        for key, value in zip(zip(*keys), self.columns["valor"]):
+            totals[key] = get(key, 0) + value
+        return {self._decode_key(by, key): total for key, total in totals.items()}
+
+    def _decode_key(self, by: tuple, key: tuple) -> tuple:
+        """
+        Converte os códigos de uma chave de agrupamento de volta para texto.
+        """
+        decoded = []
+        for name, code in zip(by, key):
+            if name == "month":
+                year, month = divmod(code, 12)
+                decoded.append(f"{year:04d}-{month + 1:02d}")
+            else:
+                decoded.append(self.dictionaries[name][code])
+        return tuple(decoded)
+
+    def monthly_totals(self, level: int = 1, month_field: str = "data_transacao") -> dict:
+        """
+        Totais mensais (em centavos) por categoria de um nível.
+        A categoria é identificada pelo caminho completo (n1, ..., n{level}), de modo que
+        subcategorias de mesmo nome em pais diferentes não são somadas juntas.
+
+        Args:
+            level (int): Nível da categoria (1, 2 ou 3).
+            month_field (str): Coluna de data usada para definir o mês.
+
+        Returns:
+            dict: ("AAAA-MM", categoria_n1, ..., categoria_n{level}) -> soma em centavos.
+        """
+        if level not in (1, 2, 3):
+            raise ValueError("Nivel hierárquico de categoria inválido. Use 1, 2 ou 3.")
+        path = tuple(f"categoria_n{n}" for n in range(1, level + 1))
+        return self.group_sum(("month",) + path, month_field=month_field)
+
+    def sorted_by(self, field: str = "data_transacao") -> "TransactionFrame":
+        """
+        Retorna um novo frame ordenado por uma coluna de data (ordenação estável).
+
+        Args:
+            field (str): Coluna de data.
+
+        Returns:
+            TransactionFrame: Novo frame ordenado.
+        """
+        if field not in DATE_COLUMNS:
+            raise ValueError(f"Invalid date field: {field}. Use one of {DATE_COLUMNS}.")
+        column = self.columns[field]
+        return self._take(sorted(range(len(self)), key=column.__getitem__))
+
+    def cumsum(self) -> array:
+        """
+        Soma acumulada dos valores (em centavos), na ordem atual das linhas.
+
+        Returns:
+            array: Array de inteiros de 64 bits com a soma acumulada.
+        """
+        return array("q", accumulate(self.columns["valor"]))
+
+    def total(self) -> int:
+        """
+        Soma de todos os valores (em centavos).
+        """
+        return sum(self.columns["valor"])
@@ -0,0 +1,204 @@
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from heapq import nsmallest
+from finance_app.core.models.transaction import Transaction
+from finance_app.core.models.transaction_view import TransactionView
+from finance_app.core.services.repository_observer import RepositoryObserver
+
+_WORD = re.compile(r"\w+")
+_TOKEN_CACHE_SIZE = 65536
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Divide um texto em termos de busca: minúsculos, sem acentos e sem pontuação.
+    Ex: "Pão de Açúcar - SP" -> ["pao", "de", "acucar", "sp"]
+
+    Args:
+        text (str): Texto a ser dividido.
+
+    Returns:
+        list[str]: Termos na ordem do texto.
+    """
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    folded = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return _WORD.findall(folded)
+
+
+class TransactionSearchIndex(RepositoryObserver):
+    """
+    Índice invertido sobre a descrição das transações: termo -> IDs das transações que o contêm.
+    Mantido de forma incremental pelos eventos do repositório (cada add/update/delete ajusta apenas
+    os termos da transação alterada). As transações ficam em memória como TransactionView,
+    então uma busca não lê o repositório.
+    """
+
+    def __init__(self, repository):
+        """
+        Constrói o índice a partir do repositório e passa a observar suas alterações.
+
+        Args:
+            repository: Repositório de transações com 'events' e 'iter_all' (ex: TransactionRepository).
+        """
+        self._postings = {}  # Termo -> IDs das transações
+        self._terms = []  # Termos em ordem alfabética (busca por prefixo)
+        self._records = {}  # ID -> TransactionView
+        self._order = {}  # ID -> sequência de inserção (resultados na ordem do repositório)
+        self._next = 0
+        self._token_cache = {}  # Descrição -> termos (descrições se repetem muito)
+        super().__init__(repository)
+
+    def __len__(self) -> int:
+        """
+        Retorna o número de transações indexadas.
+        """
+        return len(self._records)
+
+    def rebuild(self):
+        """
+        Reconstrói o índice com uma única leitura do repositório (os termos são ordenados uma única vez).
+        """
+        self._postings = {}
+        self._records = {}
+        self._order = {}
+        self._next = 0
+        for record in self._repository.iter_all():
+            self._add(record, keep_sorted=False)
+        self._terms = sorted(self._postings)
+
+    def _tokens(self, descricao: str) -> set:
+        """
+        Retorna os termos distintos de uma descrição, com cache.
+        """
+        tokens = self._token_cache.get(descricao)
+        if tokens is None:
+            if len(self._token_cache) >= _TOKEN_CACHE_SIZE:
+                # Muitas descrições distintas: recomeça o cache em vez de crescer sem limite
+                self._token_cache.clear()
+            tokens = self._token_cache[descricao] = frozenset(tokenize(descricao))
+        return tokens
+
+    def _add(self, record: dict, keep_sorted: bool = True):
+        """
+        Indexa uma transação (formato de dicionário).
+        """
+        record_id = record["id"]
+        if record_id in self._records:
+            # ID repetido no repositório: o índice guarda apenas a primeira ocorrência
+            return
+        self._records[record_id] = TransactionView.from_dict(record)
+        self._order[record_id] = self._next
+        self._next += 1
+        for token in self._tokens(record["descricao"]):
+            ids = self._postings.get(token)
+            if ids is None:
+                ids = self._postings[token] = set()
+                if keep_sorted:
+                    insort(self._terms, token)
+            ids.add(record_id)
+
+    def _remove(self, record: dict):
+        """
+        Remove uma transação (formato de dicionário) do índice.
+        """
+        record_id = record["id"]
+        if self._records.pop(record_id, None) is None:
+            return
+        del self._order[record_id]
+        for token in self._tokens(record["descricao"]):
+            ids = self._postings[token]
+            ids.discard(record_id)
+            if not ids:
+                # Termo sem transações: sai do índice para não acumular termos mortos
+                del self._postings[token]
+                del self._terms[bisect_left(self._terms, token)]
+
+    def _apply(self, record: dict, sign: int):
+        """
+        Indexa (sign=1) ou desindexa (sign=-1) uma transação.
+        """
+        if sign > 0:
+            self._add(record)
+        else:
+            self._remove(record)
+
+    def _on_change(self, old: dict | None, new: dict | None):
+        """
+        Ouvinte dos eventos do repositório: desindexa o registro antigo e indexa o novo.
+        """
+        if old is not None and new is not None and old["id"] == new["id"] and old["id"] in self._records:
+            # Atualização: o repositório mantém a posição da transação, então a ordem também é mantida
+            if old["descricao"] == new["descricao"]:
+                # Descrição inalterada: só troca o registro guardado
+                self._records[new["id"]] = TransactionView.from_dict(new)
+                return
+            seq = self._order[old["id"]]
+            self._remove(old)
+            self._add(new)
+            self._order[new["id"]] = seq
+            return
+        super()._on_change(old, new)
+
+    def _matching(self, term: str, prefix: bool) -> set:
+        """
+        Retorna os IDs das transações que contêm o termo (ou algum termo que começa com ele).
+        """
+        if not prefix:
+            return self._postings.get(term, set())
+        start = bisect_left(self._terms, term)
+        end = bisect_left(self._terms, term + "\U0010ffff", start)
+        if end - start == 1:
+            return self._postings[self._terms[start]]
+        return set().union(*(self._postings[token] for token in self._terms[start:end]))
+
+    def search_ids(self, query: str, limit: int | None = None) -> list[str]:
+        """
+        Busca as transações cuja descrição contém todos os termos da consulta (E lógico).
+        Termos terminados em "*" buscam por prefixo (ex: "super*" encontra "supermercado").
+        A consulta passa pela mesma normalização das descrições (sem acentos e sem distinção
+        de maiúsculas).
+
+        Args:
+            query (str): Termos separados por espaço.
+            limit (int | None): Número máximo de IDs retornados (os primeiros na ordem do repositório).
+
+        Returns:
+            list[str]: IDs das transações encontradas, na ordem do repositório.
+        """
+        criteria = []
+        for word in query.split():
+            prefix = word.endswith("*")
+            tokens = tokenize(word)
+            for i, token in enumerate(tokens):
+                # Em "uber-eat*", apenas o último termo é prefixo
+                criteria.append((token, prefix and i == len(tokens) - 1))
+        if not criteria:
+            return []
+
+        # Intersecção a partir do menor conjunto: o custo é proporcional a ele, não ao ledger
+        smallest, *others = sorted((self._matching(token, prefix) for token, prefix in criteria), key=len)
+        result = smallest
+        for ids in others:
+            result = result & ids
+            if not result:
+                return []
+        order = self._order.__getitem__
+        if limit is not None and limit < len(result):
+            # Apenas os primeiros: seleção parcial em vez de ordenar todos os resultados
+            return nsmallest(limit, result, key=order)
+        return sorted(result, key=order)
+
+    def search(self, query: str, limit: int | None = None) -> list[Transaction]:
+        """
+        Busca as transações cuja descrição contém todos os termos da consulta.
+        Veja search_ids para a sintaxe da consulta.
+
+        Args:
+            query (str): Termos separados por espaço.
+            limit (int | None): Número máximo de transações retornadas.
+
+        Returns:
+            list[Transaction]: Transações encontradas, na ordem do repositório.
+        """
+        return [self._records[record_id].to_transaction() for record_id in self.search_ids(query, limit)]
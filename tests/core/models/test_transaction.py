@@ -71,5 +71,48 @@ class TestTransaction(unittest.TestCase):
                 pago=False
             )
 
+    def test_slots(self):
+        """
+        Transaction não deve ter __dict__ por instância (usa __slots__).
+        """
+        t = Transaction.from_dict({
+            "id": str(uuid.uuid4()), "descricao": "Mercado", "data_transacao": "2025-04-01",
+            "data_efetivacao": "2025-04-01", "valor": -10.0, "conta": "Itaú", "cartao": "",
+            "categoria_n1": "Estilo de Vida", "categoria_n2": "Alimentação", "categoria_n3": "Mercado", "pago": False
+        })
+        self.assertFalse(hasattr(t, "__dict__"))
+        with self.assertRaises(AttributeError):
+            t.outro_campo = 1
+
+    def test_from_dicts(self):
+        """
+        Deve criar as transações compartilhando textos repetidos e datas iguais.
+        """
+        records = [{
+            "id": str(uuid.uuid4()), "descricao": "Mercado", "data_transacao": "2025-04-01",
+            "data_efetivacao": "2025-04-02", "valor": -10.0, "conta": "".join(["It", "aú"]), "cartao": "",
+            "categoria_n1": "Estilo de Vida", "categoria_n2": "Alimentação", "categoria_n3": "Mercado", "pago": False
+        } for _ in range(3)]
+
+        transactions = Transaction.from_dicts(records)
+
+        self.assertEqual([t.to_dict() for t in transactions], records)
+        self.assertIs(transactions[0].conta, transactions[2].conta)
+        self.assertIs(transactions[0].data_transacao, transactions[2].data_transacao)
+        self.assertEqual(transactions[1].data_efetivacao, date(2025, 4, 2))
+
+    def test_from_dict_textos_nao_str(self):
+        """
+        Deve aceitar valores que não são texto (ex: None) nos campos internados, como antes do internamento.
+        """
+        record = {
+            "id": str(uuid.uuid4()), "descricao": "Mercado", "data_transacao": "2025-04-01",
+            "data_efetivacao": "2025-04-02", "valor": -10.0, "conta": "Itaú", "cartao": None,
+            "categoria_n1": "Estilo de Vida", "categoria_n2": None, "categoria_n3": None, "pago": False
+        }
+
+        self.assertIsNone(Transaction.from_dict(record).cartao)
+        self.assertIsNone(Transaction.from_dicts([record])[0].categoria_n2)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+import uuid
+from datetime import date
+from finance_app.core.models.transaction import Transaction
+from finance_app.core.models.transaction_view import TransactionView
+
+class TestTransactionView(unittest.TestCase):
+    """
+    Testes unitários para a classe TransactionView.
+    Verifica que a visão compacta expõe os mesmos atributos de Transaction.
+    """
+
+    def setUp(self):
+        self.transaction = Transaction(
+            id=uuid.uuid4(),
+            descricao="Gasolina",
+            valor=-150.00,
+            data_transacao=date(2025, 4, 2),
+            data_efetivacao=date(2025, 4, 10),
+            conta="Nubank",
+            cartao="Visa",
+            categoria_n1="Transporte",
+            categoria_n2="Carro",
+            categoria_n3="Combustível",
+            pago=False
+        )
+
+    def test_mesmos_atributos(self):
+        """
+        Deve expor os mesmos atributos, tipo e to_dict da transação de origem.
+        """
+        view = TransactionView.from_dict(self.transaction.to_dict())
+
+        for name in ("id", "descricao", "valor", "data_transacao", "data_efetivacao", "conta", "cartao",
+                     "categoria_n1", "categoria_n2", "categoria_n3", "pago", "tipo"):
+            self.assertEqual(getattr(view, name), getattr(self.transaction, name))
+        self.assertEqual(view.to_dict(), self.transaction.to_dict())
+        self.assertEqual(view.to_transaction(), self.transaction)
+        self.assertEqual(str(view), str(self.transaction))
+
+    def test_from_dicts(self):
+        """
+        Deve criar uma visão por registro, compartilhando os textos repetidos.
+        """
+        records = [self.transaction.to_dict(), self.transaction.to_dict()]
+        records[1]["conta"] = "".join(["Nu", "bank"])
+
+        views = TransactionView.from_dicts(records)
+
+        self.assertEqual([view.to_dict() for view in views], records)
+        self.assertIs(views[0].conta, views[1].conta)
+        self.assertEqual(views[0], views[1])
+
+    def test_conversoes_memorizadas(self):
+        """
+        Deve converter id e datas uma única vez e não ser usada como chave (é mutável).
+        """
+        view = TransactionView.from_dict(self.transaction.to_dict())
+
+        self.assertIs(view.id, view.id)
+        self.assertIs(view.data_transacao, view.data_transacao)
+        self.assertIs(view.data_efetivacao, view.data_efetivacao)
+        with self.assertRaises(TypeError):
+            hash(view)
+
+    def test_textos_nao_str(self):
+        """
+        Deve aceitar valores que não são texto (ex: None) nos campos internados.
+        """
+        record = self.transaction.to_dict()
+        record["cartao"] = None
+
+        self.assertIsNone(TransactionView.from_dicts([record])[0].cartao)
+
+    def test_marca_como_pago(self):
+        """
+        Deve alterar apenas o status de pagamento, sem permitir outros atributos.
+        """
+        view = TransactionView.from_dict(self.transaction.to_dict())
+        view.marcar_como_pago()
+
+        self.assertTrue(view.pago)
+        self.assertEqual(view.valor, -150.00)
+        with self.assertRaises(AttributeError):
+            view.valor = 0
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,224 @@
+import asyncio
+import os
+import threading
+import time
+import unittest
+import uuid
+from dataclasses import replace
+from datetime import date
+from finance_app.core.models.category import Category
+from finance_app.core.models.transaction import Transaction
+from finance_app.core.repositories.async_repository import AsyncCategoryRepository, AsyncTransactionRepository
+from finance_app.core.repositories.category_repository import CategoryRepository
+from finance_app.core.repositories.sqlite_transaction_repository import SQLiteTransactionRepository
+from finance_app.core.repositories.transaction_repository import TransactionRepository
+from tests.factories import make_transaction
+
+
+class TestAsyncTransactionRepository(unittest.IsolatedAsyncioTestCase):
+    """
+    Testes unitários para a classe AsyncTransactionRepository.
+    Verifica a união de leituras concorrentes e o agrupamento de escritas
+    """
+
+    def setUp(self):
+        # Criar um arquivo temporário para testes
+        os.makedirs("tests/tmp", exist_ok=True)
+        self.filepath = "tests/tmp/transactions_async_test.json"
+        self.repo = TransactionRepository(filepath=self.filepath)
+        self.calls = []
+        for name in ("list_all", "add_many", "update_many", "delete_many"):
+            setattr(self.repo, name, self.counted(name, getattr(self.repo, name)))
+        self.async_repo = AsyncTransactionRepository(self.repo)
+
+
+    def tearDown(self):
+        # Deletar o arquivo temporário
+        self.async_repo.close()
+        if os.path.exists(self.filepath):
+            os.remove(self.filepath)
+
+
+    def counted(self, name, method):
+        """
+        Envolve um método do repositório síncrono registrando as chamadas (leituras ficam mais lentas,
+        para que as chamadas concorrentes se sobreponham).
+        """
+        lock = threading.Lock()
+
+        def wrapper(*args):
+            with lock:
+                self.calls.append((name, len(args[0]) if args and isinstance(args[0], list) else None))
+            if name == "list_all":
+                time.sleep(0.05)
+            return method(*args)
+        return wrapper
+
+
+    async def test_leituras_concorrentes(self):
+        """
+        Leituras iguais concorrentes devem compartilhar uma única execução, com listas independentes
+        """
+        await self.async_repo.add(make_transaction())
+        self.calls.clear()
+
+        results = await asyncio.gather(*(self.async_repo.list_all() for _ in range(10)))
+
+        self.assertEqual(self.calls, [("list_all", None)])
+        self.assertTrue(all(result == results[0] for result in results))
+        results[0].clear()
+        self.assertEqual(len(results[1]), 1)
+
+
+    async def test_escritas_agrupadas(self):
+        """
+        Escritas concorrentes devem ser gravadas em grupo, na ordem de chegada
+        """
+        transactions = [make_transaction(f"Compra {i}") for i in range(10)]
+
+        await asyncio.gather(*(self.async_repo.add(t) for t in transactions))
+
+        self.assertEqual(self.calls, [("add_many", 10)])
+        self.assertEqual([t.descricao for t in await self.async_repo.list_transactions()],
+                         [t.descricao for t in transactions])
+
+        self.calls.clear()
+        transactions[0].marcar_como_pago()
+        await asyncio.gather(self.async_repo.update(transactions[0]), self.async_repo.delete(transactions[1]),
+                             self.async_repo.delete(transactions[2]), self.async_repo.add(make_transaction()))
+        self.assertEqual(self.calls, [("update_many", 1), ("delete_many", 2), ("add_many", 1)])
+        self.assertTrue((await self.async_repo.get_by_id(transactions[0].id)).pago)
+        self.assertEqual(len(await self.async_repo.list_by_month(2025, 4)), 9)
+
+
+    async def test_erros_individuais(self):
+        """
+        Uma escrita inválida deve falhar sem afetar as demais do mesmo grupo
+        """
+        existing = make_transaction()
+        missing = make_transaction()
+        await self.async_repo.add(existing)
+
+        results = await asyncio.gather(self.async_repo.update(missing), self.async_repo.update(existing),
+                                       self.async_repo.delete(missing), return_exceptions=True)
+
+        self.assertIsInstance(results[0], ValueError)
+        self.assertEqual(str(results[0]), f"Transaction with ID {missing.id} not found.")
+        self.assertEqual(results[1:], [None, None])
+
+
+    async def test_add_duplicado(self):
+        """
+        Uma adição com ID já existente (no repositório ou no mesmo grupo) deve falhar individualmente
+        """
+        existing = make_transaction()
+        await self.async_repo.add(existing)
+        new = make_transaction()
+
+        results = await asyncio.gather(self.async_repo.add(existing), self.async_repo.add(new),
+                                       self.async_repo.add(new), return_exceptions=True)
+
+        self.assertIsInstance(results[0], ValueError)
+        self.assertEqual(str(results[0]), f"Transaction with ID {existing.id} already exists.")
+        self.assertIsNone(results[1])
+        self.assertIsInstance(results[2], ValueError)
+        self.assertEqual(len(await self.async_repo.list_all()), 2)
+
+
+    async def test_gravacao_cancelada(self):
+        """
+        Cancelar a gravação em grupo deve cancelar as escritas que aguardam, sem travar as seguintes
+        """
+        # Cancelada antes de começar e durante a espera por outras escritas (batch_delay)
+        for delay in (0.0, 0.05):
+            self.async_repo._batch_delay = delay
+            writes = [asyncio.ensure_future(self.async_repo.add(make_transaction())) for _ in range(2)]
+            await asyncio.sleep(delay / 2)  # As escritas entram no grupo e a gravação é agendada
+            self.async_repo._flush_task.cancel()
+
+            results = await asyncio.gather(*writes, return_exceptions=True)
+            self.assertTrue(all(isinstance(result, asyncio.CancelledError) for result in results))
+            self.assertEqual(self.calls, [])
+
+        self.async_repo._batch_delay = 0.0
+
+        await self.async_repo.add(make_transaction())
+        self.assertEqual(self.calls, [("add_many", 1)])
+
+
+class TestAsyncSQLiteTransactionRepository(unittest.IsolatedAsyncioTestCase):
+    """
+    Testes unitários do AsyncTransactionRepository sobre o SQLiteTransactionRepository.
+    Verifica o uso da conexão a partir das threads do pool
+    """
+
+    def setUp(self):
+        # Criar um banco temporário para testes
+        os.makedirs("tests/tmp", exist_ok=True)
+        self.filepath = "tests/tmp/transactions_async_test.db"
+        self.repo = SQLiteTransactionRepository(filepath=self.filepath)
+        self.async_repo = AsyncTransactionRepository(self.repo)
+
+
+    def tearDown(self):
+        # Fechar a conexão e deletar o banco temporário (e os arquivos do WAL)
+        self.async_repo.close()
+        self.repo.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.filepath + suffix):
+                os.remove(self.filepath + suffix)
+
+
+    async def test_crud_concorrente(self):
+        """
+        Leituras e escritas concorrentes devem funcionar a partir das threads do pool
+        """
+        transactions = [make_transaction(f"Compra {i}") for i in range(10)]
+        await asyncio.gather(*(self.async_repo.add(t) for t in transactions))
+
+        results = await asyncio.gather(self.async_repo.get_by_id(transactions[0].id),
+                                       self.async_repo.list_by_month(2025, 4), self.async_repo.list_all(),
+                                       self.async_repo.update(replace(transactions[1], descricao="Padaria")),
+                                       self.async_repo.delete(transactions[2]))
+        self.assertEqual(results[0], transactions[0])
+        self.assertEqual(len(results[2]), 10)
+
+        self.assertEqual((await self.async_repo.get_by_id(transactions[1].id)).descricao, "Padaria")
+        self.assertIsNone(await self.async_repo.get_by_id(transactions[2].id))
+        self.assertEqual(len(await self.async_repo.list_transactions()), 9)
+
+
+class TestAsyncCategoryRepository(unittest.IsolatedAsyncioTestCase):
+    """
+    Testes unitários para a classe AsyncCategoryRepository.
+    """
+
+    def setUp(self):
+        # Criar um arquivo temporário para testes
+        os.makedirs("tests/tmp", exist_ok=True)
+        self.filepath = "tests/tmp/categories_async_test.json"
+        self.async_repo = AsyncCategoryRepository(CategoryRepository(filepath=self.filepath))
+
+
+    def tearDown(self):
+        # Deletar o arquivo temporário
+        self.async_repo.close()
+        if os.path.exists(self.filepath):
+            os.remove(self.filepath)
+
+
+    async def test_crud(self):
+        """
+        Deve adicionar, consultar a hierarquia e remover categorias sem bloquear o loop
+        """
+        moradia = Category(id=uuid.uuid4(), nome="Moradia", nivel=1)
+        contas = Category(id=uuid.uuid4(), nome="Contas", nivel=2, categoria_pai=moradia.id)
+        await asyncio.gather(self.async_repo.add(moradia), self.async_repo.add(contas))
+
+        self.assertEqual(await self.async_repo.list_by_parent(moradia.id), [contas])
+        self.assertEqual(await self.async_repo.path(contas.id), [moradia, contas])
+
+        await self.async_repo.delete(contas)
+        with self.assertRaisesRegex(ValueError, "Category not found!"):
+            await self.async_repo.delete(contas)
+        self.assertEqual(await self.async_repo.list_all(), [moradia])
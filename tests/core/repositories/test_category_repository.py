@@ -1,6 +1,9 @@
+import json
 import os
+import shutil
 import unittest
 import uuid
+from unittest.mock import patch
 from finance_app.core.models.category import Category
 from finance_app.core.repositories.category_repository import CategoryRepository
 
@@ -18,8 +21,9 @@ class TestCategoryRepository(unittest.TestCase):
 
 
     def tearDown(self):
-        # Deletar o arquivo temporário
-        os.remove("tests/tmp/categories_test.json")
+        # Deletar o arquivo temporário (se o teste chegou a criá-lo)
+        if os.path.exists("tests/tmp/categories_test.json"):
+            os.remove("tests/tmp/categories_test.json")
 
 
     def test_add(self):
@@ -177,4 +181,160 @@ class TestCategoryRepository(unittest.TestCase):
         self.assertEqual(self.repo.list_by_parent(c6.id), [c7])
         self.assertEqual(self.repo.list_by_parent(c7.id), [])
         self.assertEqual(self.repo.list_by_parent(c8.id), [c9])
-        self.assertEqual(self.repo.list_by_parent(c9.id), [c10])
\ No newline at end of file
+        self.assertEqual(self.repo.list_by_parent(c9.id), [c10])
+
+
+    def test_add_many(self):
+        """
+        Deve adicionar várias categorias de uma vez, ignorando IDs duplicados
+        """
+        c1 = Category(id=uuid.uuid4(), nome="Vivendo o agora", nivel=1)
+        c2 = Category(id=uuid.uuid4(), nome="Restaurante", nivel=2, categoria_pai=c1.id)
+        self.repo.add(c1)
+
+        # c1 já existe no repo e c2 se repete no lote
+        result = self.repo.add_many([c1, c2, c2])
+
+        self.assertEqual(result.applied, [c2.id])
+        self.assertEqual(result.skipped, [c1.id, c2.id])
+        self.assertEqual(len(self.repo.list_all()), 2)
+
+
+    def test_update_many(self):
+        """
+        Deve atualizar várias categorias de uma vez, reportando IDs inexistentes
+        """
+        c1 = Category(id=uuid.uuid4(), nome="Vivendo o agora", nivel=1)
+        c2 = Category(id=uuid.uuid4(), nome="Carro", nivel=1)
+        cx = Category(id=uuid.uuid4(), nome="Inexistente", nivel=1)
+        self.repo.add_many([c1, c2])
+
+        c1.nome = "Estilo de vida"
+        c2.nome = "Transporte"
+        result = self.repo.update_many([c1, cx, c2])
+
+        self.assertEqual(result.applied, [c1.id, c2.id])
+        self.assertEqual(result.skipped, [cx.id])
+        self.assertEqual(self.repo.get_by_id(c1.id).nome, "Estilo de vida")
+        self.assertEqual(self.repo.get_by_id(c2.id).nome, "Transporte")
+
+
+    def test_delete_many(self):
+        """
+        Deve deletar várias categorias (por objeto ou ID), reportando IDs inexistentes
+        """
+        c1 = Category(id=uuid.uuid4(), nome="Vivendo o agora", nivel=1)
+        c2 = Category(id=uuid.uuid4(), nome="Carro", nivel=1)
+        c3 = Category(id=uuid.uuid4(), nome="Casa", nivel=1)
+        missing_id = uuid.uuid4()
+        self.repo.add_many([c1, c2, c3])
+
+        result = self.repo.delete_many([c1, c2.id, missing_id])
+
+        self.assertEqual(result.applied, [c1.id, c2.id])
+        self.assertEqual(result.skipped, [missing_id])
+        self.assertEqual(self.repo.list_all(), [c3])
+
+
+    def test_tree(self):
+        """
+        Deve navegar pela hierarquia: filhos, caminho até a raiz e descendentes
+        """
+        c1 = Category(id=uuid.uuid4(), nome="Estilo de vida", nivel=1)
+        c2 = Category(id=uuid.uuid4(), nome="Carro", nivel=2, categoria_pai=c1.id)
+        c3 = Category(id=uuid.uuid4(), nome="Gasolina", nivel=3, categoria_pai=c2.id)
+        c4 = Category(id=uuid.uuid4(), nome="Restaurante", nivel=2, categoria_pai=c1.id)
+        self.repo.add_many([c1, c2, c3, c4])
+
+        self.assertEqual(self.repo.get_tree().roots(), [c1])
+        self.assertEqual(self.repo.list_by_parent(c1.id), [c2, c4])
+        self.assertEqual(self.repo.path(c3.id), [c1, c2, c3])
+        self.assertEqual(self.repo.path(uuid.uuid4()), [])
+        self.assertEqual(self.repo.descendants(c1.id), [c2, c3, c4])
+        self.assertEqual(self.repo.get_tree().parent(c3.id), c2)
+
+
+    def test_tree_somente_leitura(self):
+        """
+        Consultar a hierarquia não deve gravar o carimbo de validação
+        """
+        stamp = "tests/tmp/categories_test.json.stamp"
+        if os.path.exists(stamp):
+            os.remove(stamp)
+        c1 = Category(id=uuid.uuid4(), nome="Estilo de vida", nivel=1)
+        c2 = Category(id=uuid.uuid4(), nome="Carro", nivel=2, categoria_pai=c1.id)
+        self.repo.add_many([c1, c2])
+
+        other = CategoryRepository(filepath="tests/tmp/categories_test.json")
+        self.assertEqual(other.list_by_parent(c1.id), [c2])
+        self.assertFalse(os.path.exists(stamp))
+
+        # Categoria inválida gravada por fora: a consulta falha, mas nada é gravado
+        with open("tests/tmp/categories_test.json", "w") as f:
+            json.dump([{"id": str(uuid.uuid4()), "nome": "Órfã", "nivel": 2, "categoria_pai": None}], f)
+        with self.assertRaises(ValueError):
+            other.path(c1.id)
+        self.assertFalse(os.path.exists(stamp))
+
+
+    def test_tree_invalidado_apos_alteracao(self):
+        """
+        O índice da hierarquia deve refletir alterações feitas após sua construção
+        """
+        c1 = Category(id=uuid.uuid4(), nome="Estilo de vida", nivel=1)
+        c2 = Category(id=uuid.uuid4(), nome="Carro", nivel=2, categoria_pai=c1.id)
+        self.repo.add(c1)
+        self.assertEqual(self.repo.descendants(c1.id), [])
+
+        self.repo.add(c2)
+        self.assertEqual(self.repo.descendants(c1.id), [c2])
+
+        # Alteração feita por outra instância
+        CategoryRepository(filepath="tests/tmp/categories_test.json").delete(c2)
+        self.assertEqual(self.repo.descendants(c1.id), [])
+
+
+
+    def test_arquivo_corrompido(self):
+        """
+        Um arquivo corrompido deve gerar erro, em vez de ser tratado como vazio e sobrescrito
+        """
+        with open("tests/tmp/categories_test.json", "w") as f:
+            f.write("[")
+
+        with self.assertRaises(ValueError):
+            self.repo.list_all()
+        with self.assertRaises(ValueError):
+            self.repo.add(Category(id=uuid.uuid4(), nome="Moradia", nivel=1))
+
+
+    def test_list_all_confiavel(self):
+        """
+        O caminho confiável deve validar o arquivo uma única vez e depois criar as categorias sem revalidar
+        """
+        c1 = Category(id=uuid.uuid4(), nome="Estilo de vida", nivel=1)
+        c2 = Category(id=uuid.uuid4(), nome="Carro", nivel=2, categoria_pai=c1.id)
+        self.repo.add_many([c1, c2])
+
+        self.assertEqual(self.repo.list_all(trusted=True), [c1, c2])
+        other = CategoryRepository(filepath="tests/tmp/categories_test.json")
+        with patch.object(Category, "from_dict", side_effect=AssertionError("revalidou")):
+            self.assertEqual(other.list_all(trusted=True), [c1, c2])
+
+        # Categoria inválida gravada por fora: o checksum muda e a validação volta a rodar
+        with open("tests/tmp/categories_test.json", "w") as f:
+            json.dump([{"id": str(uuid.uuid4()), "nome": "Órfã", "nivel": 2, "categoria_pai": None}], f)
+        with self.assertRaises(ValueError):
+            other.list_all(trusted=True)
+
+
+    def test_diretorio_inexistente(self):
+        """
+        Um repositório cujo diretório ainda não existe deve ser lido como vazio, inclusive pela árvore
+        """
+        directory = "tests/tmp/inexistente"
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        repo = CategoryRepository(filepath=os.path.join(directory, "categories.json"))
+
+        self.assertEqual(repo.list_all(), [])
+        self.assertEqual(repo.list_by_parent(None), [])
@@ -0,0 +1,48 @@
+import unittest
+import uuid
+from finance_app.core.models.category import Category
+from finance_app.core.repositories.category_tree import CategoryTree
+
+class TestCategoryTree(unittest.TestCase):
+    """
+    Testes unitários para a classe CategoryTree.
+    Verifica o tratamento de dados inconsistentes (órfãs e ciclos)
+    """
+
+    def test_orfas(self):
+        """
+        Categorias cujo pai não existe devem ser tratadas como raízes
+        """
+        c1 = Category(id=uuid.uuid4(), nome="Estilo de vida", nivel=1)
+        orphan = Category(id=uuid.uuid4(), nome="Órfã", nivel=2, categoria_pai=uuid.uuid4())
+        tree = CategoryTree([c1, orphan])
+
+        self.assertEqual(tree.roots(), [c1, orphan])
+        self.assertEqual(tree.path(orphan.id), [orphan])
+        self.assertIsNone(tree.parent(orphan.id))
+
+
+    def test_ciclo(self):
+        """
+        Um ciclo na hierarquia não deve travar as consultas
+        """
+        a_id, b_id = uuid.uuid4(), uuid.uuid4()
+        a = Category(id=a_id, nome="A", nivel=2, categoria_pai=b_id)
+        b = Category(id=b_id, nome="B", nivel=3, categoria_pai=a_id)
+        tree = CategoryTree([a, b])
+
+        self.assertEqual(tree.path(a_id), [b, a])
+        self.assertEqual(tree.descendants(a_id), [b])
+
+
+    def test_name_paths(self):
+        """
+        Deve listar os caminhos de nomes completos e parciais no formato das transações
+        """
+        c1 = Category(id=uuid.uuid4(), nome="Moradia", nivel=1)
+        c2 = Category(id=uuid.uuid4(), nome="Contas", nivel=2, categoria_pai=c1.id)
+        c3 = Category(id=uuid.uuid4(), nome="Energia", nivel=3, categoria_pai=c2.id)
+        tree = CategoryTree([c1, c2, c3])
+
+        self.assertEqual(tree.name_paths(), {("Moradia", "", ""), ("Moradia", "Contas", ""),
+                                             ("Moradia", "Contas", "Energia")})
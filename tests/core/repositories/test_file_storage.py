@@ -0,0 +1,67 @@
+import os
+import unittest
+from finance_app.core.repositories.file_storage import FileLock, atomic_open, file_signature
+
+
+class TestFileStorage(unittest.TestCase):
+    """
+    Testes unitários para a gravação atômica e a trava entre processos.
+    """
+    def setUp(self):
+        # Criar um arquivo temporário para testes
+        os.makedirs("tests/tmp", exist_ok=True)
+        self.filepath = "tests/tmp/file_storage_test.json"
+
+
+    def tearDown(self):
+        # Deletar os arquivos temporários
+        for path in (self.filepath, self.filepath + ".lock"):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+    def test_atomic_open(self):
+        """
+        Deve substituir o arquivo ao final do bloco e preservar o original em caso de erro
+        """
+        with atomic_open(self.filepath) as f:
+            f.write("original")
+        with self.assertRaises(RuntimeError):
+            with atomic_open(self.filepath) as f:
+                f.write("parcial")
+                raise RuntimeError("falha")
+
+        with open(self.filepath) as f:
+            self.assertEqual(f.read(), "original")
+        self.assertFalse([name for name in os.listdir("tests/tmp") if name.endswith(".tmp")])
+
+
+    def test_file_signature(self):
+        """
+        A assinatura deve mudar quando o arquivo é substituído e ser None se ele não existir
+        """
+        self.assertIsNone(file_signature(self.filepath))
+        with atomic_open(self.filepath) as f:
+            f.write("a")
+        before = file_signature(self.filepath)
+        with atomic_open(self.filepath) as f:
+            f.write("b")
+        self.assertNotEqual(file_signature(self.filepath), before)
+
+
+    def test_lock_reentrante(self):
+        """
+        A trava deve aceitar usos aninhados, mas não promover compartilhada para exclusiva
+        """
+        lock = FileLock(self.filepath)
+        with lock.exclusive():
+            with lock.shared():
+                with lock.exclusive():
+                    pass
+        with lock.shared():
+            with self.assertRaises(RuntimeError):
+                with lock.exclusive():
+                    pass
+        # A trava foi liberada por completo
+        with lock.exclusive():
+            pass
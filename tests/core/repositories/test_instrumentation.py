@@ -0,0 +1,128 @@
+import logging
+import os
+import unittest
+import uuid
+from datetime import date
+from finance_app.core.models.category import Category
+from finance_app.core.repositories.category_repository import CategoryRepository
+from finance_app.core.repositories.instrumentation import (InMemorySink, LogSink, PrometheusFileSink, instrument,
+                                                           uninstrument)
+from finance_app.core.repositories.transaction_repository import TransactionRepository
+from tests.factories import make_transaction
+
+
+class TestInstrumentation(unittest.TestCase):
+    """
+    Testes unitários da instrumentação dos repositórios.
+    Verifica contagens, bytes, registros varridos/retornados e os destinos das medidas
+    """
+
+    def setUp(self):
+        # Criar arquivos temporários para testes
+        os.makedirs("tests/tmp", exist_ok=True)
+        self.filepath = "tests/tmp/transactions_metrics_test.json"
+        self.category_path = "tests/tmp/categories_metrics_test.json"
+        self.prom_path = "tests/tmp/metrics_test.prom"
+        self.sink = InMemorySink()
+        self.repo = TransactionRepository(filepath=self.filepath, metrics=self.sink)
+        self.repo.add_many([make_transaction(data_transacao=date(2025, 4, 1)),
+                            make_transaction(data_transacao=date(2025, 4, 2)),
+                            make_transaction(data_transacao=date(2025, 5, 1))])
+
+
+    def tearDown(self):
+        # Deletar os arquivos temporários
+        for path in (self.filepath, self.category_path, self.prom_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+    def test_contadores(self):
+        """
+        Deve registrar chamadas, bytes e registros varridos vs retornados por método
+        """
+        self.repo.list_by_month(2025, 4)
+        self.repo.list_by_month(2025, 4)
+        stats = self.sink.stats()
+
+        add_many = stats[("TransactionRepository", "add_many")]
+        self.assertEqual((add_many.calls, add_many.rows_returned), (1, 3))
+        self.assertEqual(add_many.bytes_written, os.path.getsize(self.filepath))
+
+        by_month = stats[("TransactionRepository", "list_by_month")]
+        self.assertEqual(by_month.calls, 2)
+        self.assertEqual(by_month.bytes_read, 2 * os.path.getsize(self.filepath))
+        self.assertEqual((by_month.rows_scanned, by_month.rows_returned), (6, 4))
+        self.assertEqual(sum(by_month.buckets), 2)
+        # Chamada aninhada (list_by_month -> list_by_period) conta apenas como a externa
+        self.assertNotIn(("TransactionRepository", "list_by_period"), stats)
+
+
+    def test_cache_e_erros(self):
+        """
+        No modo cache, consultas por índice devem varrer apenas os registros retornados
+        """
+        repo = TransactionRepository(filepath=self.filepath, cache=True)
+        repo.list_all()
+        instrument(repo, self.sink, name="cache")
+        repo.list_by_month(2025, 5)
+        with self.assertRaises(ValueError):
+            repo.list_by_period(date(2025, 1, 1), date(2025, 12, 31), field="data")
+
+        stats = self.sink.stats()
+        self.assertEqual(stats[("cache", "list_by_month")].rows_scanned, 1)
+        self.assertEqual(stats[("cache", "list_by_month")].bytes_read, 0)
+        self.assertEqual(stats[("cache", "list_by_period")].errors, 1)
+
+        uninstrument(repo)
+        repo.list_all()
+        self.assertNotIn(("cache", "list_all"), self.sink.stats())
+
+
+    def test_category_repository(self):
+        """
+        O CategoryRepository também deve informar bytes e registros varridos
+        """
+        categories = CategoryRepository(filepath=self.category_path, metrics=self.sink)
+        category = Category(id=uuid.uuid4(), nome="Moradia", nivel=1)
+        categories.add(category)
+        categories.get_by_id(category.id)
+
+        stats = self.sink.stats()
+        self.assertGreater(stats[("CategoryRepository", "add")].bytes_written, 0)
+        get_by_id = stats[("CategoryRepository", "get_by_id")]
+        self.assertEqual((get_by_id.rows_scanned, get_by_id.rows_returned), (1, 1))
+
+
+    def test_sinks(self):
+        """
+        Deve emitir uma linha de log por chamada e gravar o formato texto do Prometheus
+        """
+        with self.assertLogs("finance_app.repositories", level=logging.DEBUG) as logs:
+            instrument(self.repo, LogSink())
+            self.repo.list_all()
+        self.assertIn("TransactionRepository.list_all", logs.output[0])
+        self.assertIn("scanned=3 returned=3", logs.output[0])
+
+        prometheus = PrometheusFileSink(self.prom_path)
+        instrument(self.repo, prometheus)
+        self.repo.list_all()
+        prometheus.write()
+        with open(self.prom_path, "r") as f:
+            content = f.read()
+        self.assertIn('finance_repository_calls_total{repository="TransactionRepository",method="list_all"} 1',
+                      content)
+        self.assertIn('finance_repository_latency_seconds_bucket{repository="TransactionRepository",'
+                      'method="list_all",le="+Inf"} 1', content)
+
+
+    def test_falha_na_gravacao_das_metricas(self):
+        """
+        Uma falha ao gravar o arquivo de métricas deve ser registrada no log, sem afetar o repositório
+        """
+        prometheus = PrometheusFileSink("tests/tmp/inexistente/metrics.prom", interval=0)
+        instrument(self.repo, prometheus)
+        with self.assertLogs("finance_app.repositories", level=logging.WARNING) as logs:
+            self.assertEqual(len(self.repo.list_all()), 3)
+        self.assertIn("Could not write metrics file", logs.output[0])
+        self.assertEqual(prometheus.stats()[("TransactionRepository", "list_all")].calls, 1)
@@ -0,0 +1,63 @@
+import json
+import os
+import unittest
+from finance_app.core.repositories.json_stream import iter_json_array
+
+class TestIterJsonArray(unittest.TestCase):
+    """
+    Testes unitários para a leitura em blocos de arrays JSON.
+    """
+
+    def setUp(self):
+        # Criar um arquivo temporário para testes
+        os.makedirs("tests/tmp", exist_ok=True)
+        self.filepath = "tests/tmp/json_stream_test.json"
+
+
+    def tearDown(self):
+        # Deletar o arquivo temporário
+        if os.path.exists(self.filepath):
+            os.remove(self.filepath)
+
+
+    def _write(self, content: str):
+        """
+        Grava o conteúdo no arquivo temporário
+        """
+        with open(self.filepath, "w") as f:
+            f.write(content)
+
+
+    def test_blocos_pequenos(self):
+        """
+        Deve decodificar todos os elementos mesmo com blocos menores que um elemento
+        """
+        data = [{"id": str(i), "descricao": 'texto com [colchetes], vírgulas e "aspas"', "valor": i * 1.5}
+                for i in range(50)]
+        self._write(json.dumps(data, indent=4))
+
+        for chunk_size in (1, 7, 64, 4096):
+            self.assertEqual(list(iter_json_array(open(self.filepath), chunk_size=chunk_size)), data)
+
+
+    def test_arquivo_vazio(self):
+        """
+        Arquivo vazio ou com array vazio deve retornar nenhum elemento
+        """
+        self._write("")
+        self.assertEqual(list(iter_json_array(open(self.filepath))), [])
+        self._write("  [ ]  ")
+        self.assertEqual(list(iter_json_array(open(self.filepath))), [])
+
+
+    def test_arquivo_invalido(self):
+        """
+        Conteúdo que não é um array ou array truncado deve gerar erro
+        """
+        self._write('{"id": "1"}')
+        with self.assertRaises(json.JSONDecodeError):
+            list(iter_json_array(open(self.filepath)))
+
+        self._write('[{"id": "1"}, {"id": "2"')
+        with self.assertRaises(json.JSONDecodeError):
+            list(iter_json_array(open(self.filepath), chunk_size=4))
@@ -0,0 +1,172 @@
+import glob
+import os
+import unittest
+import uuid
+from dataclasses import replace
+from datetime import date
+from finance_app.core.repositories.mmap_transaction_repository import MmapTransactionRepository
+from finance_app.core.repositories.transaction_repository import TransactionRepository
+from tests.factories import make_transaction
+
+
+class TestMmapTransactionRepository(unittest.TestCase):
+    """
+    Testes unitários para a classe MmapTransactionRepository.
+    Verifica operações CRUD, alterações no próprio registro e a compactação
+    """
+    def setUp(self):
+        # Criar um arquivo temporário para testes
+        os.makedirs("tests/tmp", exist_ok=True)
+        self.filepath = "tests/tmp/transactions_test.bin"
+        self.repo = MmapTransactionRepository(filepath=self.filepath)
+
+
+    def tearDown(self):
+        # Fechar os mapeamentos e deletar os arquivos temporários (registros, heaps e trava)
+        self.repo.close()
+        for path in glob.glob(self.filepath + "*"):
+            os.remove(path)
+
+
+    def test_add_e_get_by_id(self):
+        """
+        Deve adicionar transações e buscá-las por id
+        """
+        t1 = make_transaction()
+        t2 = make_transaction(descricao="Salário", valor=10000)
+        self.repo.add(t1)
+        self.repo.add(t2)
+
+        self.assertEqual(self.repo.get_by_id(t1.id), t1)
+        self.assertEqual(self.repo.get_by_id(t2.id), t2)
+        self.assertIsNone(self.repo.get_by_id(uuid.uuid4()))
+        self.assertEqual(self.repo.list_all(), [t1.to_dict(), t2.to_dict()])
+        with self.assertRaises(ValueError):
+            self.repo.add(t1)
+
+
+    def test_update_e_delete(self):
+        """
+        Deve atualizar no mesmo lugar, mantendo a ordem, e remover transações
+        """
+        t1 = make_transaction()
+        t2 = make_transaction(descricao="Padaria")
+        self.repo.add_many([t1, t2])
+
+        t1.descricao = "Supermercado"
+        t1.valor = -1.5
+        self.repo.update(t1)
+        self.assertEqual(self.repo.list_all(), [t1.to_dict(), t2.to_dict()])
+        with self.assertRaises(ValueError):
+            self.repo.update(make_transaction())
+
+        result = self.repo.delete_many([t1, t1.id, uuid.uuid4()])
+        self.assertEqual(result.applied, [t1.id])
+        self.assertEqual(len(result.skipped), 2)
+        self.assertEqual(self.repo.list_all(), [t2.to_dict()])
+        self.assertIsNone(self.repo.get_by_id(t1.id))
+
+
+    def test_mark_paid_no_lugar(self):
+        """
+        Marcar como pago deve alterar apenas o registro, sem aumentar os arquivos
+        """
+        t1 = make_transaction()
+        self.repo.add(t1)
+        sizes = [os.path.getsize(path) for path in sorted(glob.glob(self.filepath + "*"))]
+
+        self.repo.mark_paid(t1.id)
+        t1.marcar_como_pago()
+        self.repo.update(t1)  # Apenas campos fixos mudaram: também é feito no lugar
+
+        self.assertTrue(self.repo.get_by_id(t1.id).pago)
+        self.assertEqual([os.path.getsize(path) for path in sorted(glob.glob(self.filepath + "*"))], sizes)
+        with self.assertRaises(ValueError):
+            self.repo.mark_paid(uuid.uuid4())
+
+
+    def test_list_by_period(self):
+        """
+        Deve filtrar e ordenar pela data escolhida
+        """
+        t1 = make_transaction(data_transacao=date(2025, 4, 20))
+        t2 = make_transaction(data_transacao=date(2025, 4, 5), data_efetivacao=date(2025, 5, 2))
+        t3 = make_transaction(data_transacao=date(2025, 5, 1))
+        self.repo.add_many([t1, t2, t3])
+
+        self.assertEqual(self.repo.list_by_month(2025, 4), [t2.to_dict(), t1.to_dict()])
+        self.assertEqual(self.repo.list_by_period(date(2025, 5, 1), date(2025, 5, 31), field="data_efetivacao"),
+                         [t3.to_dict(), t2.to_dict()])
+        with self.assertRaises(ValueError):
+            self.repo.list_by_period(date(2025, 1, 1), date(2025, 12, 31), field="valor")
+
+
+    def test_crescimento_e_compactacao(self):
+        """
+        Deve crescer além da capacidade inicial e, ao compactar, descartar removidos e textos sem uso
+        """
+        transactions = [make_transaction(descricao=f"Compra {i}") for i in range(1500)]
+        self.repo.add_many(transactions)
+        self.repo.delete_many(transactions[:1000])
+        for t in transactions[1000:1010]:
+            t.descricao += " (editada)"
+        self.repo.update_many(transactions[1000:1010])
+
+        self.repo.compact()
+
+        self.assertEqual(self.repo.list_all(), [t.to_dict() for t in transactions[1000:]])
+        self.assertEqual(len(glob.glob(self.filepath + ".*.heap")), 1)
+        self.assertEqual(self.repo.get_by_id(transactions[1200].id), transactions[1200])
+
+
+    def test_outra_instancia(self):
+        """
+        Alterações de outra instância (ou processo) devem ser vistas, inclusive após a compactação
+        """
+        t1 = make_transaction()
+        t2 = make_transaction(descricao="Padaria")
+        self.repo.add(t1)
+        other = MmapTransactionRepository(filepath=self.filepath)
+        try:
+            other.add(t2)
+            self.assertEqual(self.repo.get_by_id(t2.id), t2)
+
+            other.delete(t1)
+            other.compact()
+            self.assertEqual(self.repo.list_all(), [t2.to_dict()])
+            self.assertEqual(list(self.repo.iter_where(lambda item: item["descricao"] == "Padaria")),
+                             [t2.to_dict()])
+        finally:
+            other.close()
+
+
+    def test_events(self):
+        """
+        Deve notificar os ouvintes com (antigo, novo) a cada alteração
+        """
+        changes = []
+        self.repo.events.subscribe(lambda old, new: changes.append((old, new)))
+        t1 = make_transaction()
+        self.repo.add(t1)
+        old = t1.to_dict()
+        self.repo.mark_paid(t1.id)
+        paid = replace(t1, pago=True)
+        self.repo.delete(t1)
+
+        self.assertEqual(changes, [(None, old), (old, paid.to_dict()), (paid.to_dict(), None)])
+
+
+    def test_migrate_from_json(self):
+        """
+        Deve importar as transações de um arquivo do TransactionRepository
+        """
+        json_path = "tests/tmp/transactions_mmap_migrate_test.json"
+        source = TransactionRepository(filepath=json_path)
+        t1 = make_transaction()
+        source.add(t1)
+        try:
+            self.assertEqual(self.repo.migrate_from_json(json_path).applied, [t1.id])
+            self.assertEqual(self.repo.migrate_from_json(json_path).skipped, [t1.id])
+            self.assertEqual(self.repo.get_by_id(t1.id), t1)
+        finally:
+            os.remove(json_path)
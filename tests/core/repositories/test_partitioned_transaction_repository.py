@@ -0,0 +1,175 @@
+import json
+import os
+import shutil
+import unittest
+import uuid
+from unittest.mock import patch
+from dataclasses import replace
+from datetime import date
+from finance_app.core.repositories.instrumentation import InMemorySink
+from finance_app.core.repositories.partitioned_transaction_repository import PartitionedTransactionRepository
+from tests.factories import make_transaction
+
+
+class TestPartitionedTransactionRepository(unittest.TestCase):
+    """
+    Testes unitários para a classe PartitionedTransactionRepository.
+    Verifica operações CRUD, a gravação apenas dos segmentos afetados e o descarte de segmentos nas consultas
+    """
+
+    def setUp(self):
+        # Criar um diretório temporário para testes
+        os.makedirs("tests/tmp", exist_ok=True)
+        self.directory = "tests/tmp/transactions_partitioned_test"
+        self.repo = PartitionedTransactionRepository(directory=self.directory)
+
+
+    def tearDown(self):
+        # Deletar o diretório temporário (segmentos, manifesto e trava)
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+    def segments(self) -> list:
+        """
+        Lista os segmentos gravados no diretório
+        """
+        return sorted(name for name in os.listdir(self.directory) if name.endswith(".seg"))
+
+
+    def test_add_e_get_by_id(self):
+        """
+        Deve gravar um segmento por mês e buscar transações por id
+        """
+        t1 = make_transaction(data_transacao=date(2025, 5, 3))
+        t2 = make_transaction(data_transacao=date(2025, 4, 10))
+        self.repo.add_many([t1, t2])
+
+        self.assertEqual(self.segments(), ["2025-04.seg", "2025-05.seg"])
+        self.assertEqual(self.repo.get_by_id(t1.id), t1)
+        self.assertIsNone(self.repo.get_by_id(uuid.uuid4()))
+        self.assertEqual(self.repo.list_all(), [t2.to_dict(), t1.to_dict()])
+        with self.assertRaises(ValueError):
+            self.repo.add(t1)
+
+        with open(os.path.join(self.directory, "manifest.json"), "r") as f:
+            manifest = json.load(f)
+        self.assertEqual(manifest["segments"]["2025-05"]["count"], 1)
+
+
+    def test_update_regrava_apenas_o_segmento(self):
+        """
+        Alterar uma transação do mês passado deve regravar apenas o segmento desse mês
+        """
+        t1 = make_transaction(data_transacao=date(2025, 4, 1))
+        t2 = make_transaction(data_transacao=date(2025, 5, 1))
+        self.repo.add_many([t1, t2])
+        may = os.path.join(self.directory, "2025-05.seg")
+        signature = os.stat(may).st_ino
+
+        t1.descricao = "Supermercado"
+        self.repo.update(t1)
+        self.assertEqual(os.stat(may).st_ino, signature)
+        self.assertEqual(self.repo.get_by_id(t1.id).descricao, "Supermercado")
+        with self.assertRaises(ValueError):
+            self.repo.update(make_transaction())
+
+
+    def test_mudanca_de_mes(self):
+        """
+        Mudar a data para outro mês deve mover a transação de segmento e remover segmentos vazios
+        """
+        t1 = make_transaction(data_transacao=date(2025, 4, 1))
+        t2 = make_transaction(data_transacao=date(2025, 5, 1))
+        self.repo.add_many([t1, t2])
+
+        moved = replace(t1, data_transacao=date(2025, 6, 15), data_efetivacao=date(2025, 6, 15))
+        self.repo.update(moved)
+        self.assertEqual(self.segments(), ["2025-05.seg", "2025-06.seg"])
+        self.assertEqual(self.repo.list_by_month(2025, 4), [])
+        self.assertEqual(self.repo.list_by_month(2025, 6), [moved.to_dict()])
+        self.assertEqual(self.repo.get_by_id(t1.id), moved)
+
+        # Outro processo (nova instância) deve enxergar o mesmo estado
+        other = PartitionedTransactionRepository(directory=self.directory)
+        self.assertEqual(other.get_by_id(t1.id), moved)
+        result = other.delete_many([t1, t1.id, uuid.uuid4()])
+        self.assertEqual(result.applied, [t1.id])
+        self.assertEqual(len(result.skipped), 2)
+        self.assertIsNone(self.repo.get_by_id(t1.id))
+        self.assertEqual(self.segments(), ["2025-05.seg"])
+
+
+    def test_list_by_period_descarta_segmentos(self):
+        """
+        Consultas por período devem ler apenas os segmentos do intervalo
+        """
+        t1 = make_transaction(data_transacao=date(2025, 4, 20))
+        t2 = make_transaction(data_transacao=date(2025, 4, 5), data_efetivacao=date(2025, 5, 2))
+        t3 = make_transaction(data_transacao=date(2025, 5, 1))
+        t4 = make_transaction(data_transacao=date(2024, 1, 1))
+        self.repo.add_many([t1, t2, t3, t4])
+
+        sink = InMemorySink()
+        repo = PartitionedTransactionRepository(directory=self.directory, metrics=sink)
+        self.assertEqual(repo.list_by_month(2025, 4), [t2.to_dict(), t1.to_dict()])
+        self.assertEqual(sink.stats()[("PartitionedTransactionRepository", "list_by_month")].rows_scanned, 2)
+
+        self.assertEqual(repo.list_by_period(date(2025, 5, 1), date(2025, 5, 31), field="data_efetivacao"),
+                         [t3.to_dict(), t2.to_dict()])
+        self.assertEqual(sink.stats()[("PartitionedTransactionRepository", "list_by_period")].rows_scanned, 3)
+        with self.assertRaises(ValueError):
+            repo.list_by_period(date(2025, 1, 1), date(2025, 12, 31), field="valor")
+        self.assertEqual(list(repo.iter_all()), repo.list_all())
+
+
+    def test_queda_na_mudanca_de_mes(self):
+        """
+        Uma falha na gravação do manifesto durante a mudança de mês não deve perder a transação
+        """
+        for failing_write in (1, 2):
+            with self.subTest(failing_write=failing_write):
+                shutil.rmtree(self.directory, ignore_errors=True)
+                repo = PartitionedTransactionRepository(directory=self.directory)
+                t1 = make_transaction(data_transacao=date(2025, 4, 1))
+                t2 = make_transaction(data_transacao=date(2025, 4, 2))
+                repo.add_many([t1, t2])
+
+                calls = []
+                write_manifest = repo._write_manifest
+
+                def crash(*args):
+                    # Simula uma queda na n-ésima gravação do manifesto
+                    calls.append(args)
+                    if len(calls) == failing_write:
+                        raise OSError("disk full")
+                    return write_manifest(*args)
+
+                moved = replace(t1, data_transacao=date(2025, 6, 15), data_efetivacao=date(2025, 6, 15))
+                with patch.object(repo, "_write_manifest", side_effect=crash):
+                    with self.assertRaises(OSError):
+                        repo.update(moved)
+
+                other = PartitionedTransactionRepository(directory=self.directory)
+                self.assertIn(other.get_by_id(t1.id), (t1, moved))
+                self.assertEqual(other.get_by_id(t2.id), t2)
+
+
+    def test_indice_persistido(self):
+        """
+        Uma nova instância deve montar o índice pelos arquivos .ids, lendo apenas o segmento consultado
+        """
+        t1 = make_transaction(data_transacao=date(2025, 4, 1))
+        t2 = make_transaction(data_transacao=date(2025, 5, 1))
+        t3 = make_transaction(data_transacao=date(2025, 5, 2))
+        self.repo.add_many([t1, t2, t3])
+
+        sink = InMemorySink()
+        repo = PartitionedTransactionRepository(directory=self.directory, metrics=sink)
+        self.assertEqual(repo.get_by_id(t1.id), t1)
+        self.assertEqual(sink.stats()[("PartitionedTransactionRepository", "get_by_id")].rows_scanned, 1)
+
+        # Um .ids ausente (ex: diretório gravado por uma versão anterior) é recriado a partir do segmento
+        os.remove(os.path.join(self.directory, "2025-05.ids"))
+        other = PartitionedTransactionRepository(directory=self.directory)
+        self.assertEqual(other.get_by_id(t3.id), t3)
+        self.assertTrue(os.path.exists(os.path.join(self.directory, "2025-05.ids")))
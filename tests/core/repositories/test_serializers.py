@@ -0,0 +1,103 @@
+import io
+import os
+import unittest
+from finance_app.core.repositories.serializers import (MAGIC, SERIALIZERS, convert_file, file_serializer,
+                                                       get_serializer, iter_records, load_records)
+
+RECORDS = [
+    {"id": "1", "descricao": "Padaria São João", "valor": -12.5, "pago": True, "nivel": 1, "pai": None},
+    {"id": "2", "descricao": "Padaria São João", "valor": 0.1, "pago": False, "nivel": 2, "pai": "1"},
+    {"id": "3", "nome": "Outro formato"},
+    {"id": "4", "descricao": "", "valor": 1e300, "pago": False, "nivel": -3, "pai": None},
+]
+
+
+class TestSerializers(unittest.TestCase):
+    """
+    Testes unitários para os formatos de arquivo dos repositórios.
+    """
+    def setUp(self):
+        # Criar um arquivo temporário para testes
+        os.makedirs("tests/tmp", exist_ok=True)
+        self.filepath = "tests/tmp/serializers_test.data"
+
+
+    def tearDown(self):
+        # Deletar os arquivos temporários
+        for path in (self.filepath, self.filepath + ".lock"):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+    def _dump(self, file_format: str, records: list) -> bytes:
+        buffer = io.BytesIO()
+        get_serializer(file_format).dump(records, buffer)
+        return buffer.getvalue()
+
+
+    def test_ida_e_volta(self):
+        """
+        Todos os formatos devem preservar valores, tipos e ordem das chaves, com detecção automática
+        """
+        for file_format in SERIALIZERS:
+            with self.subTest(file_format=file_format):
+                content = self._dump(file_format, RECORDS)
+                loaded = load_records(content)
+                self.assertEqual(loaded, RECORDS)
+                self.assertEqual([list(item) for item in loaded], [list(item) for item in RECORDS])
+                self.assertEqual(list(iter_records(io.BytesIO(content), chunk_size=8)), RECORDS)
+
+
+    def test_tamanho(self):
+        """
+        O JSON compacto e o binário devem ser menores que o JSON indentado
+        """
+        records = RECORDS * 100
+        indented = len(self._dump("json-indent", records))
+        self.assertLess(len(self._dump("json", records)), indented)
+        self.assertLess(len(self._dump("binary", records)), len(self._dump("json", records)))
+        self.assertTrue(self._dump("binary", records).startswith(MAGIC))
+
+
+    def test_binario_invalido(self):
+        """
+        Arquivos binários truncados e valores não suportados devem gerar ValueError
+        """
+        content = self._dump("binary", RECORDS)
+        with self.assertRaises(ValueError):
+            load_records(content[:-3])
+        with self.assertRaises(ValueError):
+            self._dump("binary", [{"lista": [1, 2]}])
+        with self.assertRaises(ValueError):
+            get_serializer("xml")
+
+
+    def test_convert_file(self):
+        """
+        Deve converter um arquivo existente mantendo os registros
+        """
+        with open(self.filepath, "wb") as f:
+            f.write(self._dump("json-indent", RECORDS))
+
+        convert_file(self.filepath, "binary")
+        with open(self.filepath, "rb") as f:
+            content = f.read()
+        self.assertTrue(content.startswith(MAGIC))
+        self.assertEqual(load_records(content), RECORDS)
+
+        convert_file(self.filepath, "json")
+        with open(self.filepath, "rb") as f:
+            self.assertEqual(load_records(f.read()), RECORDS)
+
+
+    def test_file_serializer(self):
+        """
+        Sem formato informado, deve manter o formato do arquivo existente, inclusive a indentação do JSON
+        """
+        self.assertIs(file_serializer(self.filepath), SERIALIZERS["json"])
+        for file_format in ("json", "json-indent", "binary"):
+            with self.subTest(file_format=file_format):
+                with open(self.filepath, "wb") as f:
+                    f.write(self._dump(file_format, RECORDS))
+                self.assertIs(file_serializer(self.filepath), SERIALIZERS[file_format])
+                self.assertIs(file_serializer(self.filepath, "binary"), SERIALIZERS["binary"])
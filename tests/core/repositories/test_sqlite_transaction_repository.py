@@ -0,0 +1,247 @@
+import json
+import os
+import sqlite3
+import unittest
+import uuid
+from datetime import date
+from finance_app.core.repositories.sqlite_transaction_repository import SQLiteTransactionRepository
+from finance_app.core.repositories.transaction_repository import TransactionRepository
+from tests.factories import make_transaction
+
+
+class TestSQLiteTransactionRepository(unittest.TestCase):
+    """
+    Testes unitários para a classe SQLiteTransactionRepository.
+    Verifica operações CRUD, uso dos índices e a migração a partir do JSON
+    """
+    def setUp(self):
+        # Criar um banco temporário para testes
+        os.makedirs("tests/tmp", exist_ok=True)
+        self.filepath = "tests/tmp/transactions_test.db"
+        self.repo = SQLiteTransactionRepository(filepath=self.filepath)
+
+
+    def tearDown(self):
+        # Fechar a conexão e deletar os arquivos temporários (banco, WAL e shared memory)
+        self.repo.close()
+        for path in (self.filepath, self.filepath + "-wal", self.filepath + "-shm"):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+    def test_add_e_get_by_id(self):
+        """
+        Deve adicionar transações e buscá-las por id
+        """
+        t1 = make_transaction()
+        t2 = make_transaction(descricao="Salário", valor=10000)
+        self.repo.add(t1)
+        self.repo.add(t2)
+
+        self.assertEqual(self.repo.get_by_id(t1.id), t1)
+        self.assertEqual(self.repo.get_by_id(t2.id), t2)
+        self.assertIsNone(self.repo.get_by_id(uuid.uuid4()))
+        self.assertEqual(self.repo.list_all(), [t1.to_dict(), t2.to_dict()])
+
+
+    def test_add_duplicado(self):
+        """
+        Deve retornar erro ao adicionar uma transação com id já existente
+        (diferente do repositório JSON, que grava o registro repetido)
+        """
+        t1 = make_transaction()
+        self.repo.add(t1)
+
+        with self.assertRaises(ValueError):
+            self.repo.add(t1)
+        self.assertEqual(self.repo.list_all(), [t1.to_dict()])
+
+        json_path = "tests/tmp/transactions_duplicate_test.json"
+        json_repo = TransactionRepository(filepath=json_path)
+        try:
+            json_repo.add(t1)
+            json_repo.add(t1)
+            self.assertEqual(json_repo.list_all(), [t1.to_dict(), t1.to_dict()])
+        finally:
+            os.remove(json_path)
+
+
+    def test_update_e_delete(self):
+        """
+        Deve atualizar e remover transações
+        """
+        t1 = make_transaction()
+        t2 = make_transaction(descricao="Padaria")
+        self.repo.add_many([t1, t2])
+
+        t1.valor = -50.00
+        t1.marcar_como_pago()
+        self.repo.update(t1)
+        self.assertEqual(self.repo.get_by_id(t1.id), t1)
+
+        self.repo.delete(t2)
+        self.assertEqual(len(self.repo.list_all()), 1)
+
+        with self.assertRaises(ValueError):
+            self.repo.update(t2)
+
+
+    def test_bulk(self):
+        """
+        As operações em lote devem reportar IDs aplicados e ignorados
+        """
+        t1 = make_transaction()
+        t2 = make_transaction(descricao="Padaria")
+        missing_id = uuid.uuid4()
+
+        result = self.repo.add_many([t1, t2, t1])
+        self.assertEqual(result.applied, [t1.id, t2.id])
+        self.assertEqual(result.skipped, [t1.id])
+
+        result = self.repo.delete_many([t1, missing_id])
+        self.assertEqual(result.applied, [t1.id])
+        self.assertEqual(result.skipped, [missing_id])
+
+        result = self.repo.update_many([t1, t2])
+        self.assertEqual(result.applied, [t2.id])
+        self.assertEqual(result.skipped, [t1.id])
+
+
+    def test_list_by_month(self):
+        """
+        Deve listar as transações por mês usando o índice de data_transacao
+        """
+        t1 = make_transaction(data_transacao=date(2025, 4, 30))
+        t2 = make_transaction(data_transacao=date(2025, 5, 1))
+        t3 = make_transaction(data_transacao=date(2025, 4, 1))
+        self.repo.add_many([t1, t2, t3])
+
+        self.assertEqual(self.repo.list_by_month(year=2025, month=3), [])
+        self.assertEqual(self.repo.list_by_month(year=2025, month=4), [t3.to_dict(), t1.to_dict()])
+        self.assertEqual(self.repo.list_by_month(year=2025, month=5), [t2.to_dict()])
+
+        plan = self.repo._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM transactions WHERE data_transacao BETWEEN ? AND ?",
+            ("2025-04-01", "2025-04-30"),
+        ).fetchall()
+        self.assertIn("idx_transactions_data_transacao", str(plan))
+
+
+    def test_list_by_period(self):
+        """
+        Deve listar transações por intervalo de data de efetivação (ciclo de fatura)
+        """
+        t1 = make_transaction(data_transacao=date(2025, 4, 28), data_efetivacao=date(2025, 5, 10))
+        t2 = make_transaction(data_transacao=date(2025, 4, 2), data_efetivacao=date(2025, 4, 10))
+        self.repo.add_many([t1, t2])
+
+        self.assertEqual(
+            self.repo.list_by_period(date(2025, 5, 1), date(2025, 5, 31), field="data_efetivacao"),
+            [t1.to_dict()]
+        )
+        with self.assertRaises(ValueError):
+            self.repo.list_by_period(date(2025, 4, 1), date(2025, 4, 30), field="valor; DROP TABLE transactions")
+
+
+    def test_iter_all_e_iter_where(self):
+        """
+        Deve percorrer as transações na ordem de inserção e filtrar por predicado
+        """
+        transactions = [make_transaction(descricao=f"Compra {i}", valor=-i) for i in range(5)]
+        self.repo.add_many(transactions)
+
+        self.assertEqual(list(self.repo.iter_all()), [t.to_dict() for t in transactions])
+        self.assertEqual(
+            list(self.repo.iter_where(lambda item: item["valor"] <= -3)),
+            [transactions[3].to_dict(), transactions[4].to_dict()]
+        )
+
+
+    def test_events(self):
+        """
+        Deve notificar os ouvintes com (antigo, novo) a cada add, update e delete
+        """
+        changes = []
+        self.repo.events.subscribe(lambda old, new: changes.append((old, new)))
+        t1 = make_transaction()
+
+        self.repo.add(t1)
+        old = t1.to_dict()
+        t1.valor = -1.00
+        self.repo.update(t1)
+        self.repo.delete(t1)
+        self.repo.delete(t1)  # Já removida: sem evento
+
+        self.assertEqual(changes, [(None, old), (old, t1.to_dict()), (t1.to_dict(), None)])
+
+
+    def test_migrate_from_json(self):
+        """
+        Deve importar as transações de um arquivo JSON, ignorando IDs já importados
+        """
+        json_path = "tests/tmp/transactions_migrate_test.json"
+        json_repo = TransactionRepository(filepath=json_path)
+        t1 = make_transaction()
+        t2 = make_transaction(descricao="Padaria")
+        json_repo.add_many([t1, t2])
+
+        try:
+            result = self.repo.migrate_from_json(json_path)
+            self.assertEqual(result.applied, [t1.id, t2.id])
+            self.assertEqual(self.repo.list_all(), json_repo.list_all())
+
+            # Executar de novo não duplica dados
+            result = self.repo.migrate_from_json(json_path)
+            self.assertEqual(result.skipped, [t1.id, t2.id])
+        finally:
+            os.remove(json_path)
+
+
+    def test_migrate_from_json_invalido(self):
+        """
+        Um registro inválido (ex: campo nulo) deve gerar erro, sem importar nenhum registro
+        """
+        json_path = "tests/tmp/transactions_migrate_test.json"
+        valid = make_transaction().to_dict()
+        invalid = dict(make_transaction().to_dict(), cartao=None)
+        with open(json_path, "w") as f:
+            json.dump([valid, invalid], f)
+
+        try:
+            with self.assertRaises(ValueError):
+                self.repo.migrate_from_json(json_path)
+            self.assertEqual(self.repo.list_all(), [])
+        finally:
+            os.remove(json_path)
+
+
+    def test_valor_em_centavos(self):
+        """
+        Deve gravar os valores em centavos e converter bancos antigos (valor REAL) ao abrir
+        """
+        t1 = make_transaction(valor=-35.90)
+        self.repo.add(t1)
+        self.assertEqual(self.repo._conn.execute("SELECT typeof(valor), valor FROM transactions").fetchall(),
+                         [("integer", -3590)])
+        self.assertEqual(self.repo.get_by_id(t1.id), t1)
+
+        # Banco no esquema antigo, com valores em reais
+        self.repo.close()
+        os.remove(self.filepath)
+        t2 = make_transaction(valor=10000.10)
+        conn = sqlite3.connect(self.filepath)
+        conn.execute("CREATE TABLE transactions (id TEXT PRIMARY KEY, descricao TEXT NOT NULL, "
+                     "data_transacao TEXT NOT NULL, data_efetivacao TEXT NOT NULL, valor REAL NOT NULL, "
+                     "conta TEXT NOT NULL, cartao TEXT NOT NULL, categoria_n1 TEXT NOT NULL, "
+                     "categoria_n2 TEXT NOT NULL, categoria_n3 TEXT NOT NULL, pago INTEGER NOT NULL)")
+        for t in (t2, t1):
+            row = t.to_dict()
+            conn.execute("INSERT INTO transactions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", tuple(row.values()))
+        conn.commit()
+        conn.close()
+
+        self.repo = SQLiteTransactionRepository(filepath=self.filepath)
+        self.assertEqual(self.repo.list_all(), [t2.to_dict(), t1.to_dict()])
+        self.assertEqual(self.repo._conn.execute("SELECT typeof(valor) FROM transactions").fetchall(),
+                         [("integer",), ("integer",)])
+        self.assertEqual(self.repo.list_by_month(2025, 4), [t2.to_dict(), t1.to_dict()])
@@ -1,9 +1,28 @@
+import json
+import multiprocessing
 import os
+import random
+import shutil
 import unittest
 import uuid
+from unittest.mock import patch
+from dataclasses import replace
 from datetime import date
 from finance_app.core.models.transaction import Transaction
+from finance_app.core.models.transaction_view import TransactionView
+from finance_app.core.repositories.serializers import SERIALIZERS
 from finance_app.core.repositories.transaction_repository import TransactionRepository
+from tests.factories import make_transaction
+
+
+def add_in_process(filepath, count):
+    """
+    Adiciona transações a partir de outro processo (usado no teste de concorrência)
+    """
+    repo = TransactionRepository(filepath=filepath)
+    for _ in range(count):
+        repo.add(make_transaction())
+
 
 class TestTransactionRepository(unittest.TestCase):
     """
@@ -17,8 +36,9 @@ class TestTransactionRepository(unittest.TestCase):
 
 
     def tearDown(self):
-        # Deletar o arquivo temporário
-        os.remove("tests/tmp/transactions_test.json")
+        # Deletar o arquivo temporário (se o teste chegou a criá-lo)
+        if os.path.exists("tests/tmp/transactions_test.json"):
+            os.remove("tests/tmp/transactions_test.json")
 
 
     def test_add(self):
@@ -226,4 +246,600 @@ class TestTransactionRepository(unittest.TestCase):
         # Verifica que retorna erro
         with self.assertRaises(ValueError):
             self.repo.update(t9)
-        
\ No newline at end of file
+        
+
+    def test_add_many(self):
+        """
+        Deve adicionar várias transações com uma única gravação, ignorando IDs duplicados
+        """
+        t1 = make_transaction()
+        t2 = make_transaction(descricao="Padaria")
+        self.repo.add(t1)
+
+        with patch.object(self.repo, "_save", wraps=self.repo._save) as save:
+            result = self.repo.add_many([t1, t2, t2])
+            save.assert_called_once()
+
+        self.assertEqual(result.applied, [t2.id])
+        self.assertEqual(result.skipped, [t1.id, t2.id])
+        self.assertEqual(len(self.repo.list_all()), 2)
+
+
+    def test_update_many(self):
+        """
+        Deve atualizar várias transações, reportando IDs inexistentes; a última ocorrência prevalece
+        """
+        t1 = make_transaction()
+        t2 = make_transaction(descricao="Padaria")
+        tx = make_transaction(descricao="Inexistente")
+        self.repo.add_many([t1, t2])
+
+        t1.valor = -1.00
+        t2.valor = -2.00
+        t2_again = replace(t2, valor=-3.00)
+        result = self.repo.update_many([t1, tx, t2, t2_again])
+
+        self.assertEqual(result.applied, [t1.id, t2.id, t2.id])
+        self.assertEqual(result.skipped, [tx.id])
+        self.assertEqual(self.repo.get_by_id(t1.id).valor, -1.00)
+        self.assertEqual(self.repo.get_by_id(t2.id).valor, -3.00)
+
+
+    def test_delete_many(self):
+        """
+        Deve remover várias transações (por objeto ou ID), reportando IDs inexistentes ou repetidos
+        """
+        t1 = make_transaction()
+        t2 = make_transaction(descricao="Padaria")
+        t3 = make_transaction(descricao="Farmácia")
+        missing_id = uuid.uuid4()
+        self.repo.add_many([t1, t2, t3])
+
+        result = self.repo.delete_many([t1, t2.id, t1.id, missing_id])
+
+        self.assertEqual(result.applied, [t1.id, t2.id])
+        self.assertEqual(result.skipped, [t1.id, missing_id])
+        self.assertEqual(self.repo.list_all(), [t3.to_dict()])
+
+
+    def test_list_by_period(self):
+        """
+        Deve listar transações por intervalo de datas, em ordem de data, por qualquer um dos campos de data
+        """
+        t1 = make_transaction(data_transacao=date(2025, 4, 28), data_efetivacao=date(2025, 5, 10))
+        t2 = make_transaction(data_transacao=date(2025, 4, 2), data_efetivacao=date(2025, 4, 10))
+        t3 = make_transaction(data_transacao=date(2025, 5, 3), data_efetivacao=date(2025, 6, 10))
+        self.repo.add_many([t1, t2, t3])
+
+        self.assertEqual(
+            self.repo.list_by_period(date(2025, 4, 1), date(2025, 4, 30)),
+            [t2.to_dict(), t1.to_dict()]
+        )
+        self.assertEqual(
+            self.repo.list_by_period(date(2025, 5, 1), date(2025, 5, 31), field="data_efetivacao"),
+            [t1.to_dict()]
+        )
+        self.assertEqual(self.repo.list_by_month(year=2025, month=5), [t3.to_dict()])
+
+        with self.assertRaises(ValueError):
+            self.repo.list_by_period(date(2025, 4, 1), date(2025, 4, 30), field="valor")
+
+
+    def test_iter_all_e_iter_where(self):
+        """
+        Deve percorrer as transações em blocos, na mesma ordem de list_all, e filtrar por predicado
+        """
+        transactions = [make_transaction(descricao=f"Compra {i}", valor=-i) for i in range(20)]
+        self.repo.add_many(transactions)
+
+        self.assertEqual(list(self.repo.iter_all(chunk_size=16)), self.repo.list_all())
+        self.assertEqual(
+            [item["descricao"] for item in self.repo.iter_where(lambda item: item["valor"] < -17, chunk_size=16)],
+            ["Compra 18", "Compra 19"]
+        )
+
+
+    def test_events(self):
+        """
+        Deve notificar os ouvintes com (antigo, novo) a cada add, update e delete
+        """
+        changes = []
+        self.repo.events.subscribe(lambda old, new: changes.append((old, new)))
+        t1 = make_transaction()
+        t2 = make_transaction(descricao="Padaria")
+
+        self.repo.add(t1)
+        old = t1.to_dict()
+        t1.valor = -1.00
+        self.repo.update(t1)
+        self.repo.add_many([t2])
+        self.repo.delete_many([t1, t2])
+
+        self.assertEqual(changes, [
+            (None, old),
+            (old, t1.to_dict()),
+            (None, t2.to_dict()),
+            (t1.to_dict(), None),
+            (t2.to_dict(), None),
+        ])
+
+
+    def test_list_transactions(self):
+        """
+        Deve listar objetos validados (estrito) ou visões validadas uma única vez pelo carimbo (confiável)
+        """
+        t1 = make_transaction()
+        t2 = make_transaction(descricao="Padaria")
+        self.repo.add_many([t1, t2])
+
+        self.assertEqual(self.repo.list_transactions(), [t1, t2])
+        views = self.repo.list_transactions(trusted=True)
+        self.assertTrue(all(isinstance(view, TransactionView) for view in views))
+        self.assertEqual([view.to_transaction() for view in views], [t1, t2])
+        self.assertTrue(os.path.exists("tests/tmp/transactions_test.json.stamp"))
+
+        # Arquivo inalterado ou alterado pelo próprio repositório: nenhuma linha é revalidada
+        self.repo.add(make_transaction(descricao="Farmácia"))
+        other = TransactionRepository(filepath="tests/tmp/transactions_test.json")
+        with patch.object(Transaction, "from_dict", side_effect=AssertionError("revalidou")):
+            self.repo.list_transactions(trusted=True)
+            self.repo.list_transactions(trusted=True)
+        with patch.object(Transaction, "from_dict", wraps=Transaction.from_dict) as from_dict:
+            other.list_transactions(trusted=True)
+        from_dict.assert_not_called()
+
+
+    def test_list_transactions_invalido(self):
+        """
+        Um arquivo com transação inválida deve gerar erro nos dois caminhos, sem gravar carimbo
+        """
+        record = make_transaction().to_dict()
+        record["data_efetivacao"] = "2025-03-01"  # Anterior à data da transação
+        with open("tests/tmp/transactions_test.json", "w") as f:
+            json.dump([record], f)
+
+        with self.assertRaises(ValueError):
+            self.repo.list_transactions()
+        with self.assertRaises(ValueError):
+            self.repo.list_transactions(trusted=True)
+
+
+    def test_formato_binario(self):
+        """
+        Deve gravar no formato configurado e ler qualquer formato detectando-o automaticamente
+        """
+        t1 = make_transaction()
+        t2 = make_transaction(descricao="Padaria")
+        self.repo.add(t1)  # JSON compacto
+
+        binary = TransactionRepository(filepath="tests/tmp/transactions_test.json", file_format="binary")
+        binary.add(t2)
+        with open("tests/tmp/transactions_test.json", "rb") as f:
+            self.assertTrue(f.read().startswith(b"FAPBIN"))
+
+        self.assertEqual(self.repo.list_all(), [t1.to_dict(), t2.to_dict()])
+        self.assertEqual(list(self.repo.iter_all(chunk_size=16)), [t1.to_dict(), t2.to_dict()])
+        self.assertEqual(binary.get_by_id(t1.id), t1)
+
+        # Sem formato informado, o repositório mantém o formato do arquivo existente
+        self.repo.add(make_transaction(descricao="Farmácia"))
+        with open("tests/tmp/transactions_test.json", "rb") as f:
+            self.assertTrue(f.read().startswith(b"FAPBIN"))
+        self.assertEqual(len(binary.list_all()), 3)
+
+
+    def test_arquivo_corrompido(self):
+        """
+        Um arquivo corrompido deve gerar erro, em vez de ser tratado como vazio e sobrescrito
+        """
+        with open("tests/tmp/transactions_test.json", "w") as f:
+            f.write('[{"id": ')
+
+        with self.assertRaises(ValueError):
+            self.repo.list_all()
+        with self.assertRaises(ValueError):
+            self.repo.add(make_transaction())
+        with open("tests/tmp/transactions_test.json") as f:
+            self.assertEqual(f.read(), '[{"id": ')
+
+
+    def test_save_atomico(self):
+        """
+        Uma falha no meio da gravação deve manter o arquivo original intacto
+        """
+        t1 = make_transaction()
+        self.repo.add(t1)
+
+        def dump_parcial(data, f):
+            f.write(b"[{")
+            raise OSError("disco cheio")
+
+        with patch.object(SERIALIZERS["json"], "dump", dump_parcial):
+            with self.assertRaises(OSError):
+                self.repo.add(make_transaction())
+
+        self.assertEqual(self.repo.list_all(), [t1.to_dict()])
+        self.assertFalse([name for name in os.listdir("tests/tmp") if name.endswith(".tmp")])
+
+
+    def test_escritores_concorrentes(self):
+        """
+        Processos gravando ao mesmo tempo não devem perder alterações uns dos outros
+        """
+        processes = [multiprocessing.Process(target=add_in_process, args=("tests/tmp/transactions_test.json", 10))
+                     for _ in range(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        self.assertEqual(len(self.repo.list_all()), 40)
+
+
+    def test_diretorio_inexistente(self):
+        """
+        Um repositório cujo diretório ainda não existe deve ser lido como vazio e criar o diretório ao gravar
+        """
+        directory = "tests/tmp/inexistente"
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        repo = TransactionRepository(filepath=os.path.join(directory, "transactions.json"))
+
+        self.assertEqual(repo.list_all(), [])
+        t1 = make_transaction()
+        repo.add(t1)
+        self.assertEqual(repo.list_all(), [t1.to_dict()])
+
+
+class TestTransactionRepositoryCache(unittest.TestCase):
+    """
+    Testes unitários para o modo cache do TransactionRepository.
+    Verifica o índice em memória e a detecção de alterações externas no arquivo.
+    """
+    def setUp(self):
+        # Criar um arquivo temporário para testes
+        os.makedirs("tests/tmp", exist_ok=True)
+        self.filepath = "tests/tmp/transactions_cache_test.json"
+        self.repo = TransactionRepository(filepath=self.filepath, cache=True)
+
+
+    def tearDown(self):
+        # Deletar o arquivo temporário
+        if os.path.exists(self.filepath):
+            os.remove(self.filepath)
+
+
+    def test_get_by_id_cache(self):
+        """
+        Deve buscar transações pelo índice em memória, inclusive após update e delete
+        """
+        t1 = make_transaction()
+        t2 = make_transaction(descricao="Padaria")
+        self.repo.add(t1)
+        self.repo.add(t2)
+
+        self.assertEqual(self.repo.get_by_id(t1.id), t1)
+        self.assertEqual(self.repo.get_by_id(t2.id), t2)
+
+        t1.valor = -120.00
+        self.repo.update(t1)
+        self.assertEqual(self.repo.get_by_id(t1.id).valor, -120.00)
+
+        self.repo.delete(t2)
+        self.assertIsNone(self.repo.get_by_id(t2.id))
+
+
+    def test_list_all_nao_rele_arquivo(self):
+        """
+        Chamadas repetidas de list_all não devem reler o arquivo quando ele não mudou
+        """
+        self.repo.add(make_transaction())
+
+        with patch.object(self.repo, "_read", wraps=self.repo._read) as read:
+            self.assertEqual(len(self.repo.list_all()), 1)
+            self.assertEqual(len(self.repo.list_all()), 1)
+            read.assert_not_called()
+
+
+    def test_detecta_alteracao_externa(self):
+        """
+        Deve recarregar o cache quando outro processo/instância altera o arquivo
+        """
+        self.repo.add(make_transaction())
+        self.assertEqual(len(self.repo.list_all()), 1)
+
+        # Outra instância (sem cache) escreve no mesmo arquivo
+        other = TransactionRepository(filepath=self.filepath)
+        t2 = make_transaction(descricao="Farmácia")
+        other.add(t2)
+
+        self.assertEqual(len(self.repo.list_all()), 2)
+        self.assertEqual(self.repo.get_by_id(t2.id), t2)
+
+
+    def test_list_by_period_cache(self):
+        """
+        O índice de datas do cache deve ser atualizado (sem reordenar) após alterações
+        """
+        t1 = make_transaction(data_transacao=date(2025, 4, 28))
+        t2 = make_transaction(data_transacao=date(2025, 4, 2))
+        self.repo.add_many([t1, t2])
+        self.assertEqual(self.repo.list_by_month(year=2025, month=4), [t2.to_dict(), t1.to_dict()])
+
+        with patch("finance_app.core.repositories.transaction_repository.sorted", create=True,
+                   side_effect=AssertionError("reordenou")):
+            # Move t1 para maio
+            t1.data_transacao = date(2025, 5, 1)
+            t1.data_efetivacao = date(2025, 5, 1)
+            self.repo.update(t1)
+
+            self.assertEqual(self.repo.list_by_month(year=2025, month=4), [t2.to_dict()])
+            self.assertEqual(self.repo.list_by_month(year=2025, month=5), [t1.to_dict()])
+            self.assertEqual(self.repo.list_by_period(date(2025, 1, 1), date(2025, 3, 31)), [])
+
+
+    def test_indice_de_datas_incremental(self):
+        """
+        Após uma sequência de alterações, o índice mantido deve coincidir com um índice reconstruído
+        """
+        rng = random.Random(7)
+        for journal in (False, True):
+            with self.subTest(journal=journal):
+                if os.path.exists(self.filepath):
+                    os.remove(self.filepath)
+                repo = TransactionRepository(filepath=self.filepath, cache=True, journal=journal,
+                                             compact_threshold=1024 * 1024 * 1024)
+                transactions = []
+                repo.list_by_period(date(2025, 1, 1), date(2025, 12, 31))
+                repo.list_by_period(date(2025, 1, 1), date(2025, 12, 31), field="data_efetivacao")
+                for _ in range(200):
+                    day = date(2025, rng.randint(1, 12), rng.randint(1, 28))
+                    if transactions and rng.random() < 0.3:
+                        t = rng.choice(transactions)
+                        repo.update(replace(t, data_transacao=day, data_efetivacao=day))
+                        transactions[transactions.index(t)] = replace(t, data_transacao=day, data_efetivacao=day)
+                    elif transactions and rng.random() < 0.2:
+                        repo.delete(transactions.pop(rng.randrange(len(transactions))))
+                    else:
+                        transactions.append(make_transaction(data_transacao=day))
+                        repo.add(transactions[-1])
+
+                for field in ("data_transacao", "data_efetivacao"):
+                    keys, items = repo._date_indexes[field]
+                    self.assertEqual(keys, sorted(item[field] for item in repo.list_all()))
+                    self.assertEqual(sorted(item["id"] for item in items), sorted(str(t.id) for t in transactions))
+                    self.assertEqual([item[field] for item in items], keys)
+                if journal:
+                    os.remove(self.filepath + ".log")
+
+
+class TestTransactionRepositoryJournal(unittest.TestCase):
+    """
+    Testes unitários para o modo journal do TransactionRepository.
+    Verifica a gravação no log, a releitura (snapshot + log) e a compactação.
+    """
+    def setUp(self):
+        # Criar um arquivo temporário para testes
+        os.makedirs("tests/tmp", exist_ok=True)
+        self.filepath = "tests/tmp/transactions_journal_test.json"
+        self.log_path = self.filepath + ".log"
+        self.repo = TransactionRepository(filepath=self.filepath, journal=True)
+
+
+    def tearDown(self):
+        # Deletar os arquivos temporários
+        for path in (self.filepath, self.log_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+    def test_add_grava_no_log(self):
+        """
+        O add deve anexar ao log sem criar/regravar o snapshot
+        """
+        t1 = make_transaction()
+        self.repo.add(t1)
+
+        self.assertFalse(os.path.exists(self.filepath))
+        self.assertTrue(os.path.exists(self.log_path))
+
+        # Uma nova instância deve enxergar a transação reaplicando o log
+        other = TransactionRepository(filepath=self.filepath, journal=True)
+        self.assertEqual(other.get_by_id(t1.id), t1)
+
+
+    def test_update_e_delete(self):
+        """
+        Deve reaplicar update e delete do log sobre o snapshot
+        """
+        t1 = make_transaction()
+        t2 = make_transaction(descricao="Padaria")
+        self.repo.add(t1)
+        self.repo.add(t2)
+        self.repo.compact()
+
+        t1.valor = -80.00
+        self.repo.update(t1)
+        self.repo.delete(t2)
+
+        self.assertEqual(self.repo.get_by_id(t1.id).valor, -80.00)
+        self.assertIsNone(self.repo.get_by_id(t2.id))
+        self.assertEqual(len(self.repo.list_all()), 1)
+
+        with self.assertRaises(ValueError):
+            self.repo.update(t2)
+
+
+    def test_update_sem_releitura(self):
+        """
+        Sem cache, update e os métodos em lote devem conferir os IDs em memória, sem reler snapshot e log
+        """
+        t1 = make_transaction()
+        t2 = make_transaction(descricao="Padaria")
+        self.repo.add_many([t1, t2])
+
+        with patch.object(self.repo, "_read", side_effect=AssertionError("releu o arquivo")):
+            self.repo.update(replace(t1, valor=-80.00))
+            self.repo.delete_many([t2, uuid.uuid4()])
+            self.assertEqual(len(self.repo.add_many([t2, t2]).applied), 1)
+            self.assertEqual(len(self.repo.update_many([replace(t2, valor=-5.00)]).applied), 1)
+            with self.assertRaises(ValueError):
+                self.repo.update(make_transaction())
+
+        self.assertEqual(self.repo.get_by_id(t1.id).valor, -80.00)
+        self.assertEqual(self.repo.get_by_id(t2.id).valor, -5.00)
+
+        # Uma alteração feita por outra instância força a releitura dos IDs
+        TransactionRepository(filepath=self.filepath, journal=True).delete(t1)
+        with self.assertRaises(ValueError):
+            self.repo.update(t1)
+
+
+    def test_compact(self):
+        """
+        A compactação deve incorporar o log ao snapshot e remover o log
+        """
+        transactions = [make_transaction(descricao=f"Compra {i}") for i in range(5)]
+        for t in transactions:
+            self.repo.add(t)
+
+        self.repo.compact()
+
+        self.assertFalse(os.path.exists(self.log_path))
+        plain = TransactionRepository(filepath=self.filepath)
+        self.assertEqual(len(plain.list_all()), 5)
+
+
+    def test_compactacao_automatica(self):
+        """
+        Deve compactar automaticamente quando o log passa do limite
+        """
+        repo = TransactionRepository(filepath=self.filepath, journal=True, compact_threshold=0)
+        repo.add(make_transaction())
+
+        self.assertFalse(os.path.exists(self.log_path))
+        self.assertEqual(len(TransactionRepository(filepath=self.filepath).list_all()), 1)
+
+
+    def test_replay_idempotente(self):
+        """
+        Reaplicar um log já incorporado ao snapshot (queda durante a compactação) não deve duplicar dados
+        """
+        self.repo.add(make_transaction())
+        self.repo.add(make_transaction(descricao="Padaria"))
+        with open(self.log_path, "r") as f:
+            log = f.read()
+
+        self.repo.compact()
+
+        # Simula a queda: o snapshot foi gravado, mas o log não chegou a ser removido
+        with open(self.log_path, "w") as f:
+            f.write(log)
+
+        self.assertEqual(len(self.repo.list_all()), 2)
+
+
+    def test_journal_com_cache(self):
+        """
+        Modo journal combinado com cache deve manter o cache consistente sem reler o arquivo
+        """
+        repo = TransactionRepository(filepath=self.filepath, journal=True, cache=True)
+        t1 = make_transaction()
+        t2 = make_transaction(descricao="Padaria")
+        repo.add(t1)
+        repo.add(t2)
+
+        with patch.object(repo, "_read", wraps=repo._read) as read:
+            t1.valor = -10.00
+            repo.update(t1)
+            repo.delete(t2)
+            self.assertEqual(repo.get_by_id(t1.id).valor, -10.00)
+            self.assertIsNone(repo.get_by_id(t2.id))
+            read.assert_not_called()
+
+        other = TransactionRepository(filepath=self.filepath, journal=True)
+        self.assertEqual(other.list_all(), repo.list_all())
+
+
+    def test_bulk_journal(self):
+        """
+        As operações em lote devem anexar ao log e ser reaplicadas por outra instância
+        """
+        repo = TransactionRepository(filepath=self.filepath, journal=True, cache=True)
+        t1 = make_transaction()
+        t2 = make_transaction(descricao="Padaria")
+        t3 = make_transaction(descricao="Farmácia")
+
+        repo.add_many([t1, t2, t3])
+        t1.valor = -5.00
+        repo.update_many([t1])
+        repo.delete_many([t2])
+
+        self.assertFalse(os.path.exists(self.filepath))
+        other = TransactionRepository(filepath=self.filepath, journal=True)
+        self.assertEqual(other.list_all(), [t1.to_dict(), t3.to_dict()])
+        self.assertEqual(repo.list_all(), other.list_all())
+
+
+    def test_iter_all_journal(self):
+        """
+        A leitura em blocos deve aplicar o log com a mesma semântica de list_all
+        """
+        t1, t2, t3, t4 = (make_transaction(descricao=f"Compra {i}") for i in range(4))
+        self.repo.add_many([t1, t2, t3])
+        self.repo.compact()
+
+        t1.valor = -1.00
+        self.repo.update(t1)
+        self.repo.delete(t2)
+        self.repo.add(t4)
+        # Remove e adiciona de novo: t3 vai para o fim da lista
+        self.repo.delete(t3)
+        t3.valor = -3.00
+        self.repo.add(t3)
+        t4.valor = -4.00
+        self.repo.update(t4)
+
+        expected = [t1.to_dict(), t4.to_dict(), t3.to_dict()]
+        self.assertEqual(self.repo.list_all(), expected)
+        self.assertEqual(list(self.repo.iter_all(chunk_size=32)), expected)
+
+
+    def test_iter_all_journal_ja_compactado(self):
+        """
+        A leitura em blocos não deve duplicar registros de um log já incorporado ao snapshot
+        """
+        t1 = make_transaction()
+        self.repo.add(t1)
+        t1.valor = -2.00
+        self.repo.update(t1)
+        with open(self.log_path, "r") as f:
+            log = f.read()
+
+        self.repo.compact()
+        with open(self.log_path, "w") as f:
+            f.write(log)
+
+        self.assertEqual(list(self.repo.iter_all()), [t1.to_dict()])
+        self.assertEqual(list(self.repo.iter_all()), self.repo.list_all())
+
+
+    def test_events_journal(self):
+        """
+        No modo journal (com ou sem cache), os eventos devem trazer o registro antigo correto
+        """
+        for cache in (False, True):
+            with self.subTest(cache=cache):
+                repo = TransactionRepository(filepath=self.filepath, journal=True, cache=cache)
+                changes = []
+                repo.events.subscribe(lambda old, new: changes.append((old, new)))
+                t1 = make_transaction()
+                old = t1.to_dict()
+
+                repo.add(t1)
+                repo.add(t1)  # ID já existente: ignorado no journal, sem evento
+                t1.valor = -1.00
+                repo.update_many([t1])
+                repo.delete(t1)
+
+                self.assertEqual(changes, [(None, old), (old, t1.to_dict()), (t1.to_dict(), None)])
+                repo.compact()
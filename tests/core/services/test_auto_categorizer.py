@@ -0,0 +1,107 @@
+import os
+import unittest
+import uuid
+from finance_app.core.models.category import Category
+from finance_app.core.repositories.category_repository import CategoryRepository
+from finance_app.core.services.auto_categorizer import AutoCategorizer, merchant_key
+from tests.factories import make_transaction
+
+
+class TestAutoCategorizer(unittest.TestCase):
+    """
+    Testes unitários para a classe AutoCategorizer.
+    Verifica a tabela de estabelecimentos, o naive Bayes, o treino incremental e a validação na hierarquia
+    """
+
+    def setUp(self):
+        # Criar um arquivo temporário para testes
+        os.makedirs("tests/tmp", exist_ok=True)
+        self.filepath = "tests/tmp/categories_categorizer_test.json"
+        self.categories = CategoryRepository(filepath=self.filepath)
+        transporte = Category(id=uuid.uuid4(), nome="Transporte", nivel=1)
+        carro = Category(id=uuid.uuid4(), nome="Carro", nivel=2, categoria_pai=transporte.id)
+        alimentacao = Category(id=uuid.uuid4(), nome="Alimentação", nivel=1)
+        mercado = Category(id=uuid.uuid4(), nome="Mercado", nivel=2, categoria_pai=alimentacao.id)
+        self.categories.add_many([transporte, carro, alimentacao, mercado])
+        self.categorizer = AutoCategorizer(self.categories)
+        self.categorizer.train([
+            make_transaction("UBER *TRIP 1234", categoria_n1="Transporte", categoria_n2="Carro", categoria_n3=""),
+            make_transaction("UBER *TRIP 9876", categoria_n1="Transporte", categoria_n2="Carro", categoria_n3=""),
+            make_transaction("Posto Ipiranga", categoria_n1="Transporte", categoria_n2="Carro", categoria_n3=""),
+            make_transaction("Supermercado Pão de Açúcar", categoria_n1="Alimentação", categoria_n2="Mercado",
+                             categoria_n3=""),
+            make_transaction("Carrefour Supermercado", categoria_n1="Alimentação", categoria_n2="Mercado",
+                             categoria_n3=""),
+            make_transaction("Sem categoria", categoria_n1="", categoria_n2="", categoria_n3=""),
+        ])
+
+
+    def tearDown(self):
+        # Deletar o arquivo temporário
+        if os.path.exists(self.filepath):
+            os.remove(self.filepath)
+
+
+    def test_merchant_key(self):
+        """
+        Deve ignorar acentos, pontuação e termos com dígitos
+        """
+        self.assertEqual(merchant_key("UBER *TRIP 1234"), "uber trip")
+
+
+    def test_predict(self):
+        """
+        Deve usar a tabela de estabelecimentos e, sem correspondência exata, o naive Bayes
+        """
+        prediction = self.categorizer.predict("Uber Trip 5555")
+        self.assertEqual(prediction[:3], ("Transporte", "Carro", ""))
+        self.assertEqual(prediction.source, "merchant")
+
+        prediction = self.categorizer.predict("Supermercado Extra")
+        self.assertEqual(prediction[:3], ("Alimentação", "Mercado", ""))
+        self.assertEqual(prediction.source, "bayes")
+        self.assertGreater(prediction.confidence, 0.5)
+
+        self.assertIsNone(self.categorizer.predict("Netflix"))
+
+
+    def test_validacao_hierarquia(self):
+        """
+        Não deve sugerir caminhos de categoria que não existem no repositório
+        """
+        self.categorizer.train([make_transaction("Netflix", categoria_n1="Lazer", categoria_n2="Streaming",
+                                                 categoria_n3="")])
+        self.assertIsNone(self.categorizer.predict("Netflix"))
+
+        lazer = Category(id=uuid.uuid4(), nome="Lazer", nivel=1)
+        self.categories.add_many([lazer, Category(id=uuid.uuid4(), nome="Streaming", nivel=2,
+                                                  categoria_pai=lazer.id)])
+        self.assertEqual(self.categorizer.predict("Netflix")[:3], ("Lazer", "Streaming", ""))
+
+
+    def test_treino_incremental(self):
+        """
+        untrain deve desfazer o treino sem retreinar do zero
+        """
+        netflix = make_transaction("Netflix", categoria_n1="Transporte", categoria_n2="Carro", categoria_n3="")
+        self.categorizer.train([netflix])
+        self.assertEqual(self.categorizer.predict("Netflix").source, "merchant")
+
+        self.categorizer.untrain([netflix])
+        self.assertIsNone(self.categorizer.predict("Netflix"))
+
+
+    def test_categorize_many(self):
+        """
+        Deve preencher as categorias das transações sem categoria, reportando as não categorizadas
+        """
+        t1 = make_transaction("UBER *TRIP 4321", categoria_n1="", categoria_n2="", categoria_n3="")
+        t2 = make_transaction("Netflix", categoria_n1="", categoria_n2="", categoria_n3="")
+        t3 = make_transaction("Posto Ipiranga", categoria_n1="Alimentação", categoria_n2="Mercado", categoria_n3="")
+
+        result = self.categorizer.categorize_many([t1, t2, t3])
+
+        self.assertEqual(result.applied, [t1.id])
+        self.assertEqual(result.skipped, [t2.id, t3.id])
+        self.assertEqual((t1.categoria_n1, t1.categoria_n2, t1.categoria_n3), ("Transporte", "Carro", ""))
+        self.assertEqual(t3.categoria_n1, "Alimentação")
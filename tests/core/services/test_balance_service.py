@@ -0,0 +1,112 @@
+import dataclasses
+import os
+import random
+import unittest
+from datetime import date, timedelta
+from finance_app.core.repositories.transaction_repository import TransactionRepository
+from finance_app.core.services.balance_service import BalanceService
+from tests.factories import make_transaction
+
+
+class TestBalanceService(unittest.TestCase):
+    """
+    Testes unitários para a classe BalanceService.
+    Verifica saldos em datas, séries diárias, projeções e a atualização incremental
+    """
+
+    def setUp(self):
+        # Criar um arquivo temporário para testes
+        os.makedirs("tests/tmp", exist_ok=True)
+        self.filepath = "tests/tmp/transactions_balance_test.json"
+        self.repo = TransactionRepository(filepath=self.filepath, cache=True)
+        self.t1 = make_transaction(valor=1000.00, data_transacao=date(2025, 4, 1), pago=True)
+        self.t2 = make_transaction(valor=-200.50, data_transacao=date(2025, 4, 3), pago=True)
+        self.t3 = make_transaction(valor=-300.00, data_transacao=date(2025, 4, 10), pago=False)
+        self.t4 = make_transaction(valor=50.00, data_transacao=date(2025, 4, 2), conta="Nubank", pago=True)
+        self.repo.add_many([self.t1, self.t2, self.t3, self.t4])
+        self.service = BalanceService(self.repo)
+
+
+    def tearDown(self):
+        # Deletar o arquivo temporário
+        self.service.close()
+        if os.path.exists(self.filepath):
+            os.remove(self.filepath)
+
+
+    def test_balance_at(self):
+        """
+        Deve somar as transações efetivadas até a data, por conta
+        """
+        self.assertEqual(self.service.balance_at("Itaú", date(2025, 3, 31)), 0.0)
+        self.assertEqual(self.service.balance_at("Itaú", date(2025, 4, 1)), 1000.00)
+        self.assertEqual(self.service.balance_at("Itaú", date(2025, 4, 30)), 799.50)
+        self.assertEqual(self.service.balance_at("Itaú", date(2025, 4, 30), include_unpaid=True), 499.50)
+        self.assertEqual(self.service.balance_at("Nubank", date(2025, 4, 30)), 50.00)
+        self.assertEqual(self.service.balance_at("Inter", date(2025, 4, 30)), 0.0)
+        self.assertEqual(self.service.accounts(), ["Itaú", "Nubank"])
+
+
+    def test_daily_balances(self):
+        """
+        Deve retornar um saldo por dia, incluindo dias sem movimento
+        """
+        series = self.service.daily_balances("Itaú", date(2025, 3, 31), date(2025, 4, 4))
+        self.assertEqual(series, [(date(2025, 3, 31), 0.0), (date(2025, 4, 1), 1000.00),
+                                  (date(2025, 4, 2), 1000.00), (date(2025, 4, 3), 799.50),
+                                  (date(2025, 4, 4), 799.50)])
+        projection = self.service.projection("Itaú", date(2025, 4, 9), date(2025, 4, 10))
+        self.assertEqual(projection, [(date(2025, 4, 9), 799.50), (date(2025, 4, 10), 499.50)])
+        self.assertEqual(self.service.daily_balances("Itaú", date(2025, 4, 2), date(2025, 4, 1)), [])
+
+
+    def test_incremental(self):
+        """
+        Deve refletir add, update (pagamento e mudança de data) e delete
+        """
+        self.repo.add(make_transaction(valor=-100.00, data_transacao=date(2025, 4, 2), pago=True))
+        self.assertEqual(self.service.balance_at("Itaú", date(2025, 4, 2)), 900.00)
+        self.assertEqual(self.service.balance_at("Itaú", date(2025, 4, 30)), 699.50)
+
+        self.t3.marcar_como_pago()
+        self.repo.update(self.t3)
+        self.assertEqual(self.service.balance_at("Itaú", date(2025, 4, 30)), 399.50)
+
+        self.repo.update(dataclasses.replace(self.t1, data_efetivacao=date(2025, 4, 5)))
+        self.assertEqual(self.service.balance_at("Itaú", date(2025, 4, 4)), -300.50)
+
+        self.repo.delete(self.t2)
+        self.assertEqual(self.service.balance_at("Itaú", date(2025, 4, 4)), -100.00)
+
+
+    def test_aleatorio(self):
+        """
+        Os saldos incrementais devem coincidir com a soma direta das transações
+        """
+        rng = random.Random(7)
+        transactions = []
+        for _ in range(300):
+            if transactions and rng.random() < 0.3:
+                changed = dataclasses.replace(rng.choice(transactions),
+                                              data_efetivacao=date(2025, 1, 1) + timedelta(days=rng.randint(0, 60)),
+                                              pago=rng.random() < 0.5)
+                self.repo.update(changed)
+                transactions = [changed if t.id == changed.id else t for t in transactions]
+            else:
+                transaction = make_transaction(valor=round(rng.uniform(-500, 500), 2), data_transacao=date(2025, 1, 1),
+                                               data_efetivacao=date(2025, 1, 1) + timedelta(days=rng.randint(0, 60)),
+                                               conta=rng.choice(["Itaú", "Nubank"]), pago=rng.random() < 0.5)
+                self.repo.add(transaction)
+                transactions.append(transaction)
+
+            day = date(2025, 1, 1) + timedelta(days=rng.randint(0, 60))
+            for include_unpaid in (False, True):
+                expected = sum(round(t.valor * 100) for t in transactions
+                               if t.conta == "Itaú" and t.data_efetivacao <= day and (include_unpaid or t.pago))
+                self.assertEqual(self.service.balance_at("Itaú", day, include_unpaid), expected / 100)
+
+        fresh = BalanceService(self.repo)
+        start, end = date(2024, 12, 25), date(2025, 3, 10)
+        for conta in ("Itaú", "Nubank"):
+            self.assertEqual(fresh.projection(conta, start, end), self.service.projection(conta, start, end))
+        fresh.close()
@@ -0,0 +1,107 @@
+import os
+import unittest
+from datetime import date
+from finance_app.core.repositories.transaction_repository import TransactionRepository
+from finance_app.core.services.budget_report import BudgetReportService
+from tests.factories import make_transaction
+
+
+class TestBudgetReportService(unittest.TestCase):
+    """
+    Testes unitários para a classe BudgetReportService.
+    Verifica os totais incrementais e a tabela orçado vs realizado
+    """
+
+    def setUp(self):
+        # Criar um arquivo temporário para testes
+        os.makedirs("tests/tmp", exist_ok=True)
+        self.filepath = "tests/tmp/transactions_budget_test.json"
+        self.repo = TransactionRepository(filepath=self.filepath, cache=True)
+        self.t1 = make_transaction(valor=-1500.00, data_transacao=date(2025, 4, 5), categoria_n1="Moradia",
+                                   categoria_n2="Aluguel", categoria_n3="")
+        self.t2 = make_transaction(valor=-35.90, data_transacao=date(2025, 4, 10), categoria_n1="Alimentação",
+                                   categoria_n2="Mercado", categoria_n3="")
+        self.repo.add_many([self.t1, self.t2])
+        self.service = BudgetReportService(self.repo)
+
+
+    def tearDown(self):
+        # Deletar o arquivo temporário
+        self.service.close()
+        if os.path.exists(self.filepath):
+            os.remove(self.filepath)
+
+
+    def test_totais_iniciais(self):
+        """
+        Deve calcular os totais a partir das transações já existentes
+        """
+        self.assertEqual(self.service.actual(2025, 4, ("Moradia",)), -1500.00)
+        self.assertEqual(self.service.actual(2025, 4, ("Alimentação", "Mercado")), -35.90)
+        self.assertEqual(self.service.actual(2025, 5, ("Moradia",)), 0)
+
+
+    def test_atualizacao_incremental(self):
+        """
+        add, update e delete no repositório devem ajustar os totais sem reler os dados
+        """
+        t3 = make_transaction(valor=-64.10, data_transacao=date(2025, 4, 20), categoria_n1="Alimentação",
+                              categoria_n2="Mercado", categoria_n3="")
+        self.repo.add(t3)
+        self.assertEqual(self.service.actual(2025, 4, ("Alimentação",)), -100.00)
+
+        # Move t1 para maio
+        self.t1.data_transacao = date(2025, 5, 5)
+        self.t1.data_efetivacao = date(2025, 5, 5)
+        self.repo.update(self.t1)
+        self.assertEqual(self.service.actual(2025, 4, ("Moradia",)), 0)
+        self.assertEqual(self.service.actual(2025, 5, ("Moradia",)), -1500.00)
+
+        self.repo.delete_many([self.t2, t3])
+        self.assertEqual(self.service.actual(2025, 4, ("Alimentação",)), 0)
+
+        # Os totais incrementais devem coincidir com um recálculo completo
+        rebuilt = BudgetReportService(self.repo)
+        self.assertEqual(rebuilt._actuals, self.service._actuals)
+        rebuilt.close()
+
+
+    def test_compare(self):
+        """
+        Deve montar a tabela orçado vs realizado com categorias orçadas e/ou realizadas
+        """
+        self.service.set_budget(2025, 4, ("Moradia",), -1500.00)
+        self.service.set_budget(2025, 4, ("Lazer",), -200.00)
+
+        self.assertEqual(self.service.compare(2025, 4), [
+            {"categoria": "Alimentação", "orcado": 0.0, "realizado": -35.90, "diferenca": -35.90},
+            {"categoria": "Lazer", "orcado": -200.00, "realizado": 0.0, "diferenca": 200.00},
+            {"categoria": "Moradia", "orcado": -1500.00, "realizado": -1500.00, "diferenca": 0.0},
+        ])
+
+        with self.assertRaises(ValueError):
+            self.service.compare(2025, 4, ("Moradia", "Aluguel", "Extra"))
+        with self.assertRaises(ValueError):
+            self.service.set_budget(2025, 4, "Moradia", -1500.00)
+
+
+    def test_subcategorias_com_mesmo_nome(self):
+        """
+        Subcategorias com o mesmo nome em categorias diferentes devem ficar em células separadas
+        """
+        self.repo.add_many([
+            make_transaction(valor=-80.00, data_transacao=date(2025, 4, 2), categoria_n1="Moradia",
+                             categoria_n2="Outros", categoria_n3=""),
+            make_transaction(valor=-45.00, data_transacao=date(2025, 4, 3), categoria_n1="Lazer",
+                             categoria_n2="Outros", categoria_n3=""),
+        ])
+        self.service.set_budget(2025, 4, ("Lazer", "Outros"), -50.00)
+
+        self.assertEqual(self.service.actual(2025, 4, ("Moradia", "Outros")), -80.00)
+        self.assertEqual(self.service.actual(2025, 4, ("Lazer", "Outros")), -45.00)
+        self.assertEqual(self.service.budget(2025, 4, ("Moradia", "Outros")), 0)
+        self.assertEqual(self.service.compare(2025, 4, ("Lazer",)), [
+            {"categoria": "Outros", "orcado": -50.00, "realizado": -45.00, "diferenca": 5.00},
+        ])
+        self.assertEqual([row["categoria"] for row in self.service.compare(2025, 4, ("Moradia",))],
+                         ["Aluguel", "Outros"])
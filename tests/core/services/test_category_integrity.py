@@ -0,0 +1,125 @@
+import os
+import unittest
+import uuid
+from datetime import date
+from finance_app.core.models.category import Category
+from finance_app.core.repositories.category_repository import CategoryRepository
+from finance_app.core.repositories.transaction_repository import TransactionRepository
+from finance_app.core.services.category_integrity import CategoryIntegrityService, validate_paths
+from tests.factories import make_transaction
+
+
+class TestCategoryIntegrityService(unittest.TestCase):
+    """
+    Testes unitários para a classe CategoryIntegrityService.
+    Verifica o índice reverso, a conferência de exclusões/renomeações, a cascata e a validação em lote
+    """
+
+    def setUp(self):
+        # Criar arquivos temporários para testes
+        os.makedirs("tests/tmp", exist_ok=True)
+        self.transaction_path = "tests/tmp/transactions_integrity_test.json"
+        self.category_path = "tests/tmp/categories_integrity_test.json"
+        self.transactions = TransactionRepository(filepath=self.transaction_path)
+        self.categories = CategoryRepository(filepath=self.category_path)
+
+        self.estilo = Category(id=uuid.uuid4(), nome="Estilo de Vida", nivel=1)
+        self.alimentacao = Category(id=uuid.uuid4(), nome="Alimentação", nivel=2, categoria_pai=self.estilo.id)
+        self.mercado = Category(id=uuid.uuid4(), nome="Mercado", nivel=3, categoria_pai=self.alimentacao.id)
+        self.restaurante = Category(id=uuid.uuid4(), nome="Restaurante", nivel=3,
+                                    categoria_pai=self.alimentacao.id)
+        self.categories.add_many([self.estilo, self.alimentacao, self.mercado, self.restaurante])
+
+        self.t1 = make_transaction()
+        self.t2 = make_transaction(categoria_n3="Restaurante")
+        self.transactions.add_many([self.t1, self.t2])
+        self.service = CategoryIntegrityService(self.transactions, self.categories)
+
+
+    def tearDown(self):
+        # Deletar os arquivos temporários
+        self.service.close()
+        for path in (self.transaction_path, self.category_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+    def test_references(self):
+        """
+        O índice deve incluir as transações das subcategorias e acompanhar as alterações do repositório
+        """
+        self.assertEqual(self.service.references(self.alimentacao), {str(self.t1.id), str(self.t2.id)})
+        self.assertEqual(self.service.references(self.mercado.id), {str(self.t1.id)})
+
+        self.t1.categoria_n3 = "Restaurante"
+        self.transactions.update(self.t1)
+        self.assertEqual(self.service.references(self.mercado), set())
+        with self.assertRaises(ValueError):
+            self.service.references(uuid.uuid4())
+
+
+    def test_delete_conferido(self):
+        """
+        Sem cascata, deve recusar a exclusão de categorias usadas ou com subcategorias
+        """
+        with self.assertRaises(ValueError):
+            self.service.delete_category(self.mercado)
+        with self.assertRaises(ValueError):
+            self.service.delete_category(self.alimentacao)
+        self.assertEqual(len(self.categories.list_all()), 4)
+
+        self.transactions.delete(self.t1)
+        result = self.service.delete_category(self.mercado)
+        self.assertEqual(result.categories.applied, [self.mercado.id])
+        self.assertIsNone(self.categories.get_by_id(self.mercado.id))
+
+
+    def test_delete_em_cascata(self):
+        """
+        Em cascata, deve remover as subcategorias e mover as transações para a categoria pai ou substituta
+        """
+        result = self.service.delete_category(self.mercado, cascade=True, replacement=self.restaurante)
+        self.assertEqual(result.transactions.applied, [self.t1.id])
+        self.assertEqual(self.transactions.get_by_id(self.t1.id).categoria_n3, "Restaurante")
+
+        with self.assertRaises(ValueError):
+            self.service.delete_category(self.estilo, cascade=True, replacement=self.restaurante)
+
+        result = self.service.delete_category(self.alimentacao, cascade=True)
+        self.assertEqual(set(result.categories.applied), {self.alimentacao.id, self.restaurante.id})
+        self.assertEqual(len(result.transactions.applied), 2)
+        moved = self.transactions.get_by_id(self.t2.id)
+        self.assertEqual((moved.categoria_n1, moved.categoria_n2, moved.categoria_n3), ("Estilo de Vida", "", ""))
+        self.assertEqual(self.service.violations(), [])
+
+
+    def test_rename(self):
+        """
+        Deve recusar nomes repetidos entre irmãs e, em cascata, renomear também nas transações
+        """
+        with self.assertRaises(ValueError):
+            self.service.rename_category(self.mercado, "Restaurante", cascade=True)
+        with self.assertRaises(ValueError):
+            self.service.rename_category(self.alimentacao, "Comida")
+
+        result = self.service.rename_category(self.alimentacao, "Comida", cascade=True)
+        self.assertEqual(result.categories.applied, [self.alimentacao.id])
+        self.assertEqual(len(result.transactions.applied), 2)
+        renamed = self.transactions.get_by_id(self.t2.id)
+        self.assertEqual((renamed.categoria_n2, renamed.categoria_n3), ("Comida", "Restaurante"))
+        self.assertEqual(self.service.references(self.alimentacao), {str(self.t1.id), str(self.t2.id)})
+        self.assertEqual(self.service.violations(), [])
+
+
+    def test_validate_paths(self):
+        """
+        Deve apontar o primeiro nível inexistente de cada caminho, aceitando caminhos parciais e vazios
+        """
+        invalid = make_transaction(categoria_n3="Padaria")
+        records = [self.t1, make_transaction(categoria_n2="", categoria_n3=""),
+                   make_transaction(categoria_n1="", categoria_n2="", categoria_n3=""), invalid.to_dict(),
+                   make_transaction(categoria_n1="Moradia", categoria_n2="Contas", categoria_n3="")]
+        violations = validate_paths(records, self.categories.get_tree())
+
+        self.assertEqual([(v.id, v.level) for v in violations], [(str(invalid.id), 3), (str(records[4].id), 1)])
+        self.assertEqual(violations[0].path, ("Estilo de Vida", "Alimentação", "Padaria"))
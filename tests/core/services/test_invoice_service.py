@@ -0,0 +1,91 @@
+import dataclasses
+import os
+import unittest
+from datetime import date
+from finance_app.core.repositories.transaction_repository import TransactionRepository
+from finance_app.core.services.invoice_service import InvoiceService, InvoiceSummary
+from tests.factories import make_transaction
+
+
+class TestInvoiceService(unittest.TestCase):
+    """
+    Testes unitários para a classe InvoiceService.
+    Verifica os totais por fatura, os lançamentos e a atualização incremental
+    """
+
+    def setUp(self):
+        # Criar um arquivo temporário para testes
+        os.makedirs("tests/tmp", exist_ok=True)
+        self.filepath = "tests/tmp/transactions_invoice_test.json"
+        self.repo = TransactionRepository(filepath=self.filepath, cache=True)
+        self.t1 = make_transaction(valor=-100.00, data_transacao=date(2025, 4, 10), cartao="Nubank")
+        self.t2 = make_transaction(valor=-50.25, data_transacao=date(2025, 4, 10), cartao="Nubank", pago=True)
+        self.t3 = make_transaction(valor=-30.00, data_transacao=date(2025, 5, 10), cartao="Nubank")
+        self.t4 = make_transaction(valor=-70.00, data_transacao=date(2025, 4, 10), cartao="Visa")
+        self.t5 = make_transaction(valor=-10.00, data_transacao=date(2025, 4, 10), cartao="")
+        self.repo.add_many([self.t1, self.t2, self.t3, self.t4, self.t5])
+        self.service = InvoiceService(self.repo)
+
+
+    def tearDown(self):
+        # Deletar o arquivo temporário
+        self.service.close()
+        if os.path.exists(self.filepath):
+            os.remove(self.filepath)
+
+
+    def test_summary(self):
+        """
+        Deve separar os totais por cartão e mês, com a parte paga e não paga
+        """
+        self.assertEqual(self.service.summary("Nubank", 2025, 4),
+                         InvoiceSummary("Nubank", 2025, 4, -150.25, -50.25, -100.00, 2))
+        self.assertEqual(self.service.summary("Nubank", 2025, 5).total, -30.00)
+        self.assertEqual(self.service.summary("Visa", 2025, 4).unpaid, -70.00)
+        self.assertEqual(self.service.summary("Visa", 2025, 5).count, 0)
+        self.assertEqual(self.service.cards(), ["Nubank", "Visa"])
+        self.assertEqual([(s.cartao, s.month) for s in self.service.summaries()],
+                         [("Nubank", 4), ("Nubank", 5), ("Visa", 4)])
+        self.assertEqual(len(self.service.summaries(cartao="Nubank", year=2025)), 2)
+
+
+    def test_items(self):
+        """
+        Deve retornar os lançamentos da fatura na ordem do repositório
+        """
+        self.assertEqual(self.service.items("Nubank", 2025, 4), [self.t1, self.t2])
+        self.assertEqual(self.service.items("Nubank", 2024, 4), [])
+
+
+    def test_incremental(self):
+        """
+        Deve refletir add, pagamento, mudança de fatura e delete sem reler o repositório
+        """
+        t6 = make_transaction(valor=-5.00, data_transacao=date(2025, 4, 10), cartao="Nubank")
+        self.repo.add(t6)
+        self.assertEqual(self.service.summary("Nubank", 2025, 4).total, -155.25)
+
+        self.t1.marcar_como_pago()
+        self.repo.update(self.t1)
+        summary = self.service.summary("Nubank", 2025, 4)
+        self.assertEqual((summary.paid, summary.unpaid), (-150.25, -5.00))
+        self.assertEqual(self.service.items("Nubank", 2025, 4), [self.t1, self.t2, t6])
+
+        self.repo.update(dataclasses.replace(self.t3, data_efetivacao=date(2025, 6, 10)))
+        self.assertEqual(self.service.summary("Nubank", 2025, 5).count, 0)
+        self.assertEqual(self.service.summary("Nubank", 2025, 6).total, -30.00)
+
+        self.repo.delete(self.t4)
+        self.assertEqual(self.service.cards(), ["Nubank"])
+
+        fresh = InvoiceService(self.repo)
+        self.assertEqual(fresh.summaries(), self.service.summaries())
+        fresh.close()
+
+
+    def test_campo_invalido(self):
+        """
+        Deve rejeitar campos de data inexistentes
+        """
+        with self.assertRaises(ValueError):
+            InvoiceService(self.repo, month_field="data")
@@ -0,0 +1,104 @@
+import unittest
+from datetime import date
+from finance_app.core.services.parallel_reports import ParallelReportExecutor
+from finance_app.core.services.transaction_frame import TransactionFrame
+from tests.factories import make_record
+
+
+class TestParallelReportExecutor(unittest.TestCase):
+    """
+    Testes unitários para a classe ParallelReportExecutor.
+    Verifica o particionamento e se o resultado em paralelo é igual ao sequencial
+    """
+
+    def setUp(self):
+        self.records = [
+            make_record(valor=-1500.00, data_transacao=date(2024, 12, 5), categoria_n1="Moradia",
+                        categoria_n2="Aluguel"),
+            make_record(valor=-35.90, data_transacao=date(2025, 1, 10), categoria_n1="Alimentação",
+                        categoria_n2="Mercado"),
+            make_record(valor=-64.10, data_transacao=date(2025, 1, 20), categoria_n1="Alimentação",
+                        categoria_n2="Restaurante"),
+            make_record(valor=-1500.00, data_transacao=date(2025, 3, 5), categoria_n1="Moradia",
+                        categoria_n2="Aluguel"),
+            make_record(valor=-20.00, data_transacao=date(2025, 3, 12), categoria_n1="Alimentação",
+                        categoria_n2="Mercado"),
+        ]
+        self.frame = TransactionFrame.from_records(self.records)
+
+
+    def test_partition(self):
+        """
+        Deve dividir as linhas em fatias contíguas de tamanhos próximos, uma por processo
+        """
+        chunks = ParallelReportExecutor(max_workers=2).partition(self.frame)
+        self.assertEqual([len(chunk.values) for chunk in chunks], [2, 3])
+        self.assertEqual([value for chunk in chunks for value in chunk.values], list(self.frame.columns["valor"]))
+
+        chunks = ParallelReportExecutor().partition(self.frame, parts=10)
+        self.assertEqual([len(chunk.values) for chunk in chunks], [1, 1, 1, 1, 1])
+        self.assertEqual(ParallelReportExecutor().partition(TransactionFrame.from_records([])), [])
+
+        with self.assertRaises(ValueError):
+            ParallelReportExecutor(month_field="valor")
+
+
+    def test_category_report(self):
+        """
+        Deve calcular totais, médias (meses sem transações contam como 0) e sazonalidade
+        """
+        report = ParallelReportExecutor(max_workers=1).category_report(self.records)
+        self.assertEqual(report.months, ["2024-12", "2025-01", "2025-02", "2025-03"])
+        self.assertEqual(report.monthly[("2025-01", "Alimentação")], -100.00)
+        self.assertEqual(report.totals, {("Moradia",): -3000.00, ("Alimentação",): -120.00})
+        self.assertEqual(report.yearly[(2025, "Moradia")], -1500.00)
+        self.assertEqual(report.monthly_average[("Alimentação",)], -30.00)
+        self.assertAlmostEqual(report.average_transaction[("Alimentação",)], -40.00)
+        self.assertEqual(report.seasonality[("Moradia",)][11], -1500.00)
+        self.assertEqual(report.seasonality[("Moradia",)][1], 0.0)
+
+        level2 = ParallelReportExecutor(max_workers=1).category_report(self.frame, level=2)
+        self.assertEqual(level2.totals[("Alimentação", "Mercado")], -55.90)
+        self.assertEqual(level2.monthly[("2025-01", "Alimentação", "Restaurante")], -64.10)
+
+        with self.assertRaises(ValueError):
+            ParallelReportExecutor().category_report(self.frame, level=4)
+
+
+    def test_parallel_igual_sequencial(self):
+        """
+        O resultado com vários processos deve ser igual ao resultado sequencial e ao group_sum do frame
+        """
+        parallel = ParallelReportExecutor(max_workers=2).category_report(self.frame)
+        serial = ParallelReportExecutor(max_workers=1).category_report(self.frame)
+        self.assertEqual(parallel, serial)
+
+        expected = {key: cents / 100 for key, cents in self.frame.monthly_totals(level=1).items()}
+        self.assertEqual(parallel.monthly, expected)
+
+        empty = ParallelReportExecutor(max_workers=2).category_report([])
+        self.assertEqual((empty.months, empty.totals), ([], {}))
+
+
+    def test_subcategorias_mesmo_nome(self):
+        """
+        Subcategorias de mesmo nome em pais diferentes devem ter células e totais separados
+        """
+        records = [
+            make_record(valor=-100.00, categoria_n1="Casa", categoria_n2="Outros", categoria_n3="Diversos"),
+            make_record(valor=-50.00, categoria_n1="Carro", categoria_n2="Outros", categoria_n3="Diversos"),
+        ]
+        frame = TransactionFrame.from_records(records)
+
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                executor = ParallelReportExecutor(max_workers=workers)
+                self.assertEqual(executor.monthly_cells(frame, level=2), {
+                    ("2025-04", "Casa", "Outros"): (-10000, 1),
+                    ("2025-04", "Carro", "Outros"): (-5000, 1),
+                })
+                report = executor.category_report(frame, level=3)
+                self.assertEqual(report.totals, {("Casa", "Outros", "Diversos"): -100.00,
+                                                 ("Carro", "Outros", "Diversos"): -50.00})
+                expected = {key: cents / 100 for key, cents in frame.monthly_totals(level=3).items()}
+                self.assertEqual(report.monthly, expected)
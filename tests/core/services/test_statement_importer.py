@@ -0,0 +1,180 @@
+import io
+import os
+import unittest
+from datetime import date
+from finance_app.core.repositories.transaction_repository import TransactionRepository
+from finance_app.core.services.statement_importer import (CsvFormat, StatementImporter, iter_ofx_transactions,
+                                                          parse_amount)
+
+CSV = ("Data;Descrição;Valor\n"
+       "05/04/2025;Supermercado;-1.234,56\n"
+       "05/04/2025;Café;-8,50\n"
+       "05/04/2025;Café;-8,50\n"
+       "06/04/2025;Salário;5.000,00\n").encode("utf-8")
+
+OFX = """OFXHEADER:100
+DATA:OFXSGML
+
+<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>
+<STMTTRN>
+<TRNTYPE>DEBIT
+<DTPOSTED>20250405120000[-3:BRT]
+<TRNAMT>-150.00
+<FITID>1
+<MEMO>Uber Trip
+</STMTTRN>
+<STMTTRN>
+<TRNTYPE>CREDIT
+<DTPOSTED>20250406
+<TRNAMT>2500,00
+<FITID>2
+<NAME>Pix recebido
+</STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>
+"""
+
+
+class TestStatementImporter(unittest.TestCase):
+    """
+    Testes unitários para a classe StatementImporter.
+    Verifica a leitura de CSV/OFX, a deduplicação em reimportações e a gravação em lotes
+    """
+
+    def setUp(self):
+        # Criar um arquivo temporário para testes
+        os.makedirs("tests/tmp", exist_ok=True)
+        self.filepath = "tests/tmp/transactions_importer_test.json"
+        self.repo = TransactionRepository(filepath=self.filepath, cache=True)
+        self.importer = StatementImporter(self.repo, chunk_size=2)
+
+
+    def tearDown(self):
+        # Deletar o arquivo temporário
+        self.importer.close()
+        if os.path.exists(self.filepath):
+            os.remove(self.filepath)
+
+
+    def test_parse_amount(self):
+        """
+        Deve aceitar separadores brasileiros e o símbolo da moeda
+        """
+        self.assertEqual(parse_amount("R$ -1.234,56"), -1234.56)
+        self.assertEqual(parse_amount("1,234.56", decimal="."), 1234.56)
+        with self.assertRaises(ValueError):
+            parse_amount("abc")
+
+
+    def test_import_csv(self):
+        """
+        Deve mapear as colunas, gravar em lotes e manter lançamentos repetidos legítimos
+        """
+        calls = []
+        add_many = self.repo.add_many
+        self.repo.add_many = lambda batch: calls.append(len(batch)) or add_many(batch)
+
+        result = self.importer.import_csv(io.BytesIO(CSV), conta="Itaú")
+
+        self.assertEqual((result.rows, len(result.imported), result.duplicates), (4, 4, 0))
+        self.assertEqual(calls, [2, 2])
+        transactions = self.repo.list_transactions()
+        self.assertEqual(transactions[0].valor, -1234.56)
+        self.assertEqual(transactions[0].data_transacao, date(2025, 4, 5))
+        self.assertEqual(transactions[0].data_efetivacao, date(2025, 4, 5))
+        self.assertEqual(transactions[0].conta, "Itaú")
+        self.assertEqual([t.descricao for t in transactions].count("Café"), 2)
+
+
+    def test_reimportacao_idempotente(self):
+        """
+        Reimportar o mesmo extrato (ou um extrato sobreposto) não deve duplicar transações
+        """
+        self.importer.import_csv(io.BytesIO(CSV), conta="Itaú")
+        result = self.importer.import_csv(io.BytesIO(CSV), conta="Itaú")
+        self.assertEqual((len(result.imported), result.duplicates), (0, 4))
+
+        # Novo extrato com um terceiro café no mesmo dia: apenas ele é novo
+        extra = CSV + "05/04/2025;Café;-8,50\n".encode("utf-8")
+        result = self.importer.import_csv(io.BytesIO(extra), conta="Itaú")
+        self.assertEqual((len(result.imported), result.duplicates), (1, 4))
+
+        # Mesma linha em outra conta não é duplicata
+        result = self.importer.import_csv(io.BytesIO(CSV), conta="Nubank")
+        self.assertEqual(len(result.imported), 4)
+        self.assertEqual(len(self.repo.list_all()), 9)
+
+
+    def test_indice_acompanha_repositorio(self):
+        """
+        Transações removidas do repositório devem poder ser importadas novamente
+        """
+        result = self.importer.import_csv(io.BytesIO(CSV), conta="Itaú")
+        self.repo.delete_many(result.imported[:1])
+
+        result = self.importer.import_csv(io.BytesIO(CSV), conta="Itaú")
+        self.assertEqual((len(result.imported), result.duplicates), (1, 3))
+
+
+    def test_csv_quebras_de_linha(self):
+        """
+        Quebras de linha dentro de campos entre aspas e separadores Unicode não devem dividir a linha
+        """
+        content = ('Data;Descrição;Valor\r\n'
+                   '05/04/2025;"Padaria\r\nCentro";-12,50\r\n'
+                   '06/04/2025;Farmácia\u2028Centro;-30,00\r\n').encode("utf-8")
+        result = self.importer.import_csv(io.BytesIO(content), conta="Itaú")
+
+        self.assertEqual((result.rows, len(result.imported)), (2, 2))
+        self.assertEqual([t.valor for t in self.repo.list_transactions()], [-12.50, -30.00])
+
+
+    def test_csv_layout_e_erros(self):
+        """
+        Deve aceitar outro layout e informar a linha inválida
+        """
+        content = b"date,memo,amount,account\n2025-04-05,Netflix,-39.90,Nubank\n"
+        csv_format = CsvFormat(columns={"data_transacao": "date", "descricao": "memo", "valor": "amount",
+                                        "conta": "account"}, date_format="%Y-%m-%d", decimal=".", delimiter=",")
+        self.importer.import_csv(io.BytesIO(content), conta="", csv_format=csv_format)
+        self.assertEqual(self.repo.list_transactions()[0].conta, "Nubank")
+
+        with self.assertRaisesRegex(ValueError, "line 6"):
+            self.importer.import_csv(io.BytesIO(CSV + b"31/02/2025;Erro;1,00\n"), conta="Itaú")
+        with self.assertRaisesRegex(ValueError, "Column not found"):
+            self.importer.import_csv(io.BytesIO(content), conta="Itaú")
+
+        # Um campo entre aspas com quebra de linha ocupa duas linhas do arquivo
+        content = ('Data;Descrição;Valor\n'
+                   '05/04/2025;"Padaria\nCentro";-12,50\n'
+                   '31/02/2025;Erro;1,00\n').encode("utf-8")
+        with self.assertRaisesRegex(ValueError, "line 4"):
+            self.importer.import_csv(io.BytesIO(content), conta="Itaú")
+
+
+    def test_import_ofx(self):
+        """
+        Deve ler os lançamentos do OFX mesmo com campos divididos entre blocos de leitura
+        """
+        entries = list(iter_ofx_transactions(io.StringIO(OFX), chunk_size=7))
+        self.assertEqual([entry["TRNAMT"] for entry in entries], ["-150.00", "2500,00"])
+
+        result = self.importer.import_ofx(io.BytesIO(OFX.encode("utf-8")), conta="Itaú")
+        self.assertEqual(len(result.imported), 2)
+        transactions = self.repo.list_transactions()
+        self.assertEqual([t.descricao for t in transactions], ["Uber Trip", "Pix recebido"])
+        self.assertEqual([t.valor for t in transactions], [-150.00, 2500.00])
+        self.assertEqual(transactions[0].data_transacao, date(2025, 4, 5))
+
+        result = self.importer.import_ofx(io.BytesIO(OFX.encode("utf-8")), conta="Itaú")
+        self.assertEqual(result.duplicates, 2)
+
+
+    def test_ofx_entidades(self):
+        """
+        Deve converter as entidades (ex: &amp;) dos valores do OFX
+        """
+        content = OFX.replace("Uber Trip", "Caf&eacute; &amp; Cia").replace("Pix recebido", "P&#237;x")
+
+        entries = list(iter_ofx_transactions(io.StringIO(content), chunk_size=7))
+
+        self.assertEqual([entry.get("MEMO") or entry["NAME"] for entry in entries], ["Café & Cia", "Píx"])
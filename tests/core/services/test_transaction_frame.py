@@ -0,0 +1,95 @@
+import unittest
+from datetime import date
+from finance_app.core.services.transaction_frame import TransactionFrame
+from tests.factories import make_record
+
+
+class TestTransactionFrame(unittest.TestCase):
+    """
+    Testes unitários para a classe TransactionFrame.
+    Verifica a codificação colunar, filtros e agregações
+    """
+
+    def setUp(self):
+        self.records = [
+            make_record(valor=-1500.00, data_transacao=date(2025, 4, 5), categoria_n1="Moradia",
+                        categoria_n2="Aluguel"),
+            make_record(valor=-35.90, data_transacao=date(2025, 4, 10), categoria_n1="Alimentação",
+                        categoria_n2="Mercado", pago=True),
+            make_record(valor=10000.00, data_transacao=date(2025, 4, 1), categoria_n1="Renda", categoria_n2="Salário",
+                        conta="Nubank"),
+            make_record(valor=-1500.00, data_transacao=date(2025, 5, 5), categoria_n1="Moradia",
+                        categoria_n2="Aluguel"),
+            make_record(valor=-20.10, data_transacao=date(2025, 5, 12), categoria_n1="Alimentação",
+                        categoria_n2="Mercado"),
+        ]
+        self.frame = TransactionFrame.from_records(self.records)
+
+
+    def test_colunas(self):
+        """
+        Deve guardar valores em centavos, datas como ordinais e textos como códigos
+        """
+        self.assertEqual(len(self.frame), 5)
+        self.assertEqual(list(self.frame.columns["valor"]), [-150000, -3590, 1000000, -150000, -2010])
+        self.assertEqual(self.frame.columns["data_transacao"][0], date(2025, 4, 5).toordinal())
+        self.assertEqual(self.frame.dictionaries["categoria_n1"], ["Moradia", "Alimentação", "Renda"])
+        self.assertEqual(list(self.frame.columns["categoria_n1"]), [0, 1, 2, 0, 1])
+
+
+    def test_filter(self):
+        """
+        Deve filtrar por intervalo de datas e por igualdade em colunas codificadas
+        """
+        abril = self.frame.filter(start=date(2025, 4, 1), end=date(2025, 4, 30))
+        self.assertEqual(abril.ids, [r["id"] for r in self.records[:3]])
+
+        mercado = self.frame.filter(categoria_n2="Mercado")
+        self.assertEqual(mercado.total(), -5600)
+
+        self.assertEqual(len(self.frame.filter(categoria_n2="Mercado", pago=True)), 1)
+        self.assertEqual(len(self.frame.filter(conta="Inexistente")), 0)
+
+        with self.assertRaises(ValueError):
+            self.frame.filter(descricao="Teste")
+
+
+    def test_group_sum(self):
+        """
+        Deve somar os valores por mês e categoria
+        """
+        self.assertEqual(self.frame.monthly_totals(level=1), {
+            ("2025-04", "Moradia"): -150000,
+            ("2025-04", "Alimentação"): -3590,
+            ("2025-04", "Renda"): 1000000,
+            ("2025-05", "Moradia"): -150000,
+            ("2025-05", "Alimentação"): -2010,
+        })
+        self.assertEqual(self.frame.group_sum(("conta",)), {("Itaú",): -305600, ("Nubank",): 1000000})
+
+
+    def test_monthly_totals_caminho(self):
+        """
+        Subcategorias de mesmo nome em pais diferentes devem ter totais separados
+        """
+        frame = TransactionFrame.from_records([
+            make_record(valor=-100.00, categoria_n1="Casa", categoria_n2="Outros", categoria_n3="Diversos"),
+            make_record(valor=-50.00, categoria_n1="Carro", categoria_n2="Outros", categoria_n3="Diversos"),
+        ])
+
+        self.assertEqual(frame.monthly_totals(level=2), {
+            ("2025-04", "Casa", "Outros"): -10000,
+            ("2025-04", "Carro", "Outros"): -5000,
+        })
+        self.assertEqual(frame.monthly_totals(level=3), {
+            ("2025-04", "Casa", "Outros", "Diversos"): -10000,
+            ("2025-04", "Carro", "Outros", "Diversos"): -5000,
+        })
+
+
+    def test_cumsum(self):
+        """
+        Deve calcular a soma acumulada na ordem das datas
+        """
+        cumulative = self.frame.sorted_by("data_transacao").cumsum()
+        self.assertEqual(list(cumulative), [1000000, 850000, 846410, 696410, 694400])
@@ -0,0 +1,73 @@
+import os
+import unittest
+from datetime import date
+from finance_app.core.repositories.transaction_repository import TransactionRepository
+from finance_app.core.services.transaction_search import TransactionSearchIndex, tokenize
+from tests.factories import make_transaction
+
+
+class TestTransactionSearchIndex(unittest.TestCase):
+    """
+    Testes unitários para a classe TransactionSearchIndex.
+    Verifica a normalização, as buscas por prefixo/múltiplos termos e a atualização incremental
+    """
+
+    def setUp(self):
+        # Criar um arquivo temporário para testes
+        os.makedirs("tests/tmp", exist_ok=True)
+        self.filepath = "tests/tmp/transactions_search_test.json"
+        self.repo = TransactionRepository(filepath=self.filepath, cache=True)
+        self.t1 = make_transaction("Uber *Trip São Paulo")
+        self.t2 = make_transaction("Supermercado Pão de Açúcar")
+        self.t3 = make_transaction("Uber Eats - Padaria")
+        self.repo.add_many([self.t1, self.t2, self.t3])
+        self.index = TransactionSearchIndex(self.repo)
+
+
+    def tearDown(self):
+        # Deletar o arquivo temporário
+        self.index.close()
+        if os.path.exists(self.filepath):
+            os.remove(self.filepath)
+
+
+    def test_tokenize(self):
+        """
+        Deve remover acentos, pontuação e diferenças de maiúsculas
+        """
+        self.assertEqual(tokenize("Pão de Açúcar - SP"), ["pao", "de", "acucar", "sp"])
+
+
+    def test_busca(self):
+        """
+        Deve encontrar por termo, prefixo e vários termos (E lógico), na ordem do repositório
+        """
+        self.assertEqual(self.index.search("uber"), [self.t1, self.t3])
+        self.assertEqual(self.index.search("ACUCAR"), [self.t2])
+        self.assertEqual(self.index.search("super*"), [self.t2])
+        self.assertEqual(self.index.search("uber pa*"), [self.t1, self.t3])
+        self.assertEqual(self.index.search("uber eats"), [self.t3])
+        self.assertEqual(self.index.search("uber", limit=1), [self.t1])
+        self.assertEqual(self.index.search("super"), [])
+        self.assertEqual(self.index.search(""), [])
+
+
+    def test_incremental(self):
+        """
+        Deve refletir add, update e delete feitos pelo repositório
+        """
+        t4 = make_transaction("Uber Trip")
+        self.repo.add(t4)
+        self.t1.descricao = "99 Taxi"
+        self.repo.update(self.t1)
+        self.repo.delete(self.t3)
+
+        self.assertEqual(self.index.search("uber"), [t4])
+        self.assertEqual(self.index.search("taxi"), [self.t1])
+        self.assertEqual(self.index.search("eat*"), [])
+        self.assertEqual(len(self.index), 3)
+
+        # Atualização mantém a posição da transação, como no repositório
+        t4.descricao = "Taxi aeroporto"
+        self.repo.update(t4)
+        self.assertEqual(self.index.search("taxi"), [self.t1, t4])
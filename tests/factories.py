@@ -0,0 +1,31 @@
+import uuid
+from datetime import date
+from finance_app.core.models.transaction import Transaction
+
+
+def make_transaction(descricao="Mercado", valor=-100.00, data_transacao=date(2025, 4, 1), data_efetivacao=None,
+                     conta="Itaú", cartao="", categoria_n1="Estilo de Vida", categoria_n2="Alimentação",
+                     categoria_n3="Mercado", pago=False) -> Transaction:
+    """
+    Cria uma transação de teste com valores padrão (ID aleatório; efetivação igual à data da transação)
+    """
+    return Transaction(
+        id=uuid.uuid4(),
+        descricao=descricao,
+        valor=valor,
+        data_transacao=data_transacao,
+        data_efetivacao=data_efetivacao or data_transacao,
+        conta=conta,
+        cartao=cartao,
+        categoria_n1=categoria_n1,
+        categoria_n2=categoria_n2,
+        categoria_n3=categoria_n3,
+        pago=pago
+    )
+
+
+def make_record(**fields) -> dict:
+    """
+    Cria uma transação de teste no formato de dicionário (mesmos campos de make_transaction)
+    """
+    return make_transaction(**fields).to_dict()